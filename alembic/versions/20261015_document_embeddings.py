@@ -0,0 +1,37 @@
+"""Cached document embeddings table
+
+Revision ID: 003_document_embeddings
+Revises: 002_composite_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+Stores each document's title+content embedding with the content hash and
+model it was computed for, so find-similar does not re-embed unchanged
+documents. Rows are dropped together with their document.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_document_embeddings'
+down_revision: Union[str, None] = '002_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create document_embeddings table."""
+    op.create_table(
+        'document_embeddings',
+        sa.Column('document_id', sa.String(length=36), nullable=False),
+        sa.Column('content_sha256', sa.String(length=64), nullable=False),
+        sa.Column('model_name', sa.String(length=200), nullable=False),
+        sa.Column('embedding', sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint('document_id')
+    )
+
+
+def downgrade() -> None:
+    """Drop document_embeddings table."""
+    op.drop_table('document_embeddings')
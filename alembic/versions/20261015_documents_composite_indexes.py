@@ -0,0 +1,40 @@
+"""Composite indexes for listing documents
+
+Revision ID: 002_composite_indexes
+Revises: 001_initial
+Create Date: 2026-10-15 00:00:00.000000
+
+Replaces the single-column user_id and document_type indexes with
+(user_id, document_type, created_at) and (user_id, created_at), so
+filtered, newest-first document listing is an index range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_composite_indexes'
+down_revision: Union[str, None] = '001_initial'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite listing indexes and drop the single-column ones."""
+    op.create_index(
+        'ix_docs_user_type_created', 'documents',
+        ['user_id', 'document_type', 'created_at'], unique=False
+    )
+    op.create_index('ix_docs_user_created', 'documents', ['user_id', 'created_at'], unique=False)
+    op.drop_index(op.f('ix_documents_document_type'), table_name='documents')
+    op.drop_index(op.f('ix_documents_user_id'), table_name='documents')
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    op.create_index(op.f('ix_documents_user_id'), 'documents', ['user_id'], unique=False)
+    op.create_index(
+        op.f('ix_documents_document_type'), 'documents', ['document_type'], unique=False
+    )
+    op.drop_index('ix_docs_user_created', table_name='documents')
+    op.drop_index('ix_docs_user_type_created', table_name='documents')
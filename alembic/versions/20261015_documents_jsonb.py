@@ -0,0 +1,46 @@
+"""JSONB tags and metadata with a GIN index on tags
+
+Revision ID: 004_documents_jsonb
+Revises: 003_document_embeddings
+Create Date: 2026-10-15 00:00:00.000000
+
+PostgreSQL only: converts documents.tags and documents.doc_metadata from
+json to jsonb and adds a GIN index on tags. Other databases (SQLite) keep
+plain JSON and are left unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004_documents_jsonb'
+down_revision: Union[str, None] = '003_document_embeddings'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert JSON columns to JSONB and index tags (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column('documents', 'tags', type_=postgresql.JSONB(), postgresql_using='tags::jsonb')
+    op.alter_column(
+        'documents', 'doc_metadata',
+        type_=postgresql.JSONB(), postgresql_using='doc_metadata::jsonb'
+    )
+    op.create_index('ix_docs_tags_gin', 'documents', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Restore plain JSON columns (PostgreSQL only)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_docs_tags_gin', table_name='documents')
+    op.alter_column(
+        'documents', 'doc_metadata', type_=sa.JSON(), postgresql_using='doc_metadata::json'
+    )
+    op.alter_column('documents', 'tags', type_=sa.JSON(), postgresql_using='tags::json')
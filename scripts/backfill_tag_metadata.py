@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Backfill tag_<name> metadata keys onto vectors stored before tag filtering.
+
+Search filters tags on per-tag boolean metadata keys. Vectors written
+before those keys existed only carry the comma-joined "tags" string, so
+tag-filtered searches skip them until this has run once. It reads every
+document from the metadata database and patches its vector's metadata;
+no embeddings are regenerated. Safe to re-run.
+
+Usage:
+  PYTHONPATH=src python scripts/backfill_tag_metadata.py [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import logging
+
+from knowledge_service.config.settings import get_settings
+from knowledge_service.core.document_manager import DocumentManager
+from knowledge_service.infrastructure.database.client import DatabaseClient
+from knowledge_service.infrastructure.vectordb import get_vector_provider
+
+
+async def backfill(batch_size: int) -> int:
+    """Run the backfill against the configured database and vector store"""
+    settings = get_settings()
+    db_client = DatabaseClient(settings.database_url)
+    vector_client = get_vector_provider()
+    await vector_client.initialize()
+
+    try:
+        # Metadata-only updates never need the embedding model
+        manager = DocumentManager(db_client, vector_client, embedding_gen=None)
+        return await manager.backfill_tag_metadata(batch_size)
+    finally:
+        await db_client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Documents read from the database per page")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    updated = asyncio.run(backfill(args.batch_size))
+    print(f"Updated tag metadata on {updated} vectors")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,13 @@ class Settings(BaseSettings):
         env="EMBEDDING_MODEL"
     )
 
+    # Shared query-embedding cache (Redis); disabled when unset
+    embedding_cache_redis_url: Optional[str] = Field(
+        default=None,
+        env="EMBEDDING_CACHE_REDIS_URL"
+    )
+    embedding_cache_ttl_seconds: int = Field(default=86400, env="EMBEDDING_CACHE_TTL_SECONDS")
+
     # Search Configuration
     default_search_limit: int = Field(default=10, env="DEFAULT_SEARCH_LIMIT")
     max_search_limit: int = Field(default=50, env="MAX_SEARCH_LIMIT")
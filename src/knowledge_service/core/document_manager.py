@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from typing import Optional, List
 from ..infrastructure.database.client import DatabaseClient
 from ..infrastructure.database.models import DocumentModel
-from ..infrastructure.vectordb import VectorDBProvider
+from ..infrastructure.vectordb import VectorDBProvider, content_snippet, tag_metadata_key
 from ..infrastructure.vectordb.embeddings import EmbeddingGenerator
 from ..models.document import DocumentCreate, DocumentUpdate, Document
 
@@ -49,7 +49,7 @@ class DocumentManager:
         
         # Generate embedding from title + content
         combined_text = f"{doc_data.title}\n\n{doc_data.content}"
-        embedding = self.embeddings.generate_embedding(combined_text)
+        embedding = await self.embeddings.agenerate_embedding(combined_text)
         
         # Create database record
         db_doc = DocumentModel(
@@ -74,6 +74,8 @@ class DocumentManager:
             "title": doc_data.title,
             "document_type": doc_data.document_type,
             "tags": ",".join(doc_data.tags),
+            "snippet": content_snippet(doc_data.content),
+            **{tag_metadata_key(tag): True for tag in doc_data.tags},
         }
 
         await self.vector_db.upsert_vectors(
@@ -111,7 +113,7 @@ class DocumentManager:
         Returns:
             Document if found, None otherwise
         """
-        db_doc = await self.db.get_document(document_id, user_id)
+        db_doc = await self.db.get_document(document_id, user_id, load_content=True)
         if not db_doc:
             return None
         
@@ -145,6 +147,10 @@ class DocumentManager:
         current_doc = await self.db.get_document(document_id, user_id)
         if not current_doc:
             return None
+
+        # Inside a request session the update returns this same identity-mapped
+        # object with the new values, so keep the old tags separately
+        previous_tags = tuple(current_doc.tags)
         
         # Prepare updates
         update_dict = {}
@@ -164,10 +170,10 @@ class DocumentManager:
         if not updated_doc:
             return None
         
-        # If content or title changed, regenerate embedding
-        if updates.content is not None or updates.title is not None:
+        # Only a content change requires regenerating the embedding
+        if updates.content is not None:
             combined_text = f"{updated_doc.title}\n\n{updated_doc.content}"
-            embedding = self.embeddings.generate_embedding(combined_text)
+            embedding = await self.embeddings.agenerate_embedding(combined_text)
             
             vector_metadata = {
                 "document_id": document_id,
@@ -175,6 +181,8 @@ class DocumentManager:
                 "title": updated_doc.title,
                 "document_type": updated_doc.document_type,
                 "tags": ",".join(updated_doc.tags),
+                "snippet": content_snippet(updated_doc.content),
+                **{tag_metadata_key(tag): True for tag in updated_doc.tags},
             }
             
             await self.vector_db.upsert_vectors(
@@ -186,7 +194,28 @@ class DocumentManager:
                     "metadata": vector_metadata
                 }]
             )
-        
+        else:
+            # Metadata-only change: patch the vector store copy, no re-embedding
+            changed_metadata = {}
+            if updates.title is not None:
+                changed_metadata["title"] = updated_doc.title
+            if updates.document_type is not None:
+                changed_metadata["document_type"] = updated_doc.document_type
+            if updates.tags is not None:
+                changed_metadata["tags"] = ",".join(updated_doc.tags)
+                # Metadata updates merge keys, so dropped tags are cleared explicitly
+                for tag in set(previous_tags) - set(updated_doc.tags):
+                    changed_metadata[tag_metadata_key(tag)] = False
+                for tag in updated_doc.tags:
+                    changed_metadata[tag_metadata_key(tag)] = True
+
+            if changed_metadata:
+                await self.vector_db.update_metadata(
+                    collection_name="faultmaven_kb",
+                    vector_id=updated_doc.embedding_id,
+                    metadata=changed_metadata
+                )
+
         logger.info(f"Updated document {document_id}")
         
         return Document(
@@ -202,6 +231,38 @@ class DocumentManager:
             updated_at=updated_doc.updated_at
         )
 
+    async def backfill_tag_metadata(self, batch_size: int = 500) -> int:
+        """Write tag_<name> metadata keys onto every document's vector.
+
+        One-off migration for vectors stored before tag filtering, which
+        only carry the comma-joined "tags" string and so never match tag
+        filters. Re-running it is harmless.
+
+        Args:
+            batch_size: Documents read from the database per page
+
+        Returns:
+            Number of vectors updated
+        """
+        updated = 0
+        async for rows in self.db.iter_document_tags(batch_size):
+            for embedding_id, tags in rows:
+                if not tags:
+                    continue
+                try:
+                    await self.vector_db.update_metadata(
+                        collection_name="faultmaven_kb",
+                        vector_id=embedding_id,
+                        metadata={tag_metadata_key(tag): True for tag in tags}
+                    )
+                except Exception as e:
+                    logger.warning(f"Tag metadata backfill failed for vector {embedding_id}: {e}")
+                    continue
+                updated += 1
+
+        logger.info(f"Backfilled tag metadata on {updated} vectors")
+        return updated
+
     async def delete_document(self, document_id: str, user_id: str) -> bool:
         """Delete document.
         
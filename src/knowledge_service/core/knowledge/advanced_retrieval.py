@@ -13,38 +13,552 @@ Key Features:
 - Adaptive search strategies based on reasoning context
 """
 
+import asyncio
+import functools
+import inspect
 import logging
+import re
 import time
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import (
+    AsyncIterator, Callable, Dict, List, Any, Mapping, Optional, Sequence, Tuple, Union
+)
+from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 from faultmaven.models.interfaces import (
     IVectorStore, IMemoryService, ConversationContext
 )
 from faultmaven.models import SearchResult
 from faultmaven.exceptions import KnowledgeBaseException
+from faultmaven.infrastructure.model_cache import model_cache
+
+# Aho-Corasick multi-pattern matching with graceful fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# scikit-learn (installed with sentence-transformers) for vectorized
+# keyword counting, with graceful fallback to set intersection
+try:
+    from sklearn.feature_extraction.text import CountVectorizer
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# Numba JIT for small numeric kernels with graceful fallback to NumPy
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Query-characteristic keywords used to pick a fallback retrieval strategy,
+# in priority order (first strategy with a matching token wins)
+_STRATEGY_KEYWORDS: Tuple[Tuple[str, frozenset], ...] = (
+    ("diagnostic", frozenset({"error", "issue", "problem", "broken", "failing", "debug"})),
+    ("analytical", frozenset({"analyze", "understand", "explain", "why", "how", "pattern"})),
+    ("strategic", frozenset({"plan", "strategy", "approach", "implement", "migrate", "scale"})),
+    ("creative", frozenset({"alternative", "different", "innovative", "creative", "novel"})),
+)
+
+# Single alternation over every strategy keyword so a query is scanned once
+_STRATEGY_KEYWORD_RE = re.compile(
+    r"\b(?:" + "|".join(
+        sorted(set().union(*(kws for _, kws in _STRATEGY_KEYWORDS)), key=len, reverse=True)
+    ) + r")\b"
+)
+
+# Reasoning-type specific query enhancement terms
+_REASONING_ENHANCEMENTS: Dict[str, Tuple[str, ...]] = {
+    "diagnostic": ("troubleshooting", "error", "solution", "fix"),
+    "analytical": ("analysis", "patterns", "causes", "relationships"),
+    "strategic": ("planning", "approach", "strategy", "implementation"),
+    "creative": ("alternative", "innovative", "novel", "approaches"),
+}
+
+_URGENCY_TERMS: Tuple[str, ...] = ("urgent", "critical", "immediate", "priority")
+
+# Reasoning-type vocabulary for contextual relevance, matched as whole words
+_REASONING_KEYWORDS: Dict[str, frozenset] = {
+    "diagnostic": frozenset({"error", "problem", "solution", "fix", "troubleshoot"}),
+    "analytical": frozenset({"analysis", "pattern", "cause", "relationship"}),
+    "strategic": frozenset({"plan", "strategy", "approach", "implement"}),
+    "creative": frozenset({"alternative", "innovative", "creative", "novel"}),
+}
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Binary document-term counts over the reasoning vocabulary (same tokens as
+# _WORD_RE), plus each reasoning type's column indices into that vocabulary
+_REASONING_VECTORIZER = None
+_REASONING_TERM_INDICES: Dict[str, np.ndarray] = {}
+if SKLEARN_AVAILABLE:
+    _reasoning_vocabulary = sorted(set().union(*_REASONING_KEYWORDS.values()))
+    _REASONING_VECTORIZER = CountVectorizer(
+        vocabulary=_reasoning_vocabulary,
+        token_pattern=r"[a-z]+",
+        lowercase=False,
+        binary=True
+    )
+    _REASONING_TERM_INDICES = {
+        reasoning_type: np.array([_reasoning_vocabulary.index(term) for term in sorted(terms)])
+        for reasoning_type, terms in _REASONING_KEYWORDS.items()
+    }
+
+# Retrieval strategy configurations
+_STRATEGY_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "diagnostic": MappingProxyType({
+        "stages": ("symptom_matching", "error_pattern_search", "solution_lookup"),
+        "expansion_factor": 1.5,
+        "relevance_threshold": 0.6,
+        "max_documents": 15
+    }),
+    "analytical": MappingProxyType({
+        "stages": ("concept_exploration", "relationship_mapping", "deep_analysis"),
+        "expansion_factor": 2.0,
+        "relevance_threshold": 0.5,
+        "max_documents": 20
+    }),
+    "strategic": MappingProxyType({
+        "stages": ("system_overview", "impact_assessment", "planning_resources"),
+        "expansion_factor": 1.8,
+        "relevance_threshold": 0.55,
+        "max_documents": 25
+    }),
+    "creative": MappingProxyType({
+        "stages": ("alternative_approaches", "innovation_patterns", "novel_solutions"),
+        "expansion_factor": 2.5,
+        "relevance_threshold": 0.4,
+        "max_documents": 30
+    }),
+})
+
+# Simple synonym expansion (in production, would use more sophisticated NLP).
+# Only the top 2 synonyms of each word are used, so the tuples are pre-sliced.
+_EXPANSION_MAPPING: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    word: synonyms[:2]
+    for word, synonyms in {
+        "error": ("exception", "failure", "bug", "issue"),
+        "problem": ("issue", "trouble", "difficulty"),
+        "solution": ("fix", "resolution", "answer", "remedy"),
+        "configure": ("setup", "config", "configuration"),
+        "deploy": ("deployment", "install", "rollout"),
+        "performance": ("speed", "optimization", "efficiency"),
+        "security": ("authentication", "authorization", "access"),
+    }.items()
+})
+
+# Topic keyword mapping used for content-based topic extraction
+_TOPIC_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "database": ("database", "sql", "query", "table", "index"),
+    "networking": ("network", "connection", "tcp", "http", "dns"),
+    "authentication": ("auth", "login", "password", "token", "security"),
+    "performance": ("performance", "slow", "optimization", "memory", "cpu"),
+    "deployment": ("deploy", "install", "configuration", "setup"),
+    "monitoring": ("monitoring", "alerts", "logs", "metrics"),
+    "api": ("api", "endpoint", "rest", "response", "request"),
+    "storage": ("storage", "disk", "file", "volume", "backup"),
+}
+
+
+class _KeywordMatcher:
+    """Multi-pattern substring matcher over labelled keyword groups.
+
+    Scans text once with a pyahocorasick automaton when the library is
+    installed, otherwise falls back to one substring check per keyword.
+    Matching semantics are identical either way: a keyword counts once if
+    it occurs anywhere in the text.
+    """
+
+    def __init__(self, label_keywords: Dict[str, Tuple[str, ...]]):
+        self._labels = tuple(label_keywords)
+        self._keyword_labels: Dict[str, List[str]] = {}
+        for label, keywords in label_keywords.items():
+            for keyword in keywords:
+                self._keyword_labels.setdefault(keyword, []).append(label)
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._keyword_labels:
+            automaton = ahocorasick.Automaton()
+            for keyword in self._keyword_labels:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        """Labels in declaration order"""
+        return self._labels
+
+    def find_keywords(self, text: str) -> set:
+        """Return the set of keywords occurring in text"""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        return {keyword for keyword in self._keyword_labels if keyword in text}
+
+    def count_labels(self, text: str) -> Counter:
+        """Count distinct matched keywords per label"""
+        label_counts = Counter()
+        for keyword in self.find_keywords(text):
+            label_counts.update(self._keyword_labels[keyword])
+        return label_counts
+
+
+_TOPIC_MATCHER = _KeywordMatcher(_TOPIC_KEYWORDS)
+
+
+# Maximum length of an enhanced query (characters)
+_MAX_ENHANCED_QUERY_LENGTH = 500
+
+
+class _QueryBuilder:
+    """Space-joined query text capped at a maximum length.
+
+    Parts beyond the cap are dropped as they are appended, so oversized
+    context (e.g. long technology stacks) is never joined only to be
+    truncated. build() returns the same text as joining everything and
+    slicing to the cap, with "..." appended when truncated.
+    """
+
+    def __init__(self, max_length: int = _MAX_ENHANCED_QUERY_LENGTH):
+        self._parts: List[str] = []
+        self._remaining = max_length
+        self.truncated = False
+
+    def append(self, part: str) -> None:
+        if self.truncated:
+            return
+
+        separator = 1 if self._parts else 0
+        if len(part) + separator <= self._remaining:
+            self._parts.append(part)
+            self._remaining -= len(part) + separator
+            return
+
+        # Keep whatever fits (the separator counts towards the cap)
+        self.truncated = True
+        if self._remaining >= separator:
+            self._parts.append(part[:self._remaining - separator])
+
+    def extend(self, parts) -> None:
+        for part in parts:
+            self.append(part)
 
+    def build(self) -> str:
+        text = " ".join(self._parts)
+        return text + "..." if self.truncated else text
 
-@dataclass 
+
+def _normalize_embedding(embedding: Any) -> np.ndarray:
+    """Return embedding as an L2-normalized float32 vector"""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+# Scale for symmetric int8 quantization of unit-norm embeddings
+_INT8_SCALE = 127
+
+# Retrieval performance metrics: counters first, then running averages
+_METRIC_NAMES: Tuple[str, ...] = (
+    "retrievals_performed",
+    "query_enhancements",
+    "semantic_clusters_created",
+    "knowledge_gaps_identified",
+    "semantic_cache_hits",
+    "session_cluster_reuses",
+    "avg_retrieval_time",
+    "avg_relevance_score",
+)
+_METRIC_INDEX: Dict[str, int] = {name: index for index, name in enumerate(_METRIC_NAMES)}
+_AVERAGE_METRICS = slice(_METRIC_INDEX["avg_retrieval_time"], len(_METRIC_NAMES))
+
+# Initial results above the relevance threshold below which retrieval
+# falls back to a synonym-expanded search
+_MIN_RELEVANT_RESULTS = 5
+
+# Maximum number of cached contextual relevance scores
+_RELEVANCE_CACHE_SIZE = 4096
+
+
+def _quantize_embedding(embedding: Any) -> np.ndarray:
+    """Return embedding L2-normalized and quantized to int8"""
+    return np.round(_normalize_embedding(embedding) * _INT8_SCALE).astype(np.int8)
+
+
+def _int8_cosine(matrix: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Cosine similarities between int8-quantized rows and an int8 vector"""
+    return np.matmul(matrix, vector, dtype=np.int32) / (_INT8_SCALE * _INT8_SCALE)
+
+
+# Small numeric kernels on the per-retrieval path (N <= ~30 documents), where
+# NumPy's per-call dispatch overhead dominates. JIT-compiled loops when Numba
+# is installed and compiles, equivalent NumPy expressions otherwise.
+def _score_clusters_numpy(topic_ids, scores, n_topics):
+    """Cluster sizes and scores (average relevance + size bonus up to 0.3)"""
+    sizes = np.bincount(topic_ids, minlength=n_topics)
+    cluster_scores = (
+        np.bincount(topic_ids, weights=scores, minlength=n_topics) / sizes
+        + np.minimum(sizes * 0.1, 0.3)
+    )
+    return sizes, cluster_scores
+
+
+def _mean_clipped_int8_cosine_numpy(matrix, vector):
+    """Mean over rows of int8 cosine similarity clipped to [0, 1]"""
+    return float(np.clip(_int8_cosine(matrix, vector), 0.0, 1.0).mean())
+
+
+_NUMBA_KERNELS_READY = False
+
+if NUMBA_AVAILABLE:
+    # Compile at import (loaded from the on-disk cache after the first run);
+    # a stale or unusable cache keeps the NumPy kernels
+    try:
+        @njit(fastmath=True, cache=True)
+        def _score_clusters_jit(topic_ids, scores, n_topics):
+            """Cluster sizes and scores (average relevance + size bonus up to 0.3)"""
+            sizes = np.zeros(n_topics, dtype=np.int64)
+            totals = np.zeros(n_topics, dtype=np.float64)
+            for i in range(topic_ids.shape[0]):
+                sizes[topic_ids[i]] += 1
+                totals[topic_ids[i]] += scores[i]
+            cluster_scores = np.empty(n_topics, dtype=np.float64)
+            for t in range(n_topics):
+                cluster_scores[t] = totals[t] / sizes[t] + min(sizes[t] * 0.1, 0.3)
+            return sizes, cluster_scores
+
+        @njit(fastmath=True, cache=True)
+        def _mean_clipped_int8_cosine_jit(matrix, vector):
+            """Mean over rows of int8 cosine similarity clipped to [0, 1]"""
+            scale = 1.0 / (127 * 127)
+            total = 0.0
+            for i in range(matrix.shape[0]):
+                dot = 0
+                for j in range(matrix.shape[1]):
+                    dot += np.int32(matrix[i, j]) * np.int32(vector[j])
+                total += min(max(dot * scale, 0.0), 1.0)
+            return total / matrix.shape[0]
+
+        _score_clusters_jit(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.float64), 1)
+        _mean_clipped_int8_cosine_jit(np.zeros((1, 1), dtype=np.int8), np.zeros(1, dtype=np.int8))
+        _NUMBA_KERNELS_READY = True
+    except Exception as e:
+        logging.getLogger(__name__).warning(
+            "Numba kernel compilation failed, using NumPy kernels: %s", e
+        )
+
+if _NUMBA_KERNELS_READY:
+    _score_clusters = _score_clusters_jit
+    _mean_clipped_int8_cosine = _mean_clipped_int8_cosine_jit
+else:
+    _score_clusters = _score_clusters_numpy
+    _mean_clipped_int8_cosine = _mean_clipped_int8_cosine_numpy
+
+
+def _content_lower(doc: Dict[str, Any]) -> str:
+    """Lowercased document content, precomputed during retrieval when available"""
+    content_lower = doc.get("_content_lower")
+    if content_lower is None:
+        content_lower = doc.get("content", "").lower()
+    return content_lower
+
+
+def _content_tokens(doc: Dict[str, Any]) -> frozenset:
+    """Distinct lowercase word tokens of the content, precomputed during retrieval when available"""
+    content_tokens = doc.get("_content_tokens")
+    if content_tokens is None:
+        content_tokens = frozenset(_WORD_RE.findall(_content_lower(doc)))
+    return content_tokens
+
+
+def _public_document(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a document without the internal fields added during retrieval"""
+    return {key: value for key, value in doc.items() if not key.startswith("_")}
+
+
+class _SearchBatcher:
+    """Coalesces concurrent vector store searches into batched calls.
+
+    Queries arriving within a short window are collected and dispatched
+    together: through ``vector_store.batch_search(queries, k=...)`` when the
+    store provides it, otherwise as concurrent single searches. Each caller
+    awaits its own future and receives exactly the results of its query.
+
+    An ``ef_search`` hint (HNSW search breadth) is forwarded only when the
+    store's search method accepts it. With ``include_embeddings`` set,
+    ``include_embeddings=True`` is forwarded on the same condition, asking
+    the store to return each result's stored vector under "embedding".
+    """
+
+    def __init__(
+        self,
+        vector_store: IVectorStore,
+        window_seconds: float = 0.005,
+        max_batch_size: int = 32,
+        include_embeddings: bool = False
+    ):
+        self._vector_store = vector_store
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        search_parameters = inspect.signature(vector_store.search).parameters
+        self._supports_ef_search = "ef_search" in search_parameters
+        self._include_embeddings = include_embeddings and "include_embeddings" in search_parameters
+
+    async def search(
+        self,
+        query: str,
+        k: int,
+        ef_search: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Queue a search and wait for its results"""
+        if not self._supports_ef_search:
+            ef_search = None
+
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, k, ef_search, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Stop the background dispatch task and cancel searches still queued"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._queue is not None and not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self._window_seconds
+
+                while len(batch) < self._max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._dispatch(batch)
+            except asyncio.CancelledError:
+                # Stopped mid-batch: release the callers already dequeued
+                for *_, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+    async def _dispatch(
+        self,
+        batch: List[Tuple[str, int, Optional[int], asyncio.Future]]
+    ) -> None:
+        # Queries can only share a call when they ask for the same k and ef
+        groups: Dict[Tuple[int, Optional[int]], List[Tuple[str, asyncio.Future]]] = {}
+        for query, k, ef_search, future in batch:
+            groups.setdefault((k, ef_search), []).append((query, future))
+
+        for (k, ef_search), items in groups.items():
+            queries = [query for query, _ in items]
+            search_kwargs = {"k": k}
+            if ef_search is not None:
+                search_kwargs["ef_search"] = ef_search
+            if self._include_embeddings:
+                search_kwargs["include_embeddings"] = True
+            try:
+                if hasattr(self._vector_store, "batch_search"):
+                    results = await self._vector_store.batch_search(queries, **search_kwargs)
+                else:
+                    results = await asyncio.gather(
+                        *(self._vector_store.search(query, **search_kwargs) for query in queries)
+                    )
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), query_results in zip(items, results):
+                if not future.done():
+                    future.set_result(query_results)
+
+            # A short batch response must not leave the remaining callers waiting
+            for _, future in items[len(results):]:
+                if not future.done():
+                    future.set_exception(KnowledgeBaseException(
+                        f"Batch search returned {len(results)} result lists "
+                        f"for {len(items)} queries"
+                    ))
+
+
+@dataclass(frozen=True)
 class RetrievalContext:
-    """Context for knowledge retrieval operations"""
+    """Context for knowledge retrieval operations
+
+    Immutable once built: fields cannot be reassigned and the collections
+    are stored as read-only copies, so the relevance fingerprint is
+    computed once and reused. Build a new context to change it.
+    """
     session_id: str
     query: str
     user_profile: Optional[Dict[str, Any]] = None
     reasoning_type: str = "diagnostic"
-    memory_insights: List[Dict[str, Any]] = None
-    domain_context: Dict[str, Any] = None
+    memory_insights: Sequence[Dict[str, Any]] = None
+    domain_context: Mapping[str, Any] = None
     urgency_level: str = "medium"
-    technical_constraints: List[str] = None
-    
+    technical_constraints: Sequence[str] = None
+    _relevance_fingerprint: Optional[Tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
-        if self.memory_insights is None:
-            self.memory_insights = []
-        if self.domain_context is None:
-            self.domain_context = {}
-        if self.technical_constraints is None:
-            self.technical_constraints = []
+        object.__setattr__(self, "memory_insights", tuple(self.memory_insights or ()))
+        object.__setattr__(
+            self, "domain_context", MappingProxyType(dict(self.domain_context or {}))
+        )
+        object.__setattr__(
+            self, "technical_constraints", tuple(self.technical_constraints or ())
+        )
+
+    def relevance_fingerprint(self) -> Tuple:
+        """Hashable key of the fields that affect contextual relevance
+
+        Computed on first use and memoized.
+        """
+        if self._relevance_fingerprint is None:
+            memory_keywords = tuple(
+                keyword
+                for insight in self.memory_insights
+                for keyword in insight.get("keywords", [])
+            )
+            # Domain values may be lists, so the domain context is keyed by its repr
+            domain_key = repr(sorted(self.domain_context.items()))
+            object.__setattr__(
+                self, "_relevance_fingerprint", (self.reasoning_type, domain_key, memory_keywords)
+            )
+        return self._relevance_fingerprint
 
 
 @dataclass
@@ -58,6 +572,202 @@ class RetrievalResult:
     search_expansion_paths: List[str]
     contextual_relevance: float
     knowledge_gaps: List[str]
+
+
+@dataclass
+class RetrievalDocuments:
+    """Streamed event: formatted documents from the initial search"""
+    documents: List[Dict[str, Any]]
+    enhanced_query: str
+    retrieval_strategy: str
+    reasoning_insights: List[str]
+
+
+@dataclass
+class ClusterUpdate:
+    """Streamed event: documents reordered by semantic cluster"""
+    documents: List[Dict[str, Any]]
+
+
+@dataclass
+class GapUpdate:
+    """Streamed event: identified knowledge gaps and expansion paths"""
+    knowledge_gaps: List[str]
+    search_expansion_paths: List[str]
+
+
+RetrievalEvent = Union[RetrievalDocuments, ClusterUpdate, GapUpdate, RetrievalResult]
+
+
+class _SemanticResultCache:
+    """Near-duplicate query cache for retrieval results.
+
+    Entries are keyed on the L2-normalized, int8-quantized embedding of the
+    enhanced query and scoped (e.g. per session and reasoning type). Lookup
+    is a flat inner-product scan over a preallocated NumPy matrix; a hit requires
+    cosine similarity >= threshold, a matching scope and an unexpired
+    entry. The least recently used entry is evicted when full, together
+    with its scope once no other entry uses it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: float = 300.0
+    ):
+        self._max_size = max_size
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+
+        self._vectors: Optional[np.ndarray] = None  # Allocated on first insert
+        self._scope_ids = np.full(max_size, -1, dtype=np.int64)
+        self._stored_at = np.zeros(max_size, dtype=np.float64)
+        self._last_used = np.zeros(max_size, dtype=np.float64)
+        self._results: List[Optional[RetrievalResult]] = [None] * max_size
+        self._scopes: Dict[Tuple[str, ...], int] = {}
+        self._scope_keys: Dict[int, Tuple[str, ...]] = {}
+        self._next_scope_id = 0
+        self._size = 0
+
+    def get(self, scope: Tuple[str, ...], embedding: List[float]) -> Optional[RetrievalResult]:
+        """Return the cached result for a near-duplicate query, if any"""
+        scope_id = self._scopes.get(scope)
+        if scope_id is None or self._vectors is None:
+            return None
+
+        now = time.monotonic()
+        similarities = _int8_cosine(self._vectors[:self._size], _quantize_embedding(embedding))
+        eligible = (
+            (self._scope_ids[:self._size] == scope_id)
+            & (now - self._stored_at[:self._size] < self._ttl_seconds)
+        )
+        similarities = np.where(eligible, similarities, -np.inf)
+
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._similarity_threshold:
+            return None
+
+        self._last_used[best] = now
+        return self._results[best]
+
+    def put(
+        self,
+        scope: Tuple[str, ...],
+        embedding: List[float],
+        result: RetrievalResult
+    ) -> None:
+        """Store a result, evicting the least recently used entry when full"""
+        vector = _quantize_embedding(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self._max_size, vector.shape[0]), dtype=np.int8)
+
+        scope_id = self._scopes.get(scope)
+        if scope_id is None:
+            scope_id = self._next_scope_id
+            self._next_scope_id += 1
+            self._scopes[scope] = scope_id
+            self._scope_keys[scope_id] = scope
+
+        if self._size < self._max_size:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+            self._release_scope(slot, scope_id)
+
+        now = time.monotonic()
+        self._vectors[slot] = vector
+        self._scope_ids[slot] = scope_id
+        self._stored_at[slot] = now
+        self._last_used[slot] = now
+        self._results[slot] = result
+
+    def _release_scope(self, slot: int, new_scope_id: int) -> None:
+        """Forget the scope of an evicted slot if no other entry uses it"""
+        old_scope_id = int(self._scope_ids[slot])
+        if old_scope_id == new_scope_id:
+            return
+        if np.count_nonzero(self._scope_ids[:self._size] == old_scope_id) == 1:
+            del self._scopes[self._scope_keys.pop(old_scope_id)]
+
+
+# One session's cached clusters: (stored_at, topics, centroid matrix,
+# documents per topic)
+_SessionClusters = Tuple[float, List[str], np.ndarray, List[List[Dict[str, Any]]]]
+
+
+class _SessionClusterCache:
+    """Per-session cache of the document clusters from the last retrieval.
+
+    Each cluster keeps its documents and an int8-quantized centroid of
+    their embeddings. Follow-up queries in the same session whose embedding
+    is close to a centroid can reuse that cluster instead of running the
+    full multi-stage retrieval. Sessions are evicted LRU and expire after
+    a TTL.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        similarity_threshold: float = 0.7,
+        ttl_seconds: float = 600.0
+    ):
+        self._max_sessions = max_sessions
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        # session_id -> cached clusters
+        self._sessions: "OrderedDict[str, _SessionClusters]" = OrderedDict()
+
+    def get(
+        self,
+        session_id: str,
+        query_embedding: List[float]
+    ) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """Return (topic, documents) of the closest cached cluster, if close enough"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        stored_at, topics, centroids, topic_documents = entry
+        if time.monotonic() - stored_at >= self._ttl_seconds:
+            del self._sessions[session_id]
+            return None
+
+        similarities = _int8_cosine(centroids, _quantize_embedding(query_embedding))
+        best = int(np.argmax(similarities))
+        if similarities[best] <= self._similarity_threshold:
+            return None
+
+        self._sessions.move_to_end(session_id)
+        return topics[best], topic_documents[best]
+
+    def put(self, session_id: str, documents: List[Dict[str, Any]]) -> None:
+        """Cache the clusters of a clustered document list"""
+        clusters: Dict[str, List[Dict[str, Any]]] = {}
+        for doc in documents:
+            if doc.get("_embedding") is None:
+                return  # Centroids need every document embedding
+            topic = doc.get("metadata", {}).get("cluster_topic", "general")
+            clusters.setdefault(topic, []).append(doc)
+
+        if not clusters:
+            return
+
+        topics = list(clusters)
+        centroids = np.vstack([
+            _quantize_embedding(
+                np.mean([doc["_embedding"] for doc in clusters[topic]], axis=0, dtype=np.float32)
+            )
+            for topic in topics
+        ])
+
+        self._sessions[session_id] = (
+            time.monotonic(), topics, centroids, [clusters[topic] for topic in topics]
+        )
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
     
     
 class AdvancedKnowledgeRetrieval:
@@ -85,55 +795,78 @@ class AdvancedKnowledgeRetrieval:
     def __init__(
         self,
         vector_store: Optional[IVectorStore] = None,
-        memory_service: Optional[IMemoryService] = None
+        memory_service: Optional[IMemoryService] = None,
+        query_embedder: Optional[Callable[[str], List[float]]] = None
     ):
         """Initialize Advanced Knowledge Retrieval system
         
         Args:
             vector_store: Optional vector store for semantic search
             memory_service: Optional memory service for context enhancement
+            query_embedder: Optional text embedding function (same model as
+                the vector store); enables the semantic cache of results for
+                near-duplicate queries, session cluster reuse and
+                embedding-based context relevance. Defaults to the cached
+                BGE-M3 model (the model knowledge ingestion embeds chunks
+                with) when a vector store is given
         """
         self._vector_store = vector_store
         self._memory = memory_service
         self._logger = logging.getLogger(__name__)
         
-        # Retrieval strategy configurations
-        self._strategy_configs = {
-            "diagnostic": {
-                "stages": ["symptom_matching", "error_pattern_search", "solution_lookup"],
-                "expansion_factor": 1.5,
-                "relevance_threshold": 0.6,
-                "max_documents": 15
-            },
-            "analytical": {
-                "stages": ["concept_exploration", "relationship_mapping", "deep_analysis"],
-                "expansion_factor": 2.0,
-                "relevance_threshold": 0.5,
-                "max_documents": 20
-            },
-            "strategic": {
-                "stages": ["system_overview", "impact_assessment", "planning_resources"],
-                "expansion_factor": 1.8,
-                "relevance_threshold": 0.55,
-                "max_documents": 25
-            },
-            "creative": {
-                "stages": ["alternative_approaches", "innovation_patterns", "novel_solutions"],
-                "expansion_factor": 2.5,
-                "relevance_threshold": 0.4,
-                "max_documents": 30
-            }
-        }
+        if query_embedder is None and vector_store is not None:
+            query_embedder = self._default_query_embedder()
+
+        # Coalesces searches from concurrent retrievals into batched calls;
+        # document embeddings are requested whenever queries are embedded
+        self._search_batcher = _SearchBatcher(
+            vector_store, include_embeddings=query_embedder is not None
+        ) if vector_store else None
+
+        # Semantic cache of results for near-duplicate enhanced queries
+        self._query_embedder = query_embedder
+        self._result_cache = _SemanticResultCache() if query_embedder else None
+
+        # Contextual relevance per (context fingerprint, document ID set), LRU
+        self._relevance_cache: "OrderedDict[Tuple, float]" = OrderedDict()
+
+        # Last retrieval's clusters per session, for follow-up query reuse
+        self._session_clusters = _SessionClusterCache() if query_embedder else None
         
-        # Performance metrics
-        self._metrics = {
-            "retrievals_performed": 0,
-            "query_enhancements": 0,
-            "semantic_clusters_created": 0,
-            "knowledge_gaps_identified": 0,
-            "avg_retrieval_time": 0.0,
-            "avg_relevance_score": 0.0
+        # Retrieval strategy configurations (shared, read-only)
+        self._strategy_configs = _STRATEGY_CONFIGS
+
+        # Retrieval handlers specialized per strategy, so per-request dispatch
+        # is a single dict lookup instead of repeated config lookups
+        self._retrieval_handlers = {
+            strategy: functools.partial(
+                self._retrieve_with_config,
+                max_docs=config["max_documents"],
+                threshold=config["relevance_threshold"]
+            )
+            for strategy, config in self._strategy_configs.items()
         }
+
+        # Performance metrics, indexed by _METRIC_INDEX
+        self._metrics = np.zeros(len(_METRIC_NAMES), dtype=np.float64)
+
+        # Metrics snapshot for health checks, rebuilt only after the metrics
+        # version changes (every metrics update bumps it)
+        self._metrics_version = 0
+        self._metrics_snapshot: Optional[Tuple[int, Mapping[str, Any]]] = None
+
+    def _default_query_embedder(self) -> Optional[Callable[[str], List[float]]]:
+        """Query embedder on the cached BGE-M3 model, or None when it is unavailable"""
+        try:
+            model = model_cache.get_bge_m3_model()
+        except Exception as e:
+            self._logger.warning("BGE-M3 model unavailable, query embeddings disabled: %s", e)
+            return None
+        if model is None:
+            return None
+        return functools.partial(
+            model.encode, normalize_embeddings=True, show_progress_bar=False
+        )
     
     async def retrieve_with_reasoning_context(
         self,
@@ -143,6 +876,7 @@ class AdvancedKnowledgeRetrieval:
         
         This method provides the main interface for advanced knowledge retrieval,
         integrating memory insights, reasoning context, and adaptive strategies.
+        It collects stream_retrieve() into its final result.
         
         Args:
             context: Retrieval context with query, memory, and reasoning information
@@ -153,40 +887,131 @@ class AdvancedKnowledgeRetrieval:
         Raises:
             KnowledgeBaseException: When retrieval fails
         """
+        result = None
+        async for event in self.stream_retrieve(context):
+            result = event
+        return result
+
+    async def stream_retrieve(
+        self,
+        context: RetrievalContext
+    ) -> AsyncIterator[RetrievalEvent]:
+        """Stream knowledge retrieval as it progresses
+
+        Yields the formatted documents as soon as the initial search returns,
+        so consumers can start on them while clustering and gap analysis run.
+
+        Args:
+            context: Retrieval context with query, memory, and reasoning information
+
+        Yields:
+            RetrievalDocuments first, then ClusterUpdate and GapUpdate when a
+            full retrieval runs, and finally the complete RetrievalResult
+
+        Raises:
+            KnowledgeBaseException: When retrieval fails
+        """
+        gap_task = None
         try:
             retrieval_start = time.time()
             
-            self._logger.info(f"Starting advanced retrieval for query: {context.query[:100]}...")
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "Starting advanced retrieval for query: %s...", context.query[:100]
+                )
             
             # Stage 1: Enhance query with memory and reasoning context
             enhanced_query, enhancement_insights = await self._enhance_query_with_context(context)
             
+            # Serve near-duplicate queries from the semantic result cache
+            cache_scope = (context.session_id, context.reasoning_type)
+            query_embedding = None
+            if self._query_embedder is not None:
+                try:
+                    query_embedding = await asyncio.to_thread(self._query_embedder, enhanced_query)
+                except Exception as e:
+                    self._logger.warning("Query embedding failed, skipping semantic caches: %s", e)
+            if query_embedding is not None:
+                cached_result = self._result_cache.get(cache_scope, query_embedding)
+                if cached_result is not None:
+                    self._increment_metric("semantic_cache_hits")
+                    self._logger.info("Advanced retrieval served from semantic cache")
+                    yield RetrievalDocuments(
+                        documents=cached_result.documents,
+                        enhanced_query=cached_result.enhanced_query,
+                        retrieval_strategy=cached_result.retrieval_strategy,
+                        reasoning_insights=cached_result.reasoning_insights
+                    )
+                    yield cached_result
+                    return
+
             # Stage 2: Determine optimal retrieval strategy
             strategy = self._determine_retrieval_strategy(context)
             
+            # Follow-up queries close to a cluster from this session's previous
+            # retrieval reuse it, plus a small supplementary search
+            if query_embedding is not None:
+                session_cluster = self._session_clusters.get(context.session_id, query_embedding)
+                if session_cluster is not None:
+                    result = await self._reuse_session_cluster(
+                        session_cluster, enhanced_query, enhancement_insights,
+                        context, strategy, retrieval_start
+                    )
+                    yield RetrievalDocuments(
+                        documents=result.documents,
+                        enhanced_query=enhanced_query,
+                        retrieval_strategy=strategy,
+                        reasoning_insights=result.reasoning_insights
+                    )
+                    yield result
+                    return
+
             # Stage 3: Execute multi-stage retrieval
             documents = await self._execute_multi_stage_retrieval(
                 enhanced_query, context, strategy
             )
             
+            # Lowercase and tokenize content once for the topic, gap and relevance passes
+            for doc in documents:
+                content_lower = doc.get("content", "").lower()
+                doc["_content_lower"] = content_lower
+                doc["_content_tokens"] = frozenset(_WORD_RE.findall(content_lower))
+
+            # Gap analysis only looks at document content and domain metadata,
+            # so it runs alongside clustering while the caller consumes results
+            gap_task = asyncio.create_task(self._identify_knowledge_gaps(documents, context))
+
+            yield RetrievalDocuments(
+                documents=[_public_document(doc) for doc in documents],
+                enhanced_query=enhanced_query,
+                retrieval_strategy=strategy,
+                reasoning_insights=enhancement_insights
+            )
+
             # Stage 4: Apply semantic clustering and relevance scoring
             clustered_documents = await self._apply_semantic_clustering(
                 documents, enhanced_query, context
             )
+            yield ClusterUpdate(
+                documents=[_public_document(doc) for doc in clustered_documents]
+            )
             
             # Stage 5: Identify knowledge gaps and expansion opportunities
-            knowledge_gaps, expansion_paths = await self._identify_knowledge_gaps(
-                clustered_documents, context
+            knowledge_gaps, expansion_paths = await gap_task
+            yield GapUpdate(
+                knowledge_gaps=knowledge_gaps,
+                search_expansion_paths=expansion_paths
             )
             
             # Stage 6: Calculate final confidence and relevance scores
-            confidence_score, contextual_relevance = self._calculate_retrieval_confidence(
+            confidence_score, contextual_relevance = await self._calculate_retrieval_confidence(
                 clustered_documents, context, strategy
             )
             
-            # Create result
+            # Create result; internal fields (e.g. embeddings) stay on the
+            # documents kept for session cluster reuse
             result = RetrievalResult(
-                documents=clustered_documents,
+                documents=[_public_document(doc) for doc in clustered_documents],
                 enhanced_query=enhanced_query,
                 retrieval_strategy=strategy,
                 confidence_score=confidence_score,
@@ -196,20 +1021,78 @@ class AdvancedKnowledgeRetrieval:
                 knowledge_gaps=knowledge_gaps
             )
             
+            if query_embedding is not None:
+                self._result_cache.put(cache_scope, query_embedding, result)
+                self._session_clusters.put(context.session_id, clustered_documents)
+
             # Update metrics
             retrieval_time = (time.time() - retrieval_start) * 1000
             self._update_metrics(retrieval_time, confidence_score)
             
             self._logger.info(
-                f"Advanced retrieval completed in {retrieval_time:.2f}ms "
-                f"with confidence {confidence_score:.3f}"
+                "Advanced retrieval completed in %.2fms with confidence %.3f",
+                retrieval_time, confidence_score
             )
             
-            return result
+            yield result
             
         except Exception as e:
-            self._logger.error(f"Advanced knowledge retrieval failed: {e}")
+            self._logger.error("Advanced knowledge retrieval failed: %s", e)
             raise KnowledgeBaseException(f"Retrieval failed: {str(e)}")
+        finally:
+            # Consumer stopped early or retrieval failed
+            if gap_task is not None and not gap_task.done():
+                gap_task.cancel()
+
+    async def _reuse_session_cluster(
+        self,
+        session_cluster: Tuple[str, List[Dict[str, Any]]],
+        enhanced_query: str,
+        enhancement_insights: List[str],
+        context: RetrievalContext,
+        strategy: str,
+        retrieval_start: float
+    ) -> RetrievalResult:
+        """Build a result from a cached session cluster plus a k=3 delta search"""
+        topic, cluster_documents = session_cluster
+
+        documents = list(cluster_documents)
+        if self._vector_store:
+            strategy_config = self._strategy_configs.get(
+                strategy, self._strategy_configs["diagnostic"]
+            )
+            supplementary = await self._retrieve_with_config(
+                enhanced_query, max_docs=3, threshold=strategy_config["relevance_threshold"]
+            )
+            known_ids = {doc.get("document_id") for doc in documents}
+            documents.extend(
+                doc for doc in supplementary if doc.get("document_id") not in known_ids
+            )
+
+        confidence_score, contextual_relevance = await self._calculate_retrieval_confidence(
+            documents, context, strategy
+        )
+
+        result = RetrievalResult(
+            documents=[_public_document(doc) for doc in documents],
+            enhanced_query=enhanced_query,
+            retrieval_strategy=strategy,
+            confidence_score=confidence_score,
+            reasoning_insights=enhancement_insights + [f"Reused session cluster: {topic}"],
+            search_expansion_paths=[],
+            contextual_relevance=contextual_relevance,
+            knowledge_gaps=[]
+        )
+
+        self._increment_metric("session_cluster_reuses")
+        retrieval_time = (time.time() - retrieval_start) * 1000
+        self._update_metrics(retrieval_time, confidence_score)
+
+        self._logger.info(
+            "Advanced retrieval reused session cluster '%s' in %.2fms", topic, retrieval_time
+        )
+
+        return result
     
     async def _enhance_query_with_context(
         self, 
@@ -217,7 +1100,8 @@ class AdvancedKnowledgeRetrieval:
     ) -> Tuple[str, List[str]]:
         """Enhance query using memory insights and reasoning context"""
         enhancement_insights = []
-        query_parts = [context.query]
+        query_parts = _QueryBuilder()
+        query_parts.append(context.query)
         
         # Add memory-based enhancements
         if self._memory and context.memory_insights:
@@ -229,11 +1113,7 @@ class AdvancedKnowledgeRetrieval:
             
             if memory_keywords:
                 # Use most frequent keywords from memory
-                keyword_freq = {}
-                for kw in memory_keywords:
-                    keyword_freq[kw] = keyword_freq.get(kw, 0) + 1
-                
-                top_keywords = sorted(keyword_freq.items(), key=lambda x: x[1], reverse=True)[:3]
+                top_keywords = Counter(memory_keywords).most_common(3)
                 for keyword, freq in top_keywords:
                     query_parts.append(keyword)
                     enhancement_insights.append(f"Added memory keyword: {keyword} (frequency: {freq})")
@@ -265,32 +1145,22 @@ class AdvancedKnowledgeRetrieval:
                 enhancement_insights.append(f"Added domain terms: {', '.join(domain_terms)}")
         
         # Add reasoning-type specific enhancements
-        reasoning_enhancements = {
-            "diagnostic": ["troubleshooting", "error", "solution", "fix"],
-            "analytical": ["analysis", "patterns", "causes", "relationships"],
-            "strategic": ["planning", "approach", "strategy", "implementation"],
-            "creative": ["alternative", "innovative", "novel", "approaches"]
-        }
-        
-        reasoning_terms = reasoning_enhancements.get(context.reasoning_type, [])
+        reasoning_terms = _REASONING_ENHANCEMENTS.get(context.reasoning_type, ())
         if reasoning_terms:
             query_parts.extend(reasoning_terms[:2])  # Add top 2 reasoning terms
             enhancement_insights.append(f"Added reasoning terms for {context.reasoning_type}")
         
         # Add urgency-based enhancements
-        if context.urgency_level in ["high", "critical"]:
-            urgency_terms = ["urgent", "critical", "immediate", "priority"]
-            query_parts.extend(urgency_terms[:2])
+        if context.urgency_level in ("high", "critical"):
+            query_parts.extend(_URGENCY_TERMS[:2])
             enhancement_insights.append("Added urgency-related terms")
         
-        enhanced_query = " ".join(query_parts)
-        
-        # Avoid excessive query length
-        if len(enhanced_query) > 500:
-            enhanced_query = enhanced_query[:500] + "..."
+        # Query length is capped while parts are appended
+        enhanced_query = query_parts.build()
+        if query_parts.truncated:
             enhancement_insights.append("Truncated query to prevent excessive length")
         
-        self._metrics["query_enhancements"] += 1
+        self._increment_metric("query_enhancements")
         
         return enhanced_query, enhancement_insights
     
@@ -301,28 +1171,13 @@ class AdvancedKnowledgeRetrieval:
         if context.reasoning_type in self._strategy_configs:
             return context.reasoning_type
         
-        # Fallback logic based on query characteristics
-        query_lower = context.query.lower()
-        
-        # Check for diagnostic indicators
-        diagnostic_keywords = ["error", "issue", "problem", "broken", "failing", "debug"]
-        if any(keyword in query_lower for keyword in diagnostic_keywords):
-            return "diagnostic"
-        
-        # Check for analytical indicators
-        analytical_keywords = ["analyze", "understand", "explain", "why", "how", "pattern"]
-        if any(keyword in query_lower for keyword in analytical_keywords):
-            return "analytical"
-        
-        # Check for strategic indicators
-        strategic_keywords = ["plan", "strategy", "approach", "implement", "migrate", "scale"]
-        if any(keyword in query_lower for keyword in strategic_keywords):
-            return "strategic"
-        
-        # Check for creative indicators
-        creative_keywords = ["alternative", "different", "innovative", "creative", "novel"]
-        if any(keyword in query_lower for keyword in creative_keywords):
-            return "creative"
+        # Fallback logic based on query characteristics: tokenize once, then
+        # check each strategy's keyword set in priority order
+        query_tokens = set(_STRATEGY_KEYWORD_RE.findall(context.query.lower()))
+        if query_tokens:
+            for strategy, keywords in _STRATEGY_KEYWORDS:
+                if keywords & query_tokens:
+                    return strategy
         
         # Default to diagnostic for troubleshooting scenarios
         return "diagnostic"
@@ -339,25 +1194,41 @@ class AdvancedKnowledgeRetrieval:
             self._logger.warning("No vector store available for retrieval")
             return []
         
-        strategy_config = self._strategy_configs.get(strategy, self._strategy_configs["diagnostic"])
-        max_docs = strategy_config["max_documents"]
+        handler = self._retrieval_handlers.get(strategy, self._retrieval_handlers["diagnostic"])
+        return await handler(enhanced_query)
+
+    async def _retrieve_with_config(
+        self,
+        enhanced_query: str,
+        max_docs: int,
+        threshold: float
+    ) -> List[Dict[str, Any]]:
+        """Multi-stage retrieval with strategy parameters bound in advance"""
         
         try:
             # Stage 1: Initial semantic search
-            initial_results = await self._vector_store.search(
-                enhanced_query, 
-                k=min(max_docs, 10)
+            ef_search = self._preferred_ef_search(max_docs)
+            initial_results = await self._search_batcher.search(
+                enhanced_query, min(max_docs, 10), ef_search
             )
             
-            # Stage 2: Expand search with related terms if needed
-            if len(initial_results) < 5:  # Need more results
-                expanded_results = await self._expand_search_with_synonyms(
-                    enhanced_query, max_docs - len(initial_results)
-                )
-                initial_results.extend(expanded_results)
+            # Stage 2: Expand search with related terms only when too few
+            # initial results clear the relevance threshold
+            relevant_count = sum(
+                1 for result in initial_results if result.get("score", 0.0) >= threshold
+            )
+            if relevant_count < _MIN_RELEVANT_RESULTS:
+                expansion_terms = self._get_expansion_terms(enhanced_query)
+                if expansion_terms:
+                    expanded_results = await self._expand_search_with_synonyms(
+                        enhanced_query, max_docs, expansion_terms, ef_search
+                    )
+                    initial_results = self._merge_results(
+                        initial_results,
+                        expanded_results[:max_docs - len(initial_results)]
+                    )
             
             # Stage 3: Filter by relevance threshold
-            threshold = strategy_config["relevance_threshold"]
             filtered_results = [
                 result for result in initial_results
                 if result.get("score", 0.0) >= threshold
@@ -373,41 +1244,63 @@ class AdvancedKnowledgeRetrieval:
                     "relevance_score": result.get("score", 0.0),
                     "retrieval_stage": "semantic_search"
                 }
+                # Keep the document embedding (normalized, int8) when the store
+                # returns it, as an internal field left out of returned documents
+                if result.get("embedding") is not None:
+                    formatted_result["_embedding"] = _quantize_embedding(result["embedding"])
                 formatted_results.append(formatted_result)
             
             return formatted_results[:max_docs]  # Limit to max documents
             
         except Exception as e:
-            self._logger.error(f"Multi-stage retrieval failed: {e}")
+            self._logger.error("Multi-stage retrieval failed: %s", e)
             return []
     
+    def _preferred_ef_search(self, max_documents: int) -> int:
+        """HNSW search breadth for a strategy; high-recall strategies search wider"""
+        return max(64, 2 * max_documents)
+
+    def _get_expansion_terms(self, query: str) -> List[str]:
+        """Get synonym expansion terms for the words of a query"""
+
+        expanded_terms = []
+        for word in query.lower().split():
+            expanded_terms.extend(_EXPANSION_MAPPING.get(word, ()))
+
+        return expanded_terms
+
+    def _merge_results(
+        self,
+        primary: List[Dict[str, Any]],
+        secondary: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Merge search results by document ID, keeping the highest score"""
+
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for result in primary + secondary:
+            doc_id = result.get("id", result.get("document_id"))
+            if doc_id is None:
+                doc_id = id(result)  # Never collapse results without an ID
+            existing = merged.get(doc_id)
+            if existing is None or result.get("score", 0.0) > existing.get("score", 0.0):
+                merged[doc_id] = result
+
+        return list(merged.values())
+
     async def _expand_search_with_synonyms(
         self, 
         query: str, 
-        additional_docs_needed: int
+        additional_docs_needed: int,
+        expanded_terms: Optional[List[str]] = None,
+        ef_search: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Expand search using synonym and related term expansion"""
         
         if not self._vector_store:
             return []
         
-        # Simple synonym expansion (in production, would use more sophisticated NLP)
-        expansion_mapping = {
-            "error": ["exception", "failure", "bug", "issue"],
-            "problem": ["issue", "trouble", "difficulty"],
-            "solution": ["fix", "resolution", "answer", "remedy"],
-            "configure": ["setup", "config", "configuration"],
-            "deploy": ["deployment", "install", "rollout"],
-            "performance": ["speed", "optimization", "efficiency"],
-            "security": ["authentication", "authorization", "access"]
-        }
-        
-        expanded_terms = []
-        query_words = query.lower().split()
-        
-        for word in query_words:
-            if word in expansion_mapping:
-                expanded_terms.extend(expansion_mapping[word][:2])  # Top 2 synonyms
+        if expanded_terms is None:
+            expanded_terms = self._get_expansion_terms(query)
         
         if not expanded_terms:
             return []
@@ -415,9 +1308,10 @@ class AdvancedKnowledgeRetrieval:
         try:
             # Search with expanded terms
             expanded_query = f"{query} {' '.join(expanded_terms)}"
-            expanded_results = await self._vector_store.search(
+            expanded_results = await self._search_batcher.search(
                 expanded_query,
-                k=additional_docs_needed
+                additional_docs_needed,
+                ef_search
             )
             
             # Mark as expanded search
@@ -429,7 +1323,7 @@ class AdvancedKnowledgeRetrieval:
             return expanded_results
             
         except Exception as e:
-            self._logger.error(f"Synonym expansion search failed: {e}")
+            self._logger.error("Synonym expansion search failed: %s", e)
             return []
     
     async def _apply_semantic_clustering(
@@ -444,56 +1338,55 @@ class AdvancedKnowledgeRetrieval:
             return documents
         
         try:
-            # Group documents by topic similarity
-            topic_clusters = {}
+            # Assign each document a topic id (ids follow first appearance)
+            topic_ids: Dict[str, int] = {}
+            doc_topics = np.empty(len(documents), dtype=np.int32)
+            doc_scores = np.empty(len(documents), dtype=np.float64)
             
-            for doc in documents:
-                content = doc.get("content", "")
-                metadata = doc.get("metadata", {})
-                
+            for i, doc in enumerate(documents):
                 # Simple topic extraction based on keywords
-                topic = self._extract_primary_topic(content, metadata)
-                
-                if topic not in topic_clusters:
-                    topic_clusters[topic] = []
-                topic_clusters[topic].append(doc)
+                topic = self._extract_primary_topic(
+                    _content_lower(doc), doc.get("metadata", {})
+                )
+                doc_topics[i] = topic_ids.setdefault(topic, len(topic_ids))
+                doc_scores[i] = doc.get("relevance_score", 0.0)
+
+            topics = list(topic_ids)
             
-            # Rank clusters by relevance and size
-            cluster_scores = {}
-            for topic, cluster_docs in topic_clusters.items():
-                # Score based on cluster size and average relevance
-                avg_relevance = sum(doc.get("relevance_score", 0.0) for doc in cluster_docs) / len(cluster_docs)
-                cluster_size_bonus = min(len(cluster_docs) * 0.1, 0.3)  # Up to 0.3 bonus
-                cluster_scores[topic] = avg_relevance + cluster_size_bonus
+            # Score clusters by average relevance plus a size bonus (up to 0.3)
+            cluster_sizes, cluster_scores = _score_clusters(doc_topics, doc_scores, len(topics))
             
-            # Sort clusters by score and reconstruct document list
-            sorted_clusters = sorted(cluster_scores.items(), key=lambda x: x[1], reverse=True)
+            # Order clusters by score, and documents within a cluster by relevance
+            cluster_order = np.argsort(-cluster_scores, kind="stable")
+            doc_order = np.lexsort((-doc_scores, doc_topics))
+            cluster_starts = np.concatenate(([0], np.cumsum(cluster_sizes)))
             
             clustered_documents = []
-            for topic, score in sorted_clusters:
-                cluster_docs = topic_clusters[topic]
-                # Sort documents within cluster by relevance
-                cluster_docs.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=True)
+            for topic_id in cluster_order.tolist():
+                topic = topics[topic_id]
+                score = float(cluster_scores[topic_id])
+                size = int(cluster_sizes[topic_id])
+                member_indices = doc_order[cluster_starts[topic_id]:cluster_starts[topic_id + 1]]
                 
                 # Add cluster metadata
-                for i, doc in enumerate(cluster_docs):
+                for position, doc_index in enumerate(member_indices.tolist(), start=1):
+                    doc = documents[doc_index]
                     doc["metadata"]["cluster_topic"] = topic
                     doc["metadata"]["cluster_score"] = score
-                    doc["metadata"]["cluster_position"] = i + 1
-                    doc["metadata"]["cluster_size"] = len(cluster_docs)
-                
-                clustered_documents.extend(cluster_docs)
+                    doc["metadata"]["cluster_position"] = position
+                    doc["metadata"]["cluster_size"] = size
+                    clustered_documents.append(doc)
             
-            self._metrics["semantic_clusters_created"] += len(topic_clusters)
+            self._increment_metric("semantic_clusters_created", len(topics))
             
             return clustered_documents
             
         except Exception as e:
-            self._logger.error(f"Semantic clustering failed: {e}")
+            self._logger.error("Semantic clustering failed: %s", e)
             return documents  # Return original documents if clustering fails
     
-    def _extract_primary_topic(self, content: str, metadata: Dict[str, Any]) -> str:
-        """Extract primary topic from document content and metadata"""
+    def _extract_primary_topic(self, content_lower: str, metadata: Dict[str, Any]) -> str:
+        """Extract primary topic from lowercased document content and metadata"""
         
         # Check metadata for explicit topic information
         if metadata.get("document_type"):
@@ -502,31 +1395,12 @@ class AdvancedKnowledgeRetrieval:
         if metadata.get("category"):
             return metadata["category"]
         
-        # Extract topic from content using keyword analysis
-        content_lower = content.lower()
-        
-        # Topic keyword mapping
-        topic_keywords = {
-            "database": ["database", "sql", "query", "table", "index"],
-            "networking": ["network", "connection", "tcp", "http", "dns"],
-            "authentication": ["auth", "login", "password", "token", "security"],
-            "performance": ["performance", "slow", "optimization", "memory", "cpu"],
-            "deployment": ["deploy", "install", "configuration", "setup"],
-            "monitoring": ["monitoring", "alerts", "logs", "metrics"],
-            "api": ["api", "endpoint", "rest", "response", "request"],
-            "storage": ["storage", "disk", "file", "volume", "backup"]
-        }
-        
-        # Score each topic based on keyword matches
-        topic_scores = {}
-        for topic, keywords in topic_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in content_lower)
-            if score > 0:
-                topic_scores[topic] = score
+        # Extract topic from content using a single multi-keyword pass
+        topic_scores = _TOPIC_MATCHER.count_labels(content_lower)
         
-        # Return highest scoring topic or default
+        # Return highest scoring topic (first declared wins ties) or default
         if topic_scores:
-            return max(topic_scores.items(), key=lambda x: x[1])[0]
+            return max(_TOPIC_MATCHER.labels, key=lambda topic: topic_scores[topic])
         
         return "general"
     
@@ -541,21 +1415,8 @@ class AdvancedKnowledgeRetrieval:
         expansion_paths = []
         
         try:
-            # Analyze query coverage
+            # Analyze query and reasoning-element coverage in one pass per document
             query_terms = set(context.query.lower().split())
-            covered_terms = set()
-            
-            # Check which query terms are covered by retrieved documents
-            for doc in documents:
-                content = doc.get("content", "").lower()
-                for term in query_terms:
-                    if term in content:
-                        covered_terms.add(term)
-            
-            uncovered_terms = query_terms - covered_terms
-            if uncovered_terms:
-                knowledge_gaps.append(f"Uncovered query terms: {', '.join(uncovered_terms)}")
-                expansion_paths.append(f"Search specifically for: {' '.join(uncovered_terms)}")
             
             # Check for missing reasoning context elements
             reasoning_requirements = {
@@ -566,13 +1427,22 @@ class AdvancedKnowledgeRetrieval:
             }
             
             required_elements = reasoning_requirements.get(context.reasoning_type, [])
-            found_elements = set()
             
+            coverage_matcher = _KeywordMatcher({
+                "query": tuple(query_terms),
+                "reasoning": tuple(required_elements)
+            })
+            found_keywords = set()
             for doc in documents:
-                content = doc.get("content", "").lower()
-                for element in required_elements:
-                    if element in content:
-                        found_elements.add(element)
+                found_keywords |= coverage_matcher.find_keywords(_content_lower(doc))
+
+            covered_terms = query_terms & found_keywords
+            found_elements = set(required_elements) & found_keywords
+
+            uncovered_terms = query_terms - covered_terms
+            if uncovered_terms:
+                knowledge_gaps.append(f"Uncovered query terms: {', '.join(uncovered_terms)}")
+                expansion_paths.append(f"Search specifically for: {' '.join(uncovered_terms)}")
             
             missing_elements = set(required_elements) - found_elements
             if missing_elements:
@@ -590,15 +1460,17 @@ class AdvancedKnowledgeRetrieval:
                 if context.domain_context.get("service_name"):
                     domain_requirements.append("service-specific")
                 
-                found_domain_coverage = set()
-                for doc in documents:
-                    metadata = doc.get("metadata", {})
-                    if metadata.get("technology"):
-                        found_domain_coverage.add("technology-specific")
-                    if metadata.get("environment"):
-                        found_domain_coverage.add("environment-specific")
-                    if metadata.get("service_name"):
-                        found_domain_coverage.add("service-specific")
+                domain_coverage_keys = (
+                    ("technology", "technology-specific"),
+                    ("environment", "environment-specific"),
+                    ("service_name", "service-specific"),
+                )
+                found_domain_coverage = {
+                    coverage
+                    for doc in documents
+                    for key, coverage in domain_coverage_keys
+                    if doc.get("metadata", {}).get(key)
+                }
                 
                 missing_domain = set(domain_requirements) - found_domain_coverage
                 if missing_domain:
@@ -610,15 +1482,15 @@ class AdvancedKnowledgeRetrieval:
             expansion_paths = expansion_paths[:3]
             
             if knowledge_gaps:
-                self._metrics["knowledge_gaps_identified"] += len(knowledge_gaps)
+                self._increment_metric("knowledge_gaps_identified", len(knowledge_gaps))
             
             return knowledge_gaps, expansion_paths
             
         except Exception as e:
-            self._logger.error(f"Knowledge gap identification failed: {e}")
+            self._logger.error("Knowledge gap identification failed: %s", e)
             return [], []
     
-    def _calculate_retrieval_confidence(
+    async def _calculate_retrieval_confidence(
         self,
         documents: List[Dict[str, Any]],
         context: RetrievalContext,
@@ -629,37 +1501,40 @@ class AdvancedKnowledgeRetrieval:
         if not documents:
             return 0.0, 0.0
         
-        # Base confidence from document relevance scores
-        relevance_scores = [doc.get("relevance_score", 0.0) for doc in documents]
-        avg_relevance = sum(relevance_scores) / len(relevance_scores)
-        
-        # Confidence adjustments
-        confidence_adjustments = 0.0
+        doc_count = len(documents)
         
-        # Bonus for good document diversity (multiple clusters)
-        unique_clusters = len(set(doc.get("metadata", {}).get("cluster_topic", "general") for doc in documents))
-        if unique_clusters > 1:
-            confidence_adjustments += 0.1 * min(unique_clusters, 3)  # Up to 0.3 bonus
-        
-        # Bonus for strategy alignment
-        strategy_config = self._strategy_configs.get(strategy, {})
-        expected_docs = strategy_config.get("max_documents", 10)
-        doc_coverage = len(documents) / expected_docs
-        confidence_adjustments += 0.1 * min(doc_coverage, 1.0)  # Up to 0.1 bonus
-        
-        # Penalty for low document count
-        if len(documents) < 3:
-            confidence_adjustments -= 0.2
+        # Base confidence from document relevance scores
+        relevance_scores = np.fromiter(
+            (doc.get("relevance_score", 0.0) for doc in documents),
+            dtype=np.float64,
+            count=doc_count
+        )
+        unique_clusters = len({
+            doc.get("metadata", {}).get("cluster_topic", "general") for doc in documents
+        })
+        expected_docs = self._strategy_configs.get(strategy, {}).get("max_documents", 10)
+        
+        # Confidence adjustments:
+        # - diversity bonus for multiple clusters (up to 0.3)
+        # - strategy alignment bonus for document coverage (up to 0.1)
+        # - penalty for low document count
+        confidence_adjustments = (
+            (0.1 * min(unique_clusters, 3) if unique_clusters > 1 else 0.0)
+            + 0.1 * min(doc_count / expected_docs, 1.0)
+            - (0.2 if doc_count < 3 else 0.0)
+        )
         
         # Calculate final confidence
-        final_confidence = min(max(avg_relevance + confidence_adjustments, 0.0), 1.0)
+        final_confidence = float(
+            np.clip(relevance_scores.mean() + confidence_adjustments, 0.0, 1.0)
+        )
         
         # Calculate contextual relevance
-        contextual_relevance = self._calculate_contextual_relevance(documents, context)
+        contextual_relevance = await self._calculate_contextual_relevance(documents, context)
         
         return final_confidence, contextual_relevance
     
-    def _calculate_contextual_relevance(
+    async def _calculate_contextual_relevance(
         self, 
         documents: List[Dict[str, Any]], 
         context: RetrievalContext
@@ -669,7 +1544,56 @@ class AdvancedKnowledgeRetrieval:
         if not documents:
             return 0.0
         
-        relevance_factors = []
+        # No context factor applies: neutral relevance without scanning documents
+        if (
+            context.reasoning_type not in _REASONING_KEYWORDS
+            and not context.domain_context
+            and not any(insight.get("keywords") for insight in context.memory_insights)
+        ):
+            return 0.5
+
+        # Re-scoring the same documents for the same context is served from an LRU cache
+        cache_key = self._contextual_relevance_key(documents, context)
+        if cache_key is not None:
+            cached_relevance = self._relevance_cache.get(cache_key)
+            if cached_relevance is not None:
+                self._relevance_cache.move_to_end(cache_key)
+                return cached_relevance
+
+        relevance = await self._compute_contextual_relevance(documents, context)
+
+        if cache_key is not None:
+            self._relevance_cache[cache_key] = relevance
+            if len(self._relevance_cache) > _RELEVANCE_CACHE_SIZE:
+                self._relevance_cache.popitem(last=False)
+
+        return relevance
+
+    def _contextual_relevance_key(
+        self,
+        documents: List[Dict[str, Any]],
+        context: RetrievalContext
+    ) -> Optional[Tuple]:
+        """Cache key for contextual relevance, or None if a document has no ID"""
+        document_ids = []
+        for doc in documents:
+            document_id = doc.get("document_id")
+            if document_id is None or document_id == "unknown":
+                return None
+            document_ids.append(document_id)
+
+        return (context.relevance_fingerprint(), tuple(sorted(document_ids)))
+
+    async def _compute_contextual_relevance(
+        self,
+        documents: List[Dict[str, Any]],
+        context: RetrievalContext
+    ) -> float:
+        """Score memory, domain and reasoning alignment of documents"""
+
+        # Running total of the applicable relevance factors
+        total_relevance = 0.0
+        factor_count = 0
         
         # Memory insight alignment
         if context.memory_insights:
@@ -678,16 +1602,27 @@ class AdvancedKnowledgeRetrieval:
                 memory_keywords.extend(insight.get("keywords", []))
             
             if memory_keywords:
-                memory_matches = 0
-                total_memory_keywords = len(memory_keywords)
+                memory_relevance = await self._semantic_memory_relevance(documents, memory_keywords)
                 
-                for doc in documents:
-                    content = doc.get("content", "").lower()
-                    matches = sum(1 for keyword in memory_keywords if keyword.lower() in content)
-                    memory_matches += matches
+                if memory_relevance is None:
+                    # Fall back to keyword occurrence when embeddings are unavailable,
+                    # finding all memory keywords in one pass per document
+                    memory_matches = 0
+                    total_memory_keywords = len(memory_keywords)
+                    keywords_lower = [keyword.lower() for keyword in memory_keywords]
+                    memory_matcher = _KeywordMatcher({"memory": tuple(set(keywords_lower))})
+
+                    for doc in documents:
+                        found_keywords = memory_matcher.find_keywords(_content_lower(doc))
+                        memory_matches += sum(
+                            1 for keyword in keywords_lower if keyword in found_keywords
+                        )
+
+                    # Each keyword counts at most once per document, so this is <= 1
+                    memory_relevance = memory_matches / (total_memory_keywords * len(documents))
                 
-                memory_relevance = min(memory_matches / (total_memory_keywords * len(documents)), 1.0)
-                relevance_factors.append(memory_relevance)
+                total_relevance += memory_relevance
+                factor_count += 1
         
         # Domain context alignment
         if context.domain_context:
@@ -713,60 +1648,93 @@ class AdvancedKnowledgeRetrieval:
                         domain_matches += 1
             
             if domain_checks > 0:
-                domain_relevance = domain_matches / domain_checks
-                relevance_factors.append(domain_relevance)
-        
-        # Reasoning type alignment
-        reasoning_keywords = {
-            "diagnostic": ["error", "problem", "solution", "fix", "troubleshoot"],
-            "analytical": ["analysis", "pattern", "cause", "relationship"],
-            "strategic": ["plan", "strategy", "approach", "implement"],
-            "creative": ["alternative", "innovative", "creative", "novel"]
-        }
+                total_relevance += domain_matches / domain_checks
+                factor_count += 1
         
-        reasoning_terms = reasoning_keywords.get(context.reasoning_type, [])
+        # Reasoning type alignment (distinct reasoning terms per document,
+        # counted for the whole batch in one sparse matrix when available)
+        reasoning_terms = _REASONING_KEYWORDS.get(context.reasoning_type)
         if reasoning_terms:
-            reasoning_matches = 0
             total_reasoning_checks = len(reasoning_terms) * len(documents)
             
-            for doc in documents:
-                content = doc.get("content", "").lower()
-                matches = sum(1 for term in reasoning_terms if term in content)
-                reasoning_matches += matches
+            if _REASONING_VECTORIZER is not None:
+                term_matrix = _REASONING_VECTORIZER.transform(
+                    [_content_lower(doc) for doc in documents]
+                )
+                reasoning_matches = int(
+                    term_matrix[:, _REASONING_TERM_INDICES[context.reasoning_type]].sum()
+                )
+            else:
+                reasoning_matches = sum(
+                    len(reasoning_terms & _content_tokens(doc))
+                    for doc in documents
+                )
             
-            reasoning_relevance = min(reasoning_matches / total_reasoning_checks, 1.0)
-            relevance_factors.append(reasoning_relevance)
+            # Distinct term matches per document are bounded by the term count
+            total_relevance += reasoning_matches / total_reasoning_checks
+            factor_count += 1
         
         # Calculate overall contextual relevance
-        if relevance_factors:
-            return sum(relevance_factors) / len(relevance_factors)
-        else:
-            return 0.5  # Neutral relevance when no context factors available
+        if factor_count:
+            return total_relevance / factor_count
+        return 0.5  # Neutral relevance when no context factors available
     
-    def _update_metrics(self, retrieval_time: float, confidence_score: float) -> None:
-        """Update performance metrics"""
-        self._metrics["retrievals_performed"] += 1
+    async def _semantic_memory_relevance(
+        self,
+        documents: List[Dict[str, Any]],
+        memory_keywords: List[str]
+    ) -> Optional[float]:
+        """Mean cosine similarity between documents and the memory keyword embedding
         
-        # Update average retrieval time
-        current_avg = self._metrics["avg_retrieval_time"]
-        total_retrievals = self._metrics["retrievals_performed"]
+        Returns None when no embedder is configured or a document has no
+        cached embedding, so the caller can fall back to keyword matching.
+        """
+        if self._query_embedder is None:
+            return None
+        if any(doc.get("_embedding") is None for doc in documents):
+            return None
         
-        if total_retrievals == 1:
-            self._metrics["avg_retrieval_time"] = retrieval_time
-        else:
-            self._metrics["avg_retrieval_time"] = (
-                (current_avg * (total_retrievals - 1) + retrieval_time) / total_retrievals
+        try:
+            keyword_embedding = await asyncio.to_thread(
+                self._query_embedder, " ".join(memory_keywords)
             )
+            centroid = _quantize_embedding(keyword_embedding)
+            doc_matrix = np.vstack([doc["_embedding"] for doc in documents])
+            return float(_mean_clipped_int8_cosine(doc_matrix, centroid))
+        except Exception as e:
+            self._logger.warning("Embedding-based memory relevance failed: %s", e)
+            return None
+
+    def _increment_metric(self, name: str, amount: int = 1) -> None:
+        """Increment a counter metric and invalidate the metrics snapshot"""
+        self._metrics[_METRIC_INDEX[name]] += amount
+        self._metrics_version += 1
+
+    def _update_metrics(self, retrieval_time: float, confidence_score: float) -> None:
+        """Update performance metrics"""
+        self._increment_metric("retrievals_performed")
+        total_retrievals = self._metrics[_METRIC_INDEX["retrievals_performed"]]
         
-        # Update average relevance score
-        current_avg_relevance = self._metrics["avg_relevance_score"]
-        
-        if total_retrievals == 1:
-            self._metrics["avg_relevance_score"] = confidence_score
-        else:
-            self._metrics["avg_relevance_score"] = (
-                (current_avg_relevance * (total_retrievals - 1) + confidence_score) / total_retrievals
-            )
+        # Incremental running averages of (time, relevance) in one vector op;
+        # the first sample sets the average
+        averages = self._metrics[_AVERAGE_METRICS]
+        averages += (np.array((retrieval_time, confidence_score)) - averages) / total_retrievals
+
+    def _performance_snapshot(self) -> Mapping[str, Any]:
+        """Read-only view of the metrics, rebuilt only when they have changed"""
+        if self._metrics_snapshot is None or self._metrics_snapshot[0] != self._metrics_version:
+            values = self._metrics.tolist()
+            metrics = {
+                name: int(value) if index < _AVERAGE_METRICS.start else value
+                for index, (name, value) in enumerate(zip(_METRIC_NAMES, values))
+            }
+            self._metrics_snapshot = (self._metrics_version, MappingProxyType(metrics))
+        return self._metrics_snapshot[1]
+
+    async def close(self) -> None:
+        """Stop the background search dispatcher"""
+        if self._search_batcher is not None:
+            await self._search_batcher.stop()
     
     async def health_check(self) -> Dict[str, Any]:
         """Check health of advanced knowledge retrieval system"""
@@ -777,7 +1745,7 @@ class AdvancedKnowledgeRetrieval:
                 "vector_store": "unknown",
                 "memory_service": "unknown"
             },
-            "performance_metrics": self._metrics.copy(),
+            "performance_metrics": self._performance_snapshot(),
             "capabilities": {
                 "context_aware_retrieval": True,
                 "semantic_clustering": True,
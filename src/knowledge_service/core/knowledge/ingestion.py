@@ -26,29 +26,353 @@ Core Design Principles:
 • Observability: Add tracing spans for key operations
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import importlib.util
 import logging
+import multiprocessing
 import os
+import re
+import sqlite3
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import chromadb
-import pandas as pd
-import pypdf
+import numpy as np
 from chromadb.config import Settings
-from docx import Document
 
 from faultmaven.models import KnowledgeBaseDocument
 from faultmaven.infrastructure.observability.tracing import trace
 from faultmaven.infrastructure.security.redaction import DataSanitizer
 from faultmaven.infrastructure.model_cache import model_cache
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# Disk-backed embedding cache with graceful fallback
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Fast JSON (installed with chromadb) with graceful fallback to the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Small HNSW index for the query result cache (installed with chromadb as
+# chroma-hnswlib) with graceful fallback to no result caching
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+# Int8-quantized ONNX export of the embedding model (needs optimum[onnxruntime])
+# with graceful fallback to the cached PyTorch model. Only probed here; the
+# heavy imports happen in _load_quantized_onnx_model when it is configured
+ONNX_EXPORT_AVAILABLE = importlib.util.find_spec("optimum") is not None
+
+# Embedding model identity, part of the embedding cache key
+EMBEDDING_MODEL_NAME = "BAAI/bge-m3"
+
+# Quantized model file inside an exported ONNX model directory
+ONNX_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Sentence-ending characters preferred as chunk break points
+SENTENCE_END_RE = re.compile(r"[.!?]")
+
+# Pages of a PDF extracted per process-pool task
+PDF_PAGES_PER_TASK = 16
+
+# Upper bound on PDF extraction worker processes
+PDF_POOL_MAX_WORKERS = 4
+
+# Process pool shared by every ingester, created on first PDF
+_pdf_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _read_text(file_path: str) -> str:
+    """Read a text file once, decoding as UTF-8 with a Latin-1 fallback"""
+    data = Path(file_path).read_bytes()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    # Same newline translation as opening the file in text mode
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _load_quantized_onnx_model(model_directory: str) -> "SentenceTransformer":
+    """Load the embedding model as int8 dynamically quantized ONNX, exporting it on first use"""
+    import optimum.onnxruntime  # noqa: F401
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+
+    if not (Path(model_directory) / ONNX_QUANTIZED_FILE).exists():
+        model = SentenceTransformer(EMBEDDING_MODEL_NAME, backend="onnx")
+        model.save_pretrained(model_directory)
+        export_dynamic_quantized_onnx_model(model, "avx512_vnni", model_directory)
+    return SentenceTransformer(
+        model_directory,
+        backend="onnx",
+        model_kwargs={"file_name": ONNX_QUANTIZED_FILE, "provider": "CPUExecutionProvider"},
+    )
+
+
+@lru_cache()
+def get_sanitizer() -> DataSanitizer:
+    """Get the shared sanitizer, so its patterns are compiled once per process."""
+    return DataSanitizer()
+
+
+def _get_pdf_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """The shared PDF extraction pool, created on first use.
+
+    Workers are spawned rather than forked, so they do not inherit the
+    parent's threads, locks or loaded models.
+    """
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(PDF_POOL_MAX_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pdf_pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Shut down the shared PDF extraction pool (recreated on next use)"""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        pool, _pdf_pool = _pdf_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _extract_pdf_pages(file_path: str, start: int, stop: int) -> str:
+    """Extract text of PDF pages [start, stop), one line break after each page"""
+    import pypdf
+
+    pdf_reader = pypdf.PdfReader(file_path)
+    return "".join(
+        pdf_reader.pages[i].extract_text() + "\n" for i in range(start, stop)
+    )
+
+
+def _tag_keys(tags: str) -> List[str]:
+    """Non-empty tags from a comma-joined tag string, as counted in stats"""
+    return [tag.strip() for tag in tags.split(",") if tag.strip()]
+
+
+class _CollectionStats:
+    """Per-chunk document type and tag counts kept in a small SQLite database.
+
+    Counts are updated as documents are stored and deleted, so collection
+    stats never have to scan chunk metadata. Each document's contribution
+    is recorded so a delete can reverse it without reading ChromaDB.
+
+    The database only sees writes made by its own process, so it is only
+    correct when a single ingester writes the collection. ":memory:" keeps
+    the counts for the life of the process.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS counts ("
+                "kind TEXT NOT NULL, key TEXT NOT NULL, n INTEGER NOT NULL, "
+                "PRIMARY KEY (kind, key))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS document_counts ("
+                "document_id TEXT NOT NULL, kind TEXT NOT NULL, key TEXT NOT NULL, "
+                "n INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_document_counts_document_id "
+                "ON document_counts (document_id)"
+            )
+
+    def is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM counts LIMIT 1").fetchone() is None
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM counts")
+            self._conn.execute("DELETE FROM document_counts")
+
+    def add_chunks(self, metadatas: List[Dict[str, Any]]) -> None:
+        """Count stored chunks from their ChromaDB metadata"""
+        contributions: Counter = Counter()
+        for metadata in metadatas:
+            document_id = metadata.get("document_id", "")
+            contributions[(document_id, "doc_type", metadata.get("document_type", "unknown"))] += 1
+            for tag in _tag_keys(metadata.get("tags", "")):
+                contributions[(document_id, "tag", tag)] += 1
+
+        rows = [
+            (document_id, kind, key, n)
+            for (document_id, kind, key), n in contributions.items()
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO document_counts (document_id, kind, key, n) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.executemany(
+                "INSERT INTO counts (kind, key, n) VALUES (?, ?, ?) "
+                "ON CONFLICT (kind, key) DO UPDATE SET n = n + excluded.n",
+                [(kind, key, n) for _, kind, key, n in rows],
+            )
+
+    def remove_document(self, document_id: str) -> None:
+        """Subtract a deleted document's chunks from the counts"""
+        with self._conn:
+            rows = self._conn.execute(
+                "SELECT kind, key, n FROM document_counts WHERE document_id = ?",
+                (document_id,),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE counts SET n = n - ? WHERE kind = ? AND key = ?",
+                [(n, kind, key) for kind, key, n in rows],
+            )
+            self._conn.execute("DELETE FROM counts WHERE n <= 0")
+            self._conn.execute(
+                "DELETE FROM document_counts WHERE document_id = ?", (document_id,)
+            )
+
+    def counts(self, kind: str) -> Dict[str, int]:
+        return dict(
+            self._conn.execute(
+                "SELECT key, n FROM counts WHERE kind = ? ORDER BY n DESC", (kind,)
+            ).fetchall()
+        )
+
+
+class _QueryResultCache:
+    """Near-duplicate query cache for formatted search results.
+
+    Query embeddings are kept in a small in-memory HNSW index (cosine space).
+    A lookup hits when a stored query with the same scope (result count and
+    metadata filter) has cosine similarity >= threshold and is younger than
+    the TTL. The least recently used entry is evicted when full; its index
+    slot is reused by the next insert. Entries are dropped whenever this
+    process changes the collection; the TTL bounds how long writes made by
+    other replicas can go unseen.
+    """
+
+    # Neighbours examined per lookup, so a near match stored under another
+    # scope does not hide one under the requested scope
+    SEARCH_K = 4
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        similarity_threshold: float = 0.95,
+        ttl_seconds: float = 30.0,
+    ):
+        self._max_size = max_size
+        self._similarity_threshold = similarity_threshold
+        self._ttl_seconds = ttl_seconds
+        self._index = None  # Created on first insert, once the dimension is known
+        # label -> (scope, stored_at, results)
+        self._entries: "OrderedDict[int, Tuple[Tuple, float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._next_label = 0
+
+    def get(self, scope: Tuple, embedding: np.ndarray) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for a near-duplicate query, if any"""
+        if not self._entries:
+            return None
+
+        k = min(self.SEARCH_K, len(self._entries))
+        labels, distances = self._index.knn_query(embedding, k=k)
+        now = time.monotonic()
+        for label, distance in zip(labels[0], distances[0]):
+            if 1.0 - distance < self._similarity_threshold:
+                break
+            label = int(label)
+            entry = self._entries.get(label)
+            if entry is None or entry[0] != scope:
+                continue
+            if now - entry[1] >= self._ttl_seconds:
+                del self._entries[label]
+                self._index.mark_deleted(label)
+                continue
+            self._entries.move_to_end(label)
+            return entry[2]
+        return None
+
+    def put(self, scope: Tuple, embedding: np.ndarray, results: List[Dict[str, Any]]) -> None:
+        """Store results, evicting the least recently used entry when full"""
+        if self._index is None:
+            self._index = hnswlib.Index(space="cosine", dim=embedding.shape[-1])
+            self._index.init_index(
+                max_elements=self._max_size,
+                ef_construction=100,
+                M=16,
+                allow_replace_deleted=True,
+            )
+
+        if len(self._entries) >= self._max_size:
+            evicted, _ = self._entries.popitem(last=False)
+            self._index.mark_deleted(evicted)
+
+        label = self._next_label
+        self._next_label += 1
+        self._index.add_items(embedding, [label], replace_deleted=True)
+        self._entries[label] = (scope, time.monotonic(), results)
+
+    def clear(self) -> None:
+        self._index = None
+        self._entries.clear()
+
 
 class KnowledgeIngester:
     """Handles asynchronous ingestion of documents into the knowledge base"""
 
-    def __init__(self, chroma_persist_directory: str = "./chroma_db", settings=None):
+    def __init__(
+        self,
+        chroma_persist_directory: str = "./chroma_db",
+        settings=None,
+        embed_batch_size: int = 64,
+        embed_cache_directory: Optional[str] = None,
+        stats_db_path: Optional[str] = None,
+        query_cache_size: int = 10000,
+        query_cache_ttl_seconds: float = 30.0,
+        onnx_model_directory: Optional[str] = None,
+    ):
         self.logger = logging.getLogger(__name__)
-        self.sanitizer = DataSanitizer()
+        self.sanitizer = get_sanitizer()
+        self.embed_batch_size = embed_batch_size
+
+        # Content-addressed chunk embeddings (opt-in via embed_cache_directory),
+        # so re-ingesting unchanged content skips the encoder
+        self.embed_cache = None
+        if embed_cache_directory and DISKCACHE_AVAILABLE:
+            self.embed_cache = diskcache.Cache(embed_cache_directory)
+        elif embed_cache_directory:
+            self.logger.debug("diskcache not installed, embedding cache disabled")
+
+        # Recent search results keyed on query embedding, for near-duplicate queries
+        self._query_cache = None
+        if query_cache_size and HNSWLIB_AVAILABLE:
+            self._query_cache = _QueryResultCache(
+                max_size=query_cache_size, ttl_seconds=query_cache_ttl_seconds
+            )
+        elif query_cache_size:
+            self.logger.debug("hnswlib not installed, search result cache disabled")
         
         # Get settings if not provided
         if settings is None:
@@ -116,13 +440,29 @@ class KnowledgeIngester:
             name="faultmaven_kb", metadata={"description": "FaultMaven Knowledge Base"}
         )
 
-        # Initialize sentence transformer for embeddings using cached model
-        self.embedding_model = model_cache.get_bge_m3_model()
-        if self.embedding_model is None:
-            self.logger.error("Failed to load BGE-M3 embedding model from cache")
-            raise RuntimeError("BGE-M3 model unavailable - knowledge ingestion cannot proceed")
+        # Incremental document type / tag counts for collection stats, for a
+        # single writer only; seeded from the collection once if it predates
+        # the stats database. Kept in memory unless stats_db_path is given
+        self._stats = _CollectionStats(stats_db_path or ":memory:")
+        if self._stats.is_empty() and self.collection.count() > 0:
+            self.rebuild_stats()
+
+        # Initialize sentence transformer for embeddings: the quantized ONNX
+        # export when configured, otherwise the cached PyTorch model
+        self.embedding_model_id = EMBEDDING_MODEL_NAME
+        if onnx_model_directory and ONNX_EXPORT_AVAILABLE:
+            self.embedding_model = _load_quantized_onnx_model(onnx_model_directory)
+            self.embedding_model_id = f"{EMBEDDING_MODEL_NAME}:qint8-onnx"
+            self.logger.debug("Using quantized ONNX BGE-M3 embedding model")
         else:
-            self.logger.debug("Using cached BGE-M3 embedding model")
+            if onnx_model_directory:
+                self.logger.debug("optimum not installed, using PyTorch embedding model")
+            self.embedding_model = model_cache.get_bge_m3_model()
+            if self.embedding_model is None:
+                self.logger.error("Failed to load BGE-M3 embedding model from cache")
+                raise RuntimeError("BGE-M3 model unavailable - knowledge ingestion cannot proceed")
+            else:
+                self.logger.debug("Using cached BGE-M3 embedding model")
 
         # Supported file extensions
         self.supported_extensions = {
@@ -217,23 +557,28 @@ class KnowledgeIngester:
 
     async def _extract_text_txt(self, file_path: str) -> str:
         """Extract text from plain text files"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, "r", encoding="latin-1") as f:
-                return f.read()
+        return _read_text(file_path)
 
     async def _extract_text_pdf(self, file_path: str) -> str:
-        """Extract text from PDF files"""
+        """Extract text from PDF files, page ranges in parallel worker processes"""
         try:
-            with open(file_path, "rb") as f:
-                pdf_reader = pypdf.PdfReader(f)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+            import pypdf
+
+            page_count = await asyncio.to_thread(
+                lambda: len(pypdf.PdfReader(file_path).pages)
+            )
+            loop = asyncio.get_running_loop()
+            page_texts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    _get_pdf_pool(),
+                    _extract_pdf_pages,
+                    file_path,
+                    start,
+                    min(start + PDF_PAGES_PER_TASK, page_count),
+                )
+                for start in range(0, page_count, PDF_PAGES_PER_TASK)
+            ))
+            return "".join(page_texts)
         except Exception as e:
             self.logger.error(f"Failed to extract text from PDF {file_path}: {e}")
             raise
@@ -241,11 +586,12 @@ class KnowledgeIngester:
     async def _extract_text_docx(self, file_path: str) -> str:
         """Extract text from DOCX files"""
         try:
-            doc = Document(file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
+            from docx import Document
+
+            # python-docx parses the whole file at once, so it is only moved
+            # off the event loop rather than split
+            doc = await asyncio.to_thread(Document, file_path)
+            return "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
         except Exception as e:
             self.logger.error(f"Failed to extract text from DOCX {file_path}: {e}")
             raise
@@ -253,8 +599,9 @@ class KnowledgeIngester:
     async def _extract_text_csv(self, file_path: str) -> str:
         """Extract text from CSV files"""
         try:
-            df = pd.read_csv(file_path)
-            return df.to_string()
+            # Rows are embedded as written; aligned table formatting only
+            # added padding for the embedder to read
+            return _read_text(file_path)
         except Exception as e:
             self.logger.error(f"Failed to extract text from CSV {file_path}: {e}")
             raise
@@ -262,11 +609,14 @@ class KnowledgeIngester:
     async def _extract_text_json(self, file_path: str) -> str:
         """Extract text from JSON files"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                import json
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(Path(file_path).read_bytes())
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
 
-                data = json.load(f)
-                return json.dumps(data, indent=2)
+            import json
+
+            data = json.loads(_read_text(file_path))
+            return json.dumps(data, indent=2)
         except Exception as e:
             self.logger.error(f"Failed to extract text from JSON {file_path}: {e}")
             raise
@@ -274,11 +624,10 @@ class KnowledgeIngester:
     async def _extract_text_yaml(self, file_path: str) -> str:
         """Extract text from YAML files"""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                import yaml
+            import yaml
 
-                data = yaml.safe_load(f)
-                return yaml.dump(data, default_flow_style=False)
+            data = yaml.safe_load(_read_text(file_path))
+            return yaml.dump(data, default_flow_style=False)
         except Exception as e:
             self.logger.error(f"Failed to extract text from YAML {file_path}: {e}")
             raise
@@ -290,43 +639,151 @@ class KnowledgeIngester:
         Args:
             document: Document to process and store
         """
-        # Split content into chunks
-        chunks = self._split_content(document.content)
+        await self._process_and_store_many([document])
 
-        # Generate embeddings for chunks
-        embeddings = []
-        for chunk in chunks:
-            embedding = self.embedding_model.encode(chunk)
-            embeddings.append(embedding.tolist())
+    async def _process_and_store_many(self, documents: List[KnowledgeBaseDocument]):
+        """
+        Chunk, embed and store several documents with batched encoder and ChromaDB calls
 
-        # Prepare metadata for each chunk
+        Args:
+            documents: Documents to process and store
+        """
+        all_chunks: List[str] = []
+        chunk_counts: List[int] = []
         metadatas = []
         ids = []
 
-        for i, chunk in enumerate(chunks):
-            chunk_id = f"{document.document_id}_chunk_{i}"
-            metadata = {
-                "document_id": document.document_id,
-                "title": document.title,
-                "document_type": document.document_type,
-                "tags": ",".join(document.tags) if document.tags else "",
-                "source_url": document.source_url or "",
-                "chunk_index": i,
-                "total_chunks": len(chunks),
-                "created_at": document.created_at.isoformat(),
-            }
+        for document in documents:
+            # Split content into chunks
+            chunks = self._split_content(document.content)
+            chunk_ids, chunk_metadatas = self._chunk_records(document, chunks)
+            all_chunks.extend(chunks)
+            chunk_counts.append(len(chunks))
+            ids.extend(chunk_ids)
+            metadatas.extend(chunk_metadatas)
+
+        # Generate embeddings for all chunks in batched encoder calls, off the event loop
+        embeddings = await asyncio.to_thread(self._embed_chunks, all_chunks)
+
+        # ChromaDB ignores adds of existing IDs, so only new chunks are counted
+        new_metadatas = metadatas
+        if ids:
+            existing_ids = set(self.collection.get(ids=ids, include=[])["ids"])
+            if existing_ids:
+                new_metadatas = [
+                    metadata for chunk_id, metadata in zip(ids, metadatas)
+                    if chunk_id not in existing_ids
+                ]
+
+        # Store in ChromaDB, split at the server's maximum batch size
+        batch_size = self._max_add_batch_size()
+        for start in range(0, len(all_chunks), batch_size):
+            end = start + batch_size
+            self.collection.add(
+                embeddings=embeddings[start:end],
+                documents=all_chunks[start:end],
+                metadatas=metadatas[start:end],
+                ids=ids[start:end],
+            )
 
-            ids.append(chunk_id)
-            metadatas.append(metadata)
+        self._stats.add_chunks(new_metadatas)
+        if self._query_cache is not None:
+            self._query_cache.clear()
 
-        # Store in ChromaDB
-        self.collection.add(
-            embeddings=embeddings, documents=chunks, metadatas=metadatas, ids=ids
-        )
+        for document, chunk_count in zip(documents, chunk_counts):
+            self.logger.info(
+                f"Stored {chunk_count} chunks for document {document.document_id}"
+            )
+
+    def _chunk_records(
+        self, document: KnowledgeBaseDocument, chunks: List[str]
+    ) -> tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Build ChromaDB IDs and metadata for a document's chunks
+
+        Args:
+            document: Source document
+            chunks: The document's content chunks
 
-        self.logger.info(
-            f"Stored {len(chunks)} chunks for document {document.document_id}"
+        Returns:
+            Tuple of (chunk IDs, chunk metadata)
+        """
+        # Fields shared by every chunk of the document are built once
+        base_metadata = {
+            "document_id": document.document_id,
+            "title": document.title,
+            "document_type": document.document_type,
+            "tags": ",".join(document.tags) if document.tags else "",
+            "source_url": document.source_url or "",
+            "total_chunks": len(chunks),
+            "created_at": document.created_at.isoformat(),
+        }
+
+        ids = [f"{document.document_id}_chunk_{i}" for i in range(len(chunks))]
+        metadatas = [{**base_metadata, "chunk_index": i} for i in range(len(chunks))]
+
+        return ids, metadatas
+
+    def _max_add_batch_size(self) -> int:
+        """Largest number of records the ChromaDB server accepts in one add()"""
+        try:
+            return self.chroma_client.get_max_batch_size()
+        except Exception:
+            return 5000
+
+    def _embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+        """
+        Embed chunks, encoding only those missing from the embedding cache
+
+        Args:
+            chunks: Chunk texts to embed
+
+        Returns:
+            One embedding per chunk, in input order
+        """
+        # Encode each distinct chunk once; repeated boilerplate reuses its embedding
+        unique_chunks = list(dict.fromkeys(chunks))
+        if len(unique_chunks) < len(chunks):
+            embeddings_by_chunk = dict(zip(unique_chunks, self._embed_chunks(unique_chunks)))
+            return [embeddings_by_chunk[chunk] for chunk in chunks]
+
+        if self.embed_cache is None:
+            return self.embedding_model.encode(
+                chunks,
+                batch_size=self.embed_batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            ).tolist()
+
+        keys = [
+            hashlib.sha256(
+                f"{self.embedding_model_id}\0float32\0{chunk}".encode("utf-8")
+            ).hexdigest()
+            for chunk in chunks
+        ]
+        embeddings: List[Optional[List[float]]] = []
+        for key in keys:
+            cached = self.embed_cache.get(key)
+            embeddings.append(
+                None if cached is None else np.frombuffer(cached, dtype=np.float32).tolist()
+            )
+
+        miss_indices = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if miss_indices:
+            encoded = self.embedding_model.encode(
+                [chunks[i] for i in miss_indices],
+                batch_size=self.embed_batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            ).astype(np.float32, copy=False)
+            for i, vector in zip(miss_indices, encoded):
+                self.embed_cache.set(keys[i], vector.tobytes())
+                embeddings[i] = vector.tolist()
+
+        self.logger.debug(
+            f"Embedding cache: {len(chunks) - len(miss_indices)}/{len(chunks)} chunks reused"
         )
+        return embeddings
 
     def _split_content(
         self, content: str, chunk_size: int = 1000, overlap: int = 200
@@ -345,29 +802,39 @@ class KnowledgeIngester:
         if len(content) <= chunk_size:
             return [content]
 
-        chunks = []
+        # Offsets of all sentence-ending characters, found once in C
+        boundaries = np.fromiter(
+            (match.start() for match in SENTENCE_END_RE.finditer(content)), dtype=np.int64
+        )
+
+        # Trimmed (start, end) spans, sliced once at the end
+        spans: List[Tuple[int, int]] = []
         start = 0
 
         while start < len(content):
             end = start + chunk_size
 
-            # Try to break at sentence boundary
+            # Try to break at the last sentence ending within the final
+            # 100 characters (inclusive of the character at end)
             if end < len(content):
-                # Look for sentence endings
-                for i in range(end, max(start + chunk_size - 100, start), -1):
-                    if content[i] in ".!?":
-                        end = i + 1
-                        break
-
-            chunk = content[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
+                idx = np.searchsorted(boundaries, end, side="right") - 1
+                if idx >= 0 and boundaries[idx] > max(start + chunk_size - 100, start):
+                    end = int(boundaries[idx]) + 1
+
+            # Equivalent to content[start:end].strip() without the copies
+            span_start, span_end = start, min(end, len(content))
+            while span_start < span_end and content[span_start].isspace():
+                span_start += 1
+            while span_end > span_start and content[span_end - 1].isspace():
+                span_end -= 1
+            if span_end > span_start:
+                spans.append((span_start, span_end))
 
             start = end - overlap
             if start >= len(content):
                 break
 
-        return chunks
+        return [content[span_start:span_end] for span_start, span_end in spans]
 
     @trace("knowledge_base_search")
     async def search(
@@ -388,8 +855,23 @@ class KnowledgeIngester:
             List of search results with documents and metadata
         """
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode(query).tolist()
+            # Generate query embedding off the event loop
+            query_vector = np.asarray(
+                await asyncio.to_thread(self.embedding_model.encode, query, convert_to_numpy=True),
+                dtype=np.float32,
+            )
+
+            # Serve near-duplicate queries from the result cache
+            cache_scope = (
+                n_results,
+                repr(sorted(filter_metadata.items())) if filter_metadata else None,
+            )
+            if self._query_cache is not None:
+                cached = self._query_cache.get(cache_scope, query_vector)
+                if cached is not None:
+                    return [dict(result) for result in cached]
+
+            query_embedding = query_vector.tolist()
 
             # Prepare where clause for filtering
             where_clause = None
@@ -417,6 +899,11 @@ class KnowledgeIngester:
                     }
                     formatted_results.append(result)
 
+            if self._query_cache is not None:
+                self._query_cache.put(
+                    cache_scope, query_vector, [dict(result) for result in formatted_results]
+                )
+
             return formatted_results
 
         except Exception as e:
@@ -434,33 +921,18 @@ class KnowledgeIngester:
             True if deletion was successful, False if document not found
         """
         try:
-            # Find all chunks for this document
-            self.logger.info(f"Attempting to delete document {document_id}")
-
-            # First, let's see what's in the collection
-            all_results = self.collection.get(include=["metadatas"], limit=10)
-            self.logger.info(
-                f"Sample collection contents: {len(all_results.get('metadatas', []))} items"
-            )
-            if all_results.get("metadatas"):
-                for i, meta in enumerate(all_results["metadatas"][:3]):
-                    self.logger.info(
-                        f"Sample item {i}: {meta.get('document_id', 'no_id')}"
-                    )
-
+            # Find all chunks for this document (IDs only, no metadata payload)
             results = self.collection.get(
-                where={"document_id": document_id}, include=["metadatas"]
+                where={"document_id": document_id}, include=[]
             )
-
-            # ChromaDB returns IDs by default in results
             chunk_ids = results.get("ids", [])
-            self.logger.info(
-                f"Query results for {document_id}: found {len(chunk_ids)} chunk IDs"
-            )
 
             if chunk_ids and len(chunk_ids) > 0:
                 # Delete all chunks
                 self.collection.delete(ids=chunk_ids)
+                self._stats.remove_document(document_id)
+                if self._query_cache is not None:
+                    self._query_cache.clear()
                 self.logger.info(
                     f"Deleted {len(chunk_ids)} chunks for document {document_id}"
                 )
@@ -473,6 +945,12 @@ class KnowledgeIngester:
             self.logger.error(f"Failed to delete document {document_id}: {e}")
             return False
 
+    def close(self) -> None:
+        """Release worker processes and caches (call on shutdown)"""
+        shutdown_pdf_pool()
+        if self.embed_cache is not None:
+            self.embed_cache.close()
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the knowledge base collection
@@ -483,30 +961,14 @@ class KnowledgeIngester:
         try:
             count = self.collection.count()
 
-            # Get sample of documents to analyze
-            sample = self.collection.get(limit=1000, include=["metadatas"])
-
-            # Analyze document types
-            doc_types = {}
-            tags = {}
-
-            if sample["metadatas"]:
-                for metadata in sample["metadatas"]:
-                    doc_type = metadata.get("document_type", "unknown")
-                    doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
-
-                    tag_list = metadata.get("tags", "").split(",")
-                    for tag in tag_list:
-                        tag = tag.strip()
-                        if tag:
-                            tags[tag] = tags.get(tag, 0) + 1
+            # Per-chunk counts maintained on store/delete, most common first
+            doc_types = self._stats.counts("doc_type")
+            tags = self._stats.counts("tag")
 
             return {
                 "total_chunks": count,
                 "document_types": doc_types,
-                "top_tags": dict(
-                    sorted(tags.items(), key=lambda x: x[1], reverse=True)[:10]
-                ),
+                "top_tags": dict(list(tags.items())[:10]),
                 "collection_name": self.collection.name,
             }
 
@@ -514,6 +976,33 @@ class KnowledgeIngester:
             self.logger.error(f"Failed to get collection stats: {e}")
             return {}
 
+    def _iter_chunk_metadata(self, page_size: int = 1000):
+        """Yield pages of chunk metadata covering the whole collection"""
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["metadatas"], limit=page_size, offset=offset
+            )
+            metadatas = page.get("metadatas") or []
+            if not metadatas:
+                return
+            yield metadatas
+            offset += len(metadatas)
+
+    def rebuild_stats(self) -> None:
+        """Recount collection stats from all chunk metadata in the collection.
+
+        Scans the whole collection; run it after other processes have
+        written the collection, since stats only track this ingester's writes.
+        """
+        self._stats.clear()
+        chunk_count = 0
+        for metadatas in self._iter_chunk_metadata():
+            self._stats.add_chunks(metadatas)
+            chunk_count += len(metadatas)
+
+        self.logger.info(f"Rebuilt collection stats from {chunk_count} chunks")
+
     async def ingest_document_object(
         self,
         document: KnowledgeBaseDocument,
@@ -549,6 +1038,34 @@ class KnowledgeIngester:
             self.logger.error(f"Failed to ingest document {document.title}: {e}")
             raise
 
+    async def ingest_documents_bulk(
+        self,
+        documents: List[KnowledgeBaseDocument],
+    ) -> List[str]:
+        """
+        Ingest several document objects with one batched embedding and store pass
+
+        Args:
+            documents: KnowledgeBaseDocument objects with content already loaded
+
+        Returns:
+            Job IDs for tracking, one per document
+        """
+        try:
+            self.logger.info(f"Starting bulk ingestion of {len(documents)} documents")
+
+            for document in documents:
+                document.content = self.sanitizer.sanitize(document.content)
+
+            await self._process_and_store_many(documents)
+
+            self.logger.info(f"Successfully ingested {len(documents)} documents")
+            return [f"job_{document.document_id}" for document in documents]
+
+        except Exception as e:
+            self.logger.error(f"Failed bulk ingestion of {len(documents)} documents: {e}")
+            raise
+
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the status of an ingestion job
@@ -659,12 +1176,21 @@ class KnowledgeIngester:
             if not results["documents"] or not results["documents"]:
                 return None
 
-            # Reconstruct document from chunks
+            # Reconstruct document from chunks; ChromaDB does not return them
+            # in chunk order
             chunks = results["documents"]
-            metadata = results["metadatas"][0] if results["metadatas"] else {}
+            metadatas = results["metadatas"] or [{}] * len(chunks)
+            metadata = metadatas[0]
+            ordered_chunks = [
+                chunk
+                for _, chunk in sorted(
+                    zip((m.get("chunk_index", 0) for m in metadatas), chunks),
+                    key=lambda pair: pair[0],
+                )
+            ]
 
             # Combine all chunks to reconstruct content
-            content = " ".join(chunks)
+            content = " ".join(ordered_chunks)
 
             doc = KnowledgeBaseDocument(
                 document_id=document_id,
@@ -1,22 +1,42 @@
 """Semantic search business logic."""
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
-from ..infrastructure.vectordb import VectorDBProvider
-from ..infrastructure.vectordb.embeddings import EmbeddingGenerator
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+from ..infrastructure.vectordb import VectorDBProvider, content_snippet, tag_metadata_key
+from ..infrastructure.vectordb.embeddings import (
+    BatchingEmbedder,
+    EmbeddingCache,
+    EmbeddingGenerator,
+)
 from ..infrastructure.database.client import DatabaseClient
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_tags(tags: str) -> Tuple[str, ...]:
+    """Parse a comma-joined tag string; tag strings repeat across results."""
+    return tuple(tag for tag in (t.strip() for t in tags.split(",")) if tag)
+
+
 class SearchManager:
     """Business logic for semantic search operations."""
 
+    # Query embeddings kept in the in-process LRU cache
+    EMBEDDING_CACHE_SIZE = 1024
+
     def __init__(
         self,
         db_client: DatabaseClient,
         vector_client: VectorDBProvider,
-        embedding_gen: EmbeddingGenerator
+        embedding_gen: EmbeddingGenerator,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        batching_embedder: Optional[BatchingEmbedder] = None
     ):
         """Initialize search manager.
 
@@ -24,10 +44,46 @@ class SearchManager:
             db_client: Database client for metadata
             vector_client: Vector database provider (deployment-neutral)
             embedding_gen: Embedding generator
+            embedding_cache: Optional shared (Redis) embedding cache
+            batching_embedder: Optional batching embedder over embedding_gen,
+                owned (and closed) by the caller; one is created if omitted
         """
         self.db = db_client
         self.vector_db = vector_client
         self.embeddings = embedding_gen
+        self.embedding_cache = embedding_cache
+
+        # Concurrent queries share one model forward pass
+        self._batching_embedder = batching_embedder or BatchingEmbedder(embedding_gen)
+
+        # Embeddings per (model name, text digest), LRU; stored read-only
+        self._embedding_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+
+    async def _embed_cached(self, text: str) -> np.ndarray:
+        """Embed text in a shared batch, reusing the embedding of recently seen identical
+        text from the in-process LRU, then from the shared cache"""
+        key = (
+            self.embeddings.model_name,
+            hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest(),
+        )
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+
+        shared = await self.embedding_cache.get(text) if self.embedding_cache else None
+        if shared is not None:
+            embedding = shared
+        else:
+            embedding = await self._batching_embedder.embed(text)
+            if self.embedding_cache:
+                await self.embedding_cache.set(text, embedding)
+
+        embedding.setflags(write=False)
+        self._embedding_cache[key] = embedding
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return embedding
 
     async def search(
         self, 
@@ -50,35 +106,27 @@ class SearchManager:
             List of search results with relevance scores
         """
         # Generate query embedding
-        query_embedding = self.embeddings.generate_embedding(query)
+        query_embedding = await self._embed_cached(query)
 
-        # Build metadata filters
-        where_filter = {"user_id": user_id}
+        # Build metadata filters; any of the requested tags matches
+        conditions = [{"user_id": user_id}]
         if document_type:
-            where_filter["document_type"] = document_type
-        # Note: Tag filtering done post-query for provider compatibility
+            conditions.append({"document_type": document_type})
+        if tags:
+            tag_conditions = [{tag_metadata_key(tag): True} for tag in tags]
+            conditions.append(
+                tag_conditions[0] if len(tag_conditions) == 1 else {"$or": tag_conditions}
+            )
+        where_filter = conditions[0] if len(conditions) == 1 else {"$and": conditions}
 
         # Search vector database using provider interface
         vector_results = await self.vector_db.search(
             collection_name="faultmaven_kb",
             query_vector=query_embedding,
-            limit=limit * 2,  # Get more results for tag filtering
+            limit=limit,
             filter=where_filter
         )
 
-        # Filter by tags if specified
-        if tags:
-            filtered_results = []
-            for result in vector_results:
-                result_tags = result.metadata.get("tags", "").split(",")
-                result_tags = [t.strip() for t in result_tags if t.strip()]
-                if any(tag in result_tags for tag in tags):
-                    filtered_results.append(result)
-            vector_results = filtered_results
-
-        # Limit to requested size
-        vector_results = vector_results[:limit]
-
         # Format results (SearchResult model is already normalized)
         search_results = []
         for result in vector_results:
@@ -86,9 +134,9 @@ class SearchManager:
                 "document_id": result.metadata["document_id"],
                 "title": result.metadata["title"],
                 "document_type": result.metadata["document_type"],
-                "tags": [t.strip() for t in result.metadata.get("tags", "").split(",") if t.strip()],
+                "tags": list(_parse_tags(result.metadata.get("tags", ""))),
                 "score": result.score,  # Already normalized 0-1 by provider
-                "snippet": result.content[:200] + "..." if len(result.content) > 200 else result.content
+                "snippet": result.metadata.get("snippet") or content_snippet(result.content)
             })
         
         logger.info(f"Search for '{query}' returned {len(search_results)} results")
@@ -108,13 +156,29 @@ class SearchManager:
             List of similar documents
         """
         # Get source document
-        source_doc = await self.db.get_document(document_id, user_id)
+        source_doc = await self.db.get_document(document_id, user_id, load_content=True)
         if not source_doc:
             return []
         
-        # Generate embedding for source document
+        # Generate embedding for source document, reusing the stored one
+        # while its content and the model are unchanged
         combined_text = f"{source_doc.title}\n\n{source_doc.content}"
-        query_embedding = self.embeddings.generate_embedding(combined_text)
+        content_sha256 = hashlib.sha256(combined_text.encode("utf-8")).hexdigest()
+        stored = await self.db.get_document_embedding(
+            document_id, content_sha256, self.embeddings.model_name
+        )
+        if stored is not None:
+            query_embedding = np.frombuffer(stored, dtype=np.float32)
+        else:
+            # Embedded exactly as DocumentManager embeds stored documents, so
+            # the query lives in the same space as the vectors it is compared to
+            query_embedding = await self.embeddings.agenerate_embedding(combined_text)
+            await self.db.save_document_embedding(
+                document_id,
+                content_sha256,
+                self.embeddings.model_name,
+                np.asarray(query_embedding, dtype=np.float32).tobytes()
+            )
         
         # Search for similar documents using provider interface
         where_filter = {"user_id": user_id}
@@ -133,9 +197,9 @@ class SearchManager:
                     "document_id": result.metadata["document_id"],
                     "title": result.metadata["title"],
                     "document_type": result.metadata["document_type"],
-                    "tags": [t.strip() for t in result.metadata.get("tags", "").split(",") if t.strip()],
+                    "tags": list(_parse_tags(result.metadata.get("tags", ""))),
                     "score": result.score,  # Already normalized 0-1 by provider
-                    "snippet": result.content[:200] + "..." if len(result.content) > 200 else result.content
+                    "snippet": result.metadata.get("snippet") or content_snippet(result.content)
                 })
         
         return search_results[:limit]
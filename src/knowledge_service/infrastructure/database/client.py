@@ -1,14 +1,25 @@
 """Database client for metadata storage."""
 
 import logging
-from typing import Optional, List
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import select, delete, text
+from sqlalchemy.orm import defer
+from sqlalchemy import select, delete, func, text, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from fm_core_lib.utils import service_startup_retry
-from .models import Base, DocumentModel
+from .models import Base, DocumentEmbeddingModel, DocumentModel
 
 logger = logging.getLogger(__name__)
 
+# Connection ping, built once
+_PING = text("SELECT 1")
+
+# Session shared by all client calls inside request_session()
+_request_session: ContextVar[Optional[AsyncSession]] = ContextVar("request_session", default=None)
+
 
 class DatabaseClient:
     """Async database client for document metadata."""
@@ -19,11 +30,69 @@ class DatabaseClient:
         Args:
             database_url: SQLAlchemy database URL (e.g., sqlite+aiosqlite:///./db.sqlite)
         """
-        self.engine = create_async_engine(database_url, echo=False)
+        self.engine = create_async_engine(
+            database_url, echo=False, **self._engine_options(database_url)
+        )
         self.async_session = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
 
+    @asynccontextmanager
+    async def request_session(self) -> AsyncIterator[AsyncSession]:
+        """Share one session across every client call made in this context.
+
+        Used per HTTP request so N calls cost one pool checkout. Nested
+        scopes reuse the outer session. Calls sharing a session must not
+        run concurrently.
+        """
+        session = _request_session.get()
+        if session is not None:
+            yield session
+            return
+
+        async with self.async_session() as session:
+            token = _request_session.set(session)
+            try:
+                yield session
+            finally:
+                _request_session.reset(token)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """The request-scoped session if one is active, else a new session.
+
+        A call that raises rolls the shared session back, so later calls in
+        the same request do not run on a failed transaction.
+        """
+        session = _request_session.get()
+        if session is not None:
+            try:
+                yield session
+            except BaseException:
+                await session.rollback()
+                raise
+        else:
+            async with self.async_session() as session:
+                yield session
+
+    @staticmethod
+    def _engine_options(database_url: str) -> dict:
+        """Connection pool settings sized for concurrent request handling."""
+        url = make_url(database_url)
+        if url.get_backend_name() == "sqlite":
+            if url.database in (None, "", ":memory:"):
+                # One shared connection, or each session would see its own empty database
+                return {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
+            return {}
+
+        return {
+            "pool_size": 20,
+            "max_overflow": 40,
+            "pool_timeout": 10,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        }
+
     @service_startup_retry
     async def verify_connection(self):
         """Verify database connection with retry logic.
@@ -31,8 +100,8 @@ class DatabaseClient:
         This is called before migrations/table creation to ensure the database
         is ready. Retries with exponential backoff for K8s/scale-to-zero scenarios.
         """
-        async with self.engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+        async with self.engine.connect() as conn:
+            await conn.execute(_PING)
         logger.info("Database connection verified")
 
     async def initialize(self):
@@ -46,81 +115,154 @@ class DatabaseClient:
 
     async def create_document(self, document: DocumentModel) -> DocumentModel:
         """Create a new document."""
-        async with self.async_session() as session:
+        async with self._session() as session:
             session.add(document)
             await session.commit()
             await session.refresh(document)
             return document
 
-    async def get_document(self, document_id: str, user_id: str) -> Optional[DocumentModel]:
-        """Get document by ID (with user authorization check)."""
-        async with self.async_session() as session:
-            result = await session.execute(
-                select(DocumentModel).where(
-                    DocumentModel.document_id == document_id,
-                    DocumentModel.user_id == user_id
-                )
-            )
+    async def get_document(
+        self, document_id: str, user_id: str, load_content: bool = False
+    ) -> Optional[DocumentModel]:
+        """Get document by ID (with user authorization check).
+
+        Unless load_content is set, the heavy content and doc_metadata
+        columns are not fetched and must not be accessed on the result.
+        """
+        query = select(DocumentModel).where(
+            DocumentModel.document_id == document_id,
+            DocumentModel.user_id == user_id
+        )
+        if not load_content:
+            query = query.options(defer(DocumentModel.content), defer(DocumentModel.doc_metadata))
+
+        async with self._session() as session:
+            result = await session.execute(query)
             return result.scalar_one_or_none()
 
     async def list_documents(
         self, user_id: str, limit: int = 50, offset: int = 0, document_type: Optional[str] = None
     ) -> tuple[List[DocumentModel], int]:
         """List documents for a user with pagination."""
-        async with self.async_session() as session:
-            # Build query
-            query = select(DocumentModel).where(DocumentModel.user_id == user_id)
+        async with self._session() as session:
+            # Build filters
+            filters = [DocumentModel.user_id == user_id]
             if document_type:
-                query = query.where(DocumentModel.document_type == document_type)
+                filters.append(DocumentModel.document_type == document_type)
             
-            # Get total count
-            count_query = select(DocumentModel.document_id).where(DocumentModel.user_id == user_id)
-            if document_type:
-                count_query = count_query.where(DocumentModel.document_type == document_type)
-            count_result = await session.execute(count_query)
-            total_count = len(count_result.all())
+            # Get paginated results, newest first (served by the composite
+            # indexes), with the total match count as a window column
+            query = (
+                select(DocumentModel, func.count().over().label("total"))
+                .where(*filters)
+                .order_by(DocumentModel.created_at.desc())
+                .limit(limit)
+                .offset(offset)
+            )
+            rows = (await session.execute(query)).all()
+            documents = [row[0] for row in rows]
             
-            # Get paginated results
-            query = query.limit(limit).offset(offset)
-            result = await session.execute(query)
-            documents = result.scalars().all()
+            if rows:
+                total_count = rows[0].total
+            elif offset > 0:
+                # Page past the end: no row carries the total, count separately
+                count_query = select(func.count()).select_from(DocumentModel).where(*filters)
+                total_count = (await session.execute(count_query)).scalar_one()
+            else:
+                total_count = 0
             
             return documents, total_count
 
+    async def iter_document_tags(
+        self, batch_size: int = 500
+    ) -> AsyncIterator[List[Tuple[str, List[str]]]]:
+        """Yield (embedding_id, tags) of every document, in pages ordered by document ID."""
+        last_document_id = None
+        while True:
+            query = (
+                select(DocumentModel.document_id, DocumentModel.embedding_id, DocumentModel.tags)
+                .order_by(DocumentModel.document_id)
+                .limit(batch_size)
+            )
+            if last_document_id is not None:
+                query = query.where(DocumentModel.document_id > last_document_id)
+
+            async with self._session() as session:
+                rows = (await session.execute(query)).all()
+            if not rows:
+                return
+
+            yield [(row.embedding_id, row.tags) for row in rows]
+            last_document_id = rows[-1].document_id
+
     async def update_document(self, document_id: str, user_id: str, **updates) -> Optional[DocumentModel]:
-        """Update document metadata."""
-        async with self.async_session() as session:
+        """Update document metadata (single UPDATE ... RETURNING roundtrip)."""
+        values = {
+            key: value for key, value in updates.items()
+            if value is not None and hasattr(DocumentModel, key)
+        }
+        if not values:
+            return await self.get_document(document_id, user_id, load_content=True)
+
+        async with self._session() as session:
             result = await session.execute(
-                select(DocumentModel).where(
+                update(DocumentModel)
+                .where(
                     DocumentModel.document_id == document_id,
                     DocumentModel.user_id == user_id
                 )
+                .values(**values)
+                .returning(DocumentModel)
             )
             document = result.scalar_one_or_none()
-            
-            if not document:
-                return None
-            
-            for key, value in updates.items():
-                if hasattr(document, key) and value is not None:
-                    setattr(document, key, value)
-            
             await session.commit()
-            await session.refresh(document)
             return document
 
     async def delete_document(self, document_id: str, user_id: str) -> bool:
         """Delete document."""
-        async with self.async_session() as session:
+        async with self._session() as session:
             result = await session.execute(
                 delete(DocumentModel).where(
                     DocumentModel.document_id == document_id,
                     DocumentModel.user_id == user_id
                 )
             )
+            if result.rowcount > 0:
+                await session.execute(
+                    delete(DocumentEmbeddingModel).where(
+                        DocumentEmbeddingModel.document_id == document_id
+                    )
+                )
             await session.commit()
             return result.rowcount > 0
 
+    async def get_document_embedding(
+        self, document_id: str, content_sha256: str, model_name: str
+    ) -> Optional[bytes]:
+        """Get a cached document embedding if it matches the content hash and model."""
+        async with self._session() as session:
+            result = await session.execute(
+                select(DocumentEmbeddingModel.embedding).where(
+                    DocumentEmbeddingModel.document_id == document_id,
+                    DocumentEmbeddingModel.content_sha256 == content_sha256,
+                    DocumentEmbeddingModel.model_name == model_name
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def save_document_embedding(
+        self, document_id: str, content_sha256: str, model_name: str, embedding: bytes
+    ) -> None:
+        """Store (or replace) a document's cached embedding."""
+        async with self._session() as session:
+            await session.merge(DocumentEmbeddingModel(
+                document_id=document_id,
+                content_sha256=content_sha256,
+                model_name=model_name,
+                embedding=embedding
+            ))
+            await session.commit()
+
     async def close(self):
         """Close database connections."""
         await self.engine.dispose()
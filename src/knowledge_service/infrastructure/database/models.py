@@ -1,26 +1,54 @@
 """SQLAlchemy ORM models for document metadata."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Text, JSON
+from sqlalchemy import Column, String, DateTime, Text, JSON, Index, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# Binary, indexable JSONB on PostgreSQL; plain JSON elsewhere (e.g. SQLite)
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class DocumentModel(Base):
     """Document metadata stored in SQLite."""
     __tablename__ = "documents"
+    __table_args__ = (
+        # Listing filters by user (and optionally type) and pages newest first
+        Index("ix_docs_user_type_created", "user_id", "document_type", "created_at"),
+        Index("ix_docs_user_created", "user_id", "created_at"),
+        # Tag containment lookups (tags @> '["x"]'); PostgreSQL only
+        Index("ix_docs_tags_gin", "tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
 
     document_id = Column(String(36), primary_key=True)
-    user_id = Column(String(100), nullable=False, index=True)
+    user_id = Column(String(100), nullable=False)
     title = Column(String(500), nullable=False)
     content = Column(Text, nullable=False)
-    document_type = Column(String(50), nullable=False, index=True)
-    tags = Column(JSON, nullable=False, default=list)
-    doc_metadata = Column(JSON, nullable=False, default=dict)  # Renamed to avoid SQLAlchemy reserved word
+    document_type = Column(String(50), nullable=False)
+    tags = Column(JSONVariant, nullable=False, default=list)
+    # Renamed to avoid SQLAlchemy reserved word
+    doc_metadata = Column(JSONVariant, nullable=False, default=dict)
     embedding_id = Column(String(100), nullable=False, unique=True)
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     def __repr__(self):
         return f"<DocumentModel(document_id={self.document_id}, title={self.title})>"
+
+
+class DocumentEmbeddingModel(Base):
+    """Cached document embedding, valid while the content hash and model match."""
+    __tablename__ = "document_embeddings"
+
+    document_id = Column(String(36), primary_key=True)
+    content_sha256 = Column(String(64), nullable=False)
+    model_name = Column(String(200), nullable=False)
+    embedding = Column(LargeBinary, nullable=False)  # float32 bytes
+
+    def __repr__(self):
+        return (
+            f"<DocumentEmbeddingModel(document_id={self.document_id}, "
+            f"model_name={self.model_name})>"
+        )
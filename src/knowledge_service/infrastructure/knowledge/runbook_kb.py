@@ -12,9 +12,17 @@ Architecture Reference: docs/architecture/document-generation-and-closure-design
 Section 5.4.5: Dual-Source Runbook Architecture
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Literal, Optional, Tuple, Union
 from datetime import datetime, timezone
+import hashlib
+import json
 import logging
+import time
+
+import numpy as np
 
 from faultmaven.models.report import (
     CaseReport,
@@ -27,10 +35,30 @@ from faultmaven.models.report import (
 from faultmaven.infrastructure.persistence.chromadb_store import ChromaDBVectorStore
 from faultmaven.infrastructure.base_client import BaseExternalClient
 
+from ..vectordb import tag_metadata_key
+
 
 logger = logging.getLogger(__name__)
 
 
+def _split_tags(tags: Optional[str]) -> List[str]:
+    """Tags list from the comma-joined ``tags`` metadata field"""
+    return tags.split(",") if tags else []
+
+
+@dataclass(slots=True)
+class RunbookHit:
+    """Lightweight runbook search hit: stored metadata scalars, no content or pydantic models"""
+    report_id: str
+    similarity_score: float
+    title: str
+    case_id: str
+    case_title: str
+    domain: str
+    runbook_source: str
+    tags: List[str] = field(default_factory=list)
+
+
 class RunbookKnowledgeBase(BaseExternalClient):
     """
     Knowledge base for runbook similarity search.
@@ -44,6 +72,12 @@ class RunbookKnowledgeBase(BaseExternalClient):
 
     COLLECTION_NAME = "faultmaven_runbooks"
     MIN_SIMILARITY_THRESHOLD = 0.65  # Minimum 65% similarity
+    RESULT_CACHE_SIZE = 10_000  # Cached search_runbooks() results
+    RESULT_CACHE_TTL_SECONDS = 300.0
+    INDEX_BATCH_SIZE = 128  # Runbooks per vector store write
+    INDEX_BATCH_WAIT_SECONDS = 0.1  # Max wait for an index batch to fill
+    DUPLICATE_SIMILARITY_THRESHOLD = 0.9  # Document-derived runbook treated as duplicate
+    BACKFILL_PAGE_SIZE = 500  # Runbooks read per page by backfill_tag_metadata()
 
     def __init__(self, vector_store: ChromaDBVectorStore, embedding_model=None):
         """
@@ -64,6 +98,14 @@ class RunbookKnowledgeBase(BaseExternalClient):
         self.vector_store = vector_store
         self.embedding_model = embedding_model
 
+        # LRU of search results: key -> (expires_at, results). Cleared
+        # whenever a runbook is indexed so results never miss new runbooks
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, List[Any]]]" = OrderedDict()
+
+        # Pending index_runbook() records, written to the vector store in batches
+        self._index_queue: Optional[asyncio.Queue] = None
+        self._index_worker: Optional[asyncio.Task] = None
+
         logger.info(
             "RunbookKnowledgeBase initialized",
             extra={"collection": self.COLLECTION_NAME}
@@ -71,11 +113,12 @@ class RunbookKnowledgeBase(BaseExternalClient):
 
     async def search_runbooks(
         self,
-        query_embedding: List[float],
+        query_embedding: Union[np.ndarray, List[float]],
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 5,
         min_similarity: float = MIN_SIMILARITY_THRESHOLD,
-    ) -> List[SimilarRunbook]:
+        result_shape: Literal["full", "id_score", "metadata_only"] = "full",
+    ) -> Union[List[SimilarRunbook], List[Tuple[str, float]], List[RunbookHit]]:
         """
         Search for similar runbooks using semantic similarity.
 
@@ -84,21 +127,41 @@ class RunbookKnowledgeBase(BaseExternalClient):
 
         Args:
             query_embedding: Query embedding vector (1024-dim for BGE-M3)
-            filters: Optional metadata filters (domain, tags, etc.)
+            filters: Optional metadata filters (domain, tags - any of the given tags)
             top_k: Number of results to return (default 5)
             min_similarity: Minimum similarity threshold (default 0.65)
+            result_shape: "full" for SimilarRunbook objects, "id_score" for
+                (report_id, score) tuples, "metadata_only" for RunbookHit
+                records; the lighter shapes skip CaseReport construction
 
         Returns:
-            List of SimilarRunbook objects sorted by similarity score (descending)
+            Results in the requested shape, sorted by similarity score (descending)
         """
+        cache_key = self._result_cache_key(
+            query_embedding, filters, top_k, min_similarity, result_shape
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_runbooks = cached
+            if expires_at > time.monotonic():
+                self._result_cache.move_to_end(cache_key)
+                logger.debug("Runbook search served from result cache")
+                return list(cached_runbooks)
+            del self._result_cache[cache_key]
+
         async def _search_wrapper():
-            # Build ChromaDB where clause from filters
-            where_clause = {"report_type": "runbook"}
+            # Build ChromaDB where clause from filters; tags are matched on
+            # their per-tag boolean keys so filtering happens inside ChromaDB
+            conditions: List[Dict[str, Any]] = [{"report_type": "runbook"}]
             if filters:
                 if "domain" in filters:
-                    where_clause["domain"] = filters["domain"]
-                # Note: ChromaDB doesn't support array filtering directly for tags
-                # Tags will be filtered post-query if needed
+                    conditions.append({"domain": filters["domain"]})
+                if filters.get("tags"):
+                    tag_conditions = [{tag_metadata_key(tag): True} for tag in filters["tags"]]
+                    conditions.append(
+                        tag_conditions[0] if len(tag_conditions) == 1 else {"$or": tag_conditions}
+                    )
+            where_clause = conditions[0] if len(conditions) == 1 else {"$and": conditions}
 
             # Query vector database
             try:
@@ -117,6 +180,7 @@ class RunbookKnowledgeBase(BaseExternalClient):
 
             if not results or "ids" not in results or not results["ids"]:
                 logger.debug("No runbooks found matching query")
+                self._cache_results(cache_key, similar_runbooks)
                 return similar_runbooks
 
             # ChromaDB returns nested lists: [[id1, id2, ...]]
@@ -125,18 +189,60 @@ class RunbookKnowledgeBase(BaseExternalClient):
             metadatas_list = results["metadatas"][0] if results.get("metadatas") else []
             documents_list = results["documents"][0] if results.get("documents") else []
 
-            for i, report_id in enumerate(ids_list):
-                # Convert distance to similarity score (ChromaDB uses L2 distance)
-                # For cosine similarity: similarity = 1 - distance
-                # Assuming normalized embeddings, so distance ≈ 2(1-similarity)
-                distance = distances_list[i] if i < len(distances_list) else 1.0
-                similarity = max(0.0, 1.0 - (distance / 2.0))
-
-                if similarity < min_similarity:
-                    continue
-
-                metadata = metadatas_list[i] if i < len(metadatas_list) else {}
-                content = documents_list[i] if i < len(documents_list) else ""
+            # Convert distances to similarity scores for all candidates at once
+            # (ChromaDB uses L2 distance; for normalized embeddings
+            # distance ≈ 2(1-similarity)), drop those below the threshold and
+            # order the survivors by similarity descending
+            distances = np.ones(len(ids_list), dtype=np.float64)
+            distances[:len(distances_list)] = distances_list[:len(ids_list)]
+            similarities = np.maximum(0.0, 1.0 - distances * 0.5)
+
+            keep = np.flatnonzero(similarities >= min_similarity)
+            keep = keep[np.argsort(-similarities[keep], kind="stable")]
+
+            # Pad missing metadata/documents once instead of bounds-checking per row
+            metadatas_list = list(metadatas_list) + [{}] * (len(ids_list) - len(metadatas_list))
+            documents_list = list(documents_list) + [""] * (len(ids_list) - len(documents_list))
+
+            if result_shape == "id_score":
+                id_scores = [
+                    (ids_list[i], similarity)
+                    for i, similarity in zip(keep.tolist(), similarities[keep].tolist())
+                ]
+                self._cache_results(cache_key, id_scores)
+                return id_scores
+
+            if result_shape == "metadata_only":
+                hits = []
+                for i, similarity in zip(keep.tolist(), similarities[keep].tolist()):
+                    metadata = metadatas_list[i]
+                    hits.append(RunbookHit(
+                        report_id=ids_list[i],
+                        similarity_score=similarity,
+                        title=metadata.get("title", "Untitled Runbook"),
+                        case_id=metadata.get("case_id", "unknown"),
+                        case_title=metadata.get("case_title", "Unknown"),
+                        domain=metadata.get("domain", "general"),
+                        runbook_source=metadata.get("runbook_source", "incident_driven"),
+                        tags=_split_tags(metadata.get("tags")),
+                    ))
+                self._cache_results(cache_key, hits)
+                return hits
+
+            # Fallback generated_at for runbooks stored without created_at,
+            # only computed (once) if such a runbook is hit
+            default_generated_at = None
+
+            for i, similarity in zip(keep.tolist(), similarities[keep].tolist()):
+                report_id = ids_list[i]
+                metadata = metadatas_list[i]
+                content = documents_list[i]
+
+                generated_at = metadata.get("created_at")
+                if generated_at is None:
+                    if default_generated_at is None:
+                        default_generated_at = to_json_compatible(datetime.now(timezone.utc))
+                    generated_at = default_generated_at
 
                 # Reconstruct CaseReport from stored data
                 try:
@@ -148,7 +254,7 @@ class RunbookKnowledgeBase(BaseExternalClient):
                         content=content,
                         format="markdown",
                         generation_status=ReportStatus.COMPLETED,
-                        generated_at=metadata.get("created_at", to_json_compatible(datetime.now(timezone.utc))),
+                        generated_at=generated_at,
                         generation_time_ms=0,  # Not stored for indexed runbooks
                         is_current=True,
                         version=1,
@@ -156,7 +262,7 @@ class RunbookKnowledgeBase(BaseExternalClient):
                         metadata=RunbookMetadata(
                             source=RunbookSource(metadata.get("runbook_source", "incident_driven")),
                             domain=metadata.get("domain", "general"),
-                            tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
+                            tags=_split_tags(metadata.get("tags")),
                             document_title=metadata.get("document_title"),
                             case_context=None,  # Not reconstructed from search
                         )
@@ -175,9 +281,6 @@ class RunbookKnowledgeBase(BaseExternalClient):
                     logger.warning(f"Failed to reconstruct runbook {report_id}: {e}")
                     continue
 
-            # Sort by similarity score descending
-            similar_runbooks.sort(key=lambda x: x.similarity_score, reverse=True)
-
             logger.info(
                 f"Found {len(similar_runbooks)} similar runbooks",
                 extra={
@@ -186,6 +289,7 @@ class RunbookKnowledgeBase(BaseExternalClient):
                 }
             )
 
+            self._cache_results(cache_key, similar_runbooks)
             return similar_runbooks
 
         return await self.call_external(
@@ -195,6 +299,33 @@ class RunbookKnowledgeBase(BaseExternalClient):
             retries=2
         )
 
+    @staticmethod
+    def _result_cache_key(
+        query_embedding: Union[np.ndarray, List[float]],
+        filters: Optional[Dict[str, Any]],
+        top_k: int,
+        min_similarity: float,
+        result_shape: str,
+    ) -> Tuple:
+        """Cache key: 64-bit hash of the float32 query vector plus search parameters"""
+        vector_bytes = np.ascontiguousarray(query_embedding, dtype=np.float32).tobytes()
+        return (
+            hashlib.blake2b(vector_bytes, digest_size=8).digest(),
+            json.dumps(filters, sort_keys=True, default=str),
+            top_k,
+            round(min_similarity, 3),
+            result_shape,
+        )
+
+    def _cache_results(self, cache_key: Tuple, similar_runbooks: List[Any]) -> None:
+        self._result_cache[cache_key] = (
+            time.monotonic() + self.RESULT_CACHE_TTL_SECONDS,
+            list(similar_runbooks),
+        )
+        self._result_cache.move_to_end(cache_key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
     async def index_runbook(
         self,
         runbook: CaseReport,
@@ -202,6 +333,7 @@ class RunbookKnowledgeBase(BaseExternalClient):
         case_title: Optional[str] = None,
         domain: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        embedding: Optional[Union[np.ndarray, List[float]]] = None,
     ) -> None:
         """
         Index runbook for future similarity search.
@@ -218,68 +350,181 @@ class RunbookKnowledgeBase(BaseExternalClient):
             case_title: Title of case or document (optional, will use runbook.title)
             domain: Technology domain (optional, will use from runbook.metadata)
             tags: Classification tags (optional, will use from runbook.metadata)
+            embedding: Precomputed content embedding (optional); stored as-is
+                so the vector store does not embed the content again
         """
         if runbook.report_type != ReportType.RUNBOOK:
             logger.warning(f"Attempted to index non-runbook report type: {runbook.report_type}")
             return
 
-        async def _index_wrapper():
-            # Extract metadata
-            metadata_obj = runbook.metadata
-            final_domain = domain or (metadata_obj.domain if metadata_obj else "general")
-            final_tags = tags or (metadata_obj.tags if metadata_obj else [])
-            final_case_title = case_title or runbook.title
+        # Extract metadata
+        metadata_obj = runbook.metadata
+        final_domain = domain or (metadata_obj.domain if metadata_obj else "general")
+        final_tags = tags or (metadata_obj.tags if metadata_obj else [])
+        final_case_title = case_title or runbook.title
+
+        # Build metadata dict for ChromaDB
+        chroma_metadata = {
+            "report_id": runbook.report_id,
+            "case_id": runbook.case_id,
+            "case_title": final_case_title,
+            "title": runbook.title,
+            "report_type": "runbook",
+            "runbook_source": source.value,
+            "domain": final_domain,
+            "tags": ",".join(final_tags),  # ChromaDB stores as string
+            "created_at": runbook.generated_at,
+            **{tag_metadata_key(tag): True for tag in final_tags},
+        }
+
+        # Add source-specific metadata
+        if source == RunbookSource.DOCUMENT_DRIVEN and metadata_obj:
+            if metadata_obj.document_title:
+                chroma_metadata["document_title"] = metadata_obj.document_title
+            if metadata_obj.original_document_id:
+                chroma_metadata["original_document_id"] = metadata_obj.original_document_id
+
+        # Create embedding for runbook content
+        # Note: Embedding generation should use same model as knowledge base (BGE-M3)
+        # For now, we rely on ChromaDB's built-in embedding (sentence-transformers)
+        # In production, should use explicit BGE-M3 model
+        document = {
+            "id": runbook.report_id,
+            "content": runbook.content,
+            "metadata": chroma_metadata
+        }
+        if embedding is not None:
+            document["embedding"] = np.asarray(embedding, dtype=np.float32)
+
+        # Add to vector store as part of the next batch
+        await self._enqueue_index(document)
 
-            # Build metadata dict for ChromaDB
-            chroma_metadata = {
+        logger.info(
+            f"Indexed runbook for similarity search",
+            extra={
                 "report_id": runbook.report_id,
-                "case_id": runbook.case_id,
-                "case_title": final_case_title,
-                "title": runbook.title,
-                "report_type": "runbook",
-                "runbook_source": source.value,
+                "source": source.value,
                 "domain": final_domain,
-                "tags": ",".join(final_tags),  # ChromaDB stores as string
-                "created_at": runbook.generated_at,
+                "tags": final_tags
             }
+        )
 
-            # Add source-specific metadata
-            if source == RunbookSource.DOCUMENT_DRIVEN and metadata_obj:
-                if metadata_obj.document_title:
-                    chroma_metadata["document_title"] = metadata_obj.document_title
-                if metadata_obj.original_document_id:
-                    chroma_metadata["original_document_id"] = metadata_obj.original_document_id
+    async def _enqueue_index(self, document: Dict[str, Any]) -> None:
+        """Queue a runbook record and wait until its batch has been written"""
+        if self._index_worker is None or self._index_worker.done():
+            self._index_queue = asyncio.Queue()
+            self._index_worker = asyncio.create_task(self._run_index_batches())
 
-            # Create embedding for runbook content
-            # Note: Embedding generation should use same model as knowledge base (BGE-M3)
-            # For now, we rely on ChromaDB's built-in embedding (sentence-transformers)
-            # In production, should use explicit BGE-M3 model
+        future = asyncio.get_running_loop().create_future()
+        await self._index_queue.put((document, future))
+        await future
 
-            # Add to vector store
-            documents = [{
-                "id": runbook.report_id,
-                "content": runbook.content,
-                "metadata": chroma_metadata
-            }]
+    async def _run_index_batches(self) -> None:
+        """Write queued runbooks with one add_documents() call per batch.
 
-            await self.vector_store.add_documents(documents)
+        Collects up to INDEX_BATCH_SIZE records, waiting at most
+        INDEX_BATCH_WAIT_SECONDS after the first one.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[Dict[str, Any], asyncio.Future]] = [await self._index_queue.get()]
+            deadline = loop.time() + self.INDEX_BATCH_WAIT_SECONDS
+            while len(batch) < self.INDEX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._index_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
 
-            logger.info(
-                f"Indexed runbook for similarity search",
-                extra={
-                    "report_id": runbook.report_id,
-                    "source": source.value,
-                    "domain": final_domain,
-                    "tags": final_tags
-                }
+            # A report_id queued more than once keeps its latest record, since
+            # repeated IDs in one add_documents() call fail the whole batch
+            documents = list({document["id"]: document for document, _ in batch}.values())
+
+            async def _index_wrapper():
+                await self.vector_store.add_documents(documents)
+
+            try:
+                await self.call_external(
+                    operation_name="index_runbook",
+                    call_func=_index_wrapper,
+                    timeout=10.0,
+                    retries=2
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                # New runbooks can enter any cached top-k
+                self._result_cache.clear()
+                logger.debug(f"Wrote batch of {len(documents)} runbooks to vector store")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                for _ in batch:
+                    self._index_queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued runbook has been written (call on shutdown)"""
+        worker = self._index_worker
+        if self._index_queue is not None and worker is not None and not worker.done():
+            await self._index_queue.join()
+
+    async def backfill_tag_metadata(self) -> int:
+        """
+        Add per-tag metadata keys to runbooks indexed before tag filtering.
+
+        One-off migration: older records only carry the comma-joined "tags"
+        string, so tag-filtered searches never return them. Pages through
+        every runbook in the store's ChromaDB collection and merges the
+        tag keys into its metadata; embeddings and content are untouched.
+        Safe to re-run.
+
+        Returns:
+            Number of runbooks updated
+        """
+        collection = self.vector_store.collection
+        updated = 0
+        offset = 0
+        while True:
+            page = await asyncio.to_thread(
+                collection.get,
+                where={"report_type": "runbook"},
+                include=["metadatas"],
+                limit=self.BACKFILL_PAGE_SIZE,
+                offset=offset
             )
+            ids = page["ids"]
+            if not ids:
+                break
+            offset += len(ids)
+
+            update_ids = []
+            update_metadatas = []
+            for runbook_id, metadata in zip(ids, page["metadatas"]):
+                tags = _split_tags((metadata or {}).get("tags"))
+                if tags:
+                    update_ids.append(runbook_id)
+                    update_metadatas.append({tag_metadata_key(tag): True for tag in tags})
+
+            if update_ids:
+                await asyncio.to_thread(
+                    collection.update, ids=update_ids, metadatas=update_metadatas
+                )
+                updated += len(update_ids)
 
-        await self.call_external(
-            operation_name="index_runbook",
-            call_func=_index_wrapper,
-            timeout=10.0,
-            retries=2
+        if updated:
+            # Tag-filtered results cached before the backfill miss these runbooks
+            self._result_cache.clear()
+
+        logger.info(
+            "Backfilled runbook tag metadata",
+            extra={"updated_runbooks": updated}
         )
+        return updated
 
     async def index_document_derived_runbook(
         self,
@@ -303,10 +548,37 @@ class RunbookKnowledgeBase(BaseExternalClient):
             original_document_id: Optional reference to uploaded document
 
         Returns:
-            runbook_id for reference
+            runbook_id for reference (the existing runbook's id if a
+            near-duplicate is already indexed)
         """
         import uuid
 
+        # Embed the content once; the same vector is used for the duplicate
+        # check and stored with the runbook
+        embedding = None
+        if self.embedding_model is not None:
+            embedding = await asyncio.to_thread(
+                self.embedding_model.generate_embedding, runbook_content
+            )
+
+            duplicates = await self.search_runbooks(
+                embedding,
+                top_k=1,
+                min_similarity=self.DUPLICATE_SIMILARITY_THRESHOLD,
+                result_shape="id_score",
+            )
+            if duplicates:
+                existing_id, similarity = duplicates[0]
+                logger.info(
+                    "Skipped indexing duplicate document-derived runbook",
+                    extra={
+                        "existing_runbook_id": existing_id,
+                        "similarity": similarity,
+                        "document_title": document_title
+                    }
+                )
+                return existing_id
+
         # Create runbook record
         runbook_id = str(uuid.uuid4())
         runbook = CaseReport(
@@ -337,7 +609,8 @@ class RunbookKnowledgeBase(BaseExternalClient):
             source=RunbookSource.DOCUMENT_DRIVEN,
             case_title=document_title,
             domain=domain,
-            tags=tags
+            tags=tags,
+            embedding=embedding
         )
 
         logger.info(
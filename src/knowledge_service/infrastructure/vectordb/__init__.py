@@ -3,18 +3,23 @@
 Deployment-neutral vector database abstraction supporting:
 - ChromaDB (local/persistent for development and self-hosted)
 - Pinecone (managed cloud for enterprise scale)
+- FAISS (in-process index for single-replica deployments)
 """
 
 from .factory import get_vector_provider, reset_vector_provider
-from .provider import VectorDBProvider, SearchResult
+from .provider import VectorDBProvider, SearchResult, content_snippet, tag_metadata_key
 from .chroma_local import ChromaLocalProvider
 from .pinecone_provider import PineconeProvider
+from .faiss_provider import FaissProvider
 
 __all__ = [
     "get_vector_provider",
     "reset_vector_provider",
     "VectorDBProvider",
     "SearchResult",
+    "content_snippet",
+    "tag_metadata_key",
     "ChromaLocalProvider",
     "PineconeProvider",
+    "FaissProvider",
 ]
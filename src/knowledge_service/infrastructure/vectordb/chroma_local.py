@@ -5,16 +5,93 @@ Uses embedded ChromaDB with persistent disk storage.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from fm_core_lib.utils import service_startup_retry
 
-from .provider import VectorDBProvider, SearchResult
+from .provider import VectorDBProvider, SearchResult, Embedding
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_persistent_client(persist_directory: str) -> chromadb.ClientAPI:
+    """Process-wide ChromaDB client for a persist directory.
+
+    All ChromaDB users in the process share one client (and its SQLite
+    connection and loaded HNSW segments) instead of opening their own.
+    Failed attempts raise and are not cached, so startup retries work.
+    """
+    return chromadb.PersistentClient(
+        path=persist_directory,
+        settings=Settings(
+            anonymized_telemetry=False,
+            allow_reset=False
+        )
+    )
+
+
+def open_collection(
+    client: chromadb.ClientAPI,
+    name: str,
+    metadata: Dict[str, Any]
+) -> chromadb.Collection:
+    """Get a collection, creating it with ``metadata`` only if it does not exist.
+
+    get_or_create_collection() is deliberately not used: some ChromaDB 0.5
+    releases overwrite an existing collection's metadata with the metadata
+    passed in, while its HNSW index keeps the parameters it was built with.
+    """
+    try:
+        return client.get_collection(name=name)
+    except Exception:
+        logger.info(f"Collection '{name}' does not exist, creating it")
+
+    try:
+        return client.create_collection(name=name, metadata=metadata)
+    except Exception:
+        # Created concurrently by another process
+        return client.get_collection(name=name)
+
+
+def collection_hnsw_params(collection: chromadb.Collection) -> Dict[str, Any]:
+    """HNSW parameters of a collection, from its metadata.
+
+    ChromaDB keeps the "hnsw:*" keys a collection was created with in its
+    metadata. open_collection() only passes metadata at creation, so they
+    match the parameters the index was built with; keys absent from the
+    metadata use ChromaDB's defaults.
+    """
+    return {
+        key: value for key, value in (collection.metadata or {}).items()
+        if key.startswith("hnsw:")
+    }
+
+
+def similarity_scores(distances: List[float], space: str) -> np.ndarray:
+    """Convert ChromaDB distances for unit-length embeddings to 0-1 similarity scores.
+
+    Args:
+        distances: Distances returned by a collection query
+        space: The collection's "hnsw:space" ("l2", "ip" or "cosine")
+
+    Returns:
+        float64 array of similarity scores (higher is better)
+
+    Note:
+        "ip" and "cosine" distances are 1 - similarity. "l2" (ChromaDB's
+        default, used by collections created before inner product) is the
+        squared L2 distance, which is 2(1 - similarity) for unit vectors.
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    if space == "l2":
+        return np.clip(1.0 - distances / 2.0, 0.0, 1.0)
+    return np.clip(1.0 - distances, 0.0, 1.0)
+
+
 class ChromaLocalProvider(VectorDBProvider):
     """ChromaDB local provider with persistent storage.
 
@@ -29,6 +106,25 @@ class ChromaLocalProvider(VectorDBProvider):
         or a managed service like Pinecone.
     """
 
+    # HNSW index parameters applied only when a collection is created (see
+    # open_collection()); existing collections keep the parameters they were
+    # built with. ChromaDB persists the index alongside the collection, so it
+    # is not rebuilt on process start. Graph parameters and the space cannot
+    # be changed after creation. Embeddings are unit length, so inner product is cosine
+    # similarity without the per-comparison norm work of l2.
+    #
+    # Recall/latency tradeoff: M=32 doubles graph links per node (more memory,
+    # slower inserts) so a query reaches its neighbours in fewer hops, and a
+    # high construction_ef builds a better graph once at insert time. That
+    # lets search_ef stay moderate (ChromaDB's default is 10, which loses
+    # recall at top_k > 10); per query the effective ef is max(search_ef, k).
+    HNSW_METADATA: Dict[str, Any] = {
+        "hnsw:space": "ip",
+        "hnsw:M": 32,
+        "hnsw:construction_ef": 200,
+        "hnsw:search_ef": 64,
+    }
+
     def __init__(self, persist_directory: str, collection_name: str):
         """Initialize ChromaDB local provider.
 
@@ -44,6 +140,11 @@ class ChromaLocalProvider(VectorDBProvider):
         self.client: Optional[chromadb.Client] = None
         self.collection: Optional[chromadb.Collection] = None
 
+        # Collection handles and index distance spaces by name, so calls
+        # skip the metadata lookup
+        self._collections: Dict[str, chromadb.Collection] = {}
+        self._spaces: Dict[str, str] = {}
+
         logger.info(
             f"ChromaDB local provider created "
             f"(persist_dir={persist_directory}, collection={collection_name})"
@@ -64,22 +165,16 @@ class ChromaLocalProvider(VectorDBProvider):
         logger.info(f"Initializing ChromaDB at {self.persist_directory}")
 
         try:
-            self.client = chromadb.PersistentClient(
-                path=self.persist_directory,
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=False
-                )
-            )
+            self.client = get_persistent_client(self.persist_directory)
 
             # Verify connection works
             self.client.heartbeat()
 
             # Get or create default collection
-            self.collection = self.client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"description": "FaultMaven Knowledge Base"}
+            self.collection = open_collection(
+                self.client, self.collection_name, self._new_collection_metadata()
             )
+            self._collections[self.collection_name] = self.collection
 
             logger.info(
                 f"ChromaDB initialized successfully: "
@@ -106,20 +201,47 @@ class ChromaLocalProvider(VectorDBProvider):
 
         Note:
             ChromaDB automatically creates collections on first use.
-            This method is idempotent.
+            This method is idempotent; metadata only applies to a collection
+            created here, an existing collection is left unchanged.
         """
         if not self.client:
             raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
 
-        collection_metadata = metadata or {}
+        collection = open_collection(self.client, name, self._new_collection_metadata(metadata))
+        self._collections[name] = collection
+
+        logger.info(f"Collection '{name}' ready (count={collection.count()})")
+
+    def _new_collection_metadata(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Metadata for a collection being created: HNSW parameters, description, overrides"""
+        collection_metadata = {**self.HNSW_METADATA, **(metadata or {})}
         collection_metadata.setdefault("description", "FaultMaven Knowledge Base")
+        return collection_metadata
 
-        collection = self.client.get_or_create_collection(
-            name=name,
-            metadata=collection_metadata
-        )
+    def _collection_space(self, name: str, collection: chromadb.Collection) -> str:
+        """Distance space of the collection's HNSW index (cached per name)"""
+        space = self._spaces.get(name)
+        if space is None:
+            index_params = collection_hnsw_params(collection)
+            # Collections created before the switch to inner product use l2
+            space = str(index_params.get("hnsw:space", "l2"))
+            self._spaces[name] = space
+        return space
 
-        logger.info(f"Collection '{name}' ready (count={collection.count()})")
+    def _get_collection(self, name: str, create: bool = False) -> chromadb.Collection:
+        """Get a cached collection handle, optionally creating the collection.
+
+        Raises:
+            Exception: ChromaDB's not-found error if it does not exist and create is False
+        """
+        collection = self._collections.get(name)
+        if collection is None:
+            if create:
+                collection = open_collection(self.client, name, self._new_collection_metadata())
+            else:
+                collection = self.client.get_collection(name=name)
+            self._collections[name] = collection
+        return collection
 
     async def upsert_vectors(
         self,
@@ -139,13 +261,18 @@ class ChromaLocalProvider(VectorDBProvider):
             raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
 
         # Get or create collection
-        collection = self.client.get_or_create_collection(name=collection_name)
-
-        # Extract components for ChromaDB API
-        ids = [v["id"] for v in vectors]
-        embeddings = [v["values"] for v in vectors]
-        documents = [v.get("content", "") for v in vectors]
-        metadatas = [v.get("metadata", {}) for v in vectors]
+        collection = self._get_collection(collection_name, create=True)
+
+        # Extract components for ChromaDB API in one pass; embeddings go in as a
+        # single (N, dim) float32 matrix, which ChromaDB uses without per-row
+        # list-to-array conversion
+        ids, values, documents, metadatas = (
+            list(column) for column in zip(*(
+                (v["id"], v["values"], v.get("content", ""), v.get("metadata", {}))
+                for v in vectors
+            ))
+        )
+        embeddings = np.asarray(values, dtype=np.float32)
 
         # Upsert to ChromaDB
         collection.upsert(
@@ -159,10 +286,37 @@ class ChromaLocalProvider(VectorDBProvider):
             f"Upserted {len(vectors)} vectors to collection '{collection_name}'"
         )
 
+    async def update_metadata(
+        self,
+        collection_name: str,
+        vector_id: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Patch metadata of an existing vector in ChromaDB.
+
+        Args:
+            collection_name: Target collection name
+            vector_id: ID of the vector to update
+            metadata: Metadata fields to set
+
+        Note:
+            ChromaDB's update merges the given keys into the stored metadata
+            and leaves the embedding and document untouched.
+        """
+        if not self.client:
+            raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
+
+        collection = self._get_collection(collection_name)
+        collection.update(ids=[vector_id], metadatas=[metadata])
+
+        logger.debug(
+            f"Updated metadata for vector '{vector_id}' in collection '{collection_name}'"
+        )
+
     async def search(
         self,
         collection_name: str,
-        query_vector: List[float],
+        query_vector: Embedding,
         limit: int = 10,
         filter: Optional[Dict[str, Any]] = None
     ) -> List[SearchResult]:
@@ -178,47 +332,79 @@ class ChromaLocalProvider(VectorDBProvider):
             List of search results ordered by relevance
 
         Note:
-            ChromaDB returns L2 distance. We convert to similarity score:
-            similarity = 1.0 - (distance / 2.0)
+            ChromaDB returns distances in the collection's space; they are
+            converted to similarity scores (see similarity_scores()).
+        """
+        batch_results = await self.search_batch(
+            collection_name, [query_vector], limit, filter
+        )
+        return batch_results[0]
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: Union[np.ndarray, List[Embedding]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[SearchResult]]:
+        """Perform several semantic searches in one ChromaDB query.
+
+        Args:
+            collection_name: Collection to search
+            query_vectors: Query embeddings
+            limit: Maximum number of results per query
+            filter: Optional metadata filters (where clause)
+
+        Returns:
+            One result list per query, in query order
         """
         if not self.client:
             raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
 
         # Get collection
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get_collection(collection_name)
         except Exception as e:
             logger.warning(f"Collection '{collection_name}' not found: {e}")
-            return []
+            return [[] for _ in query_vectors]
 
-        # Query ChromaDB
+        # Query ChromaDB; the HNSW index answers all queries in one pass
         results = collection.query(
-            query_embeddings=[query_vector],
+            query_embeddings=list(query_vectors),
             n_results=limit,
             where=filter,
             include=["documents", "metadatas", "distances"]
         )
 
+        space = self._collection_space(collection_name, collection)
+
         # Format results
-        search_results = []
-        if results["ids"] and results["ids"][0]:
-            for i in range(len(results["ids"][0])):
-                # Convert L2 distance to similarity score (0-1 range, higher is better)
-                distance = results["distances"][0][i]
-                similarity_score = max(0.0, min(1.0, 1.0 - (distance / 2.0)))
-
-                search_results.append(SearchResult(
-                    id=results["ids"][0][i],
+        batch_results = []
+        for ids, distances, documents, metadatas in zip(
+            results["ids"], results["distances"],
+            results["documents"], results["metadatas"]
+        ):
+            # Convert distances to similarity scores (0-1 range, higher is better)
+            scores = similarity_scores(distances, space).tolist()
+
+            batch_results.append([
+                SearchResult(
+                    id=vector_id,
                     score=similarity_score,
-                    content=results["documents"][0][i],
-                    metadata=results["metadatas"][0][i]
-                ))
+                    content=content,
+                    metadata=metadata
+                )
+                for vector_id, similarity_score, content, metadata in zip(
+                    ids, scores, documents, metadatas
+                )
+            ])
 
         logger.debug(
-            f"Search in '{collection_name}' returned {len(search_results)} results"
+            f"Search in '{collection_name}' ran {len(batch_results)} queries, "
+            f"returned {sum(len(r) for r in batch_results)} results"
         )
 
-        return search_results
+        return batch_results
 
     async def delete_vectors(
         self,
@@ -235,7 +421,7 @@ class ChromaLocalProvider(VectorDBProvider):
             raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
 
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get_collection(collection_name)
             collection.delete(ids=vector_ids)
             logger.debug(
                 f"Deleted {len(vector_ids)} vectors from '{collection_name}'"
@@ -257,7 +443,7 @@ class ChromaLocalProvider(VectorDBProvider):
             raise RuntimeError("ChromaDB not initialized. Call initialize() first.")
 
         try:
-            collection = self.client.get_collection(name=collection_name)
+            collection = self._get_collection(collection_name)
             return collection.count()
         except Exception:
             return 0
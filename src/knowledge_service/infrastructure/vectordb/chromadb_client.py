@@ -2,10 +2,16 @@
 
 import logging
 from typing import List, Dict, Any, Optional
-import chromadb
-from chromadb.config import Settings
+import numpy as np
 from fm_core_lib.utils import service_startup_retry
 
+from .chroma_local import (
+    collection_hnsw_params,
+    get_persistent_client,
+    open_collection,
+    similarity_scores,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +29,7 @@ class ChromaDBClient:
         self.collection_name = collection_name
         self.client = None
         self.collection = None
+        self.space = "l2"
 
         # Initialization happens in verify_and_initialize() for retry support
         logger.info(f"ChromaDB client created (will initialize on startup)")
@@ -35,25 +42,28 @@ class ChromaDBClient:
         might not be immediately available (K8s volume mounts, NFS delays, etc.).
         """
         logger.info(f"Initializing ChromaDB at {self.persist_directory}")
-        self.client = chromadb.PersistentClient(
-            path=self.persist_directory,
-            settings=Settings(anonymized_telemetry=False, allow_reset=False)
-        )
+        # Shared with ChromaLocalProvider when both use the same directory
+        self.client = get_persistent_client(self.persist_directory)
 
         # Verify connection works
         self.client.heartbeat()
 
         # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name=self.collection_name,
-            metadata={"description": "FaultMaven Knowledge Base"}
+        self.collection = open_collection(
+            self.client,
+            self.collection_name,
+            {"description": "FaultMaven Knowledge Base", "hnsw:space": "ip"}
+        )
+        # Collections created before the switch to inner product use l2
+        self.space = str(
+            collection_hnsw_params(self.collection).get("hnsw:space", "l2")
         )
         logger.info(f"ChromaDB collection '{self.collection_name}' ready")
 
     async def add_document(
         self, 
         embedding_id: str, 
-        embedding: List[float], 
+        embedding: np.ndarray,
         content: str,
         metadata: Dict[str, Any]
     ):
@@ -75,7 +85,7 @@ class ChromaDBClient:
 
     async def search(
         self, 
-        query_embedding: List[float], 
+        query_embedding: np.ndarray,
         limit: int = 10,
         where: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
@@ -99,13 +109,16 @@ class ChromaDBClient:
         # Format results
         formatted_results = []
         if results["ids"] and results["ids"][0]:
+            distances = results["distances"][0]
+            # Convert distance to similarity in the index's space
+            scores = similarity_scores(distances, self.space).tolist()
             for i in range(len(results["ids"][0])):
                 formatted_results.append({
                     "embedding_id": results["ids"][0][i],
                     "document": results["documents"][0][i],
                     "metadata": results["metadatas"][0][i],
-                    "distance": results["distances"][0][i],
-                    "similarity_score": 1.0 - (results["distances"][0][i] / 2.0)  # Convert distance to similarity
+                    "distance": distances[i],
+                    "similarity_score": scores[i]
                 })
         
         return formatted_results
@@ -122,7 +135,7 @@ class ChromaDBClient:
     async def update_document(
         self,
         embedding_id: str,
-        embedding: List[float],
+        embedding: np.ndarray,
         content: str,
         metadata: Dict[str, Any]
     ):
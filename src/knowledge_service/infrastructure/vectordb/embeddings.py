@@ -1,51 +1,256 @@
 """Embedding generation using sentence-transformers."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Redis import with graceful fallback
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
 
 class EmbeddingGenerator:
     """Generate embeddings using sentence-transformers."""
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: Optional[int] = None):
         """Initialize embedding generator.
         
         Args:
             model_name: Name of the sentence-transformer model
+            batch_size: Texts per forward pass (default: 256 on GPU, 32 on CPU)
+
+        Note:
+            On CUDA the model runs in FP16. Embeddings are L2-normalized at
+            encode time, so cosine similarity is a plain dot product.
+            The async methods run the model on one dedicated worker thread
+            (torch releases the GIL during the forward pass), so inference
+            never blocks the event loop or ties up the default executor.
         """
         self.model_name = model_name
-        logger.info(f"Loading embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name)
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.batch_size = batch_size or (256 if self.device == "cuda" else 32)
+
+        logger.info(f"Loading embedding model: {model_name} (device={self.device})")
+        model_kwargs = {"torch_dtype": torch.float16} if self.device == "cuda" else None
+        self.model = SentenceTransformer(model_name, device=self.device, model_kwargs=model_kwargs)
+
+        # One forward pass up front so the first request does not pay for
+        # lazy kernel/allocator initialization
+        self._encode(["warm-up"])
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
         logger.info(f"Embedding model loaded successfully")
 
-    def generate_embedding(self, text: str) -> List[float]:
+    def _encode(self, texts):
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32, copy=False)
+
+    def generate_embedding(self, text: str) -> np.ndarray:
         """Generate embedding for a single text.
         
         Args:
             text: Input text
             
         Returns:
-            Embedding vector as list of floats
+            Embedding vector as float32 array
         """
-        embedding = self.model.encode(text)
-        return embedding.tolist()
+        return self._encode(text)
 
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for multiple texts.
         
         Args:
             texts: List of input texts
             
         Returns:
-            List of embedding vectors
+            Float32 array of shape (len(texts), dimension)
         """
-        embeddings = self.model.encode(texts)
-        return [emb.tolist() for emb in embeddings]
+        return self._encode(texts)
+
+    async def agenerate_embedding(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text on the model worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._encode, text
+        )
+
+    async def agenerate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for multiple texts on the model worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._encode, texts
+        )
+
+    def close(self) -> None:
+        """Stop the model worker thread."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     @property
     def embedding_dimension(self) -> int:
         """Get the dimension of the embedding vectors."""
         return self.model.get_sentence_embedding_dimension()
+
+
+class BatchingEmbedder:
+    """Coalesce concurrent single-text embedding requests into batched model calls.
+
+    Requests are queued; a background task collects up to ``max_batch_size``
+    texts, waiting at most ``max_wait_seconds`` after the first one, and
+    embeds them with one ``agenerate_embeddings`` call off the event loop.
+    """
+
+    def __init__(
+        self,
+        generator: EmbeddingGenerator,
+        max_batch_size: int = 32,
+        max_wait_seconds: float = 0.005
+    ):
+        """Initialize batching embedder.
+
+        Args:
+            generator: Embedding generator used for the batched calls
+            max_batch_size: Maximum number of texts per model call
+            max_wait_seconds: Maximum time to wait for a batch to fill
+        """
+        self.generator = generator
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text as part of a batch.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Embedding vector as float32 array
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background batching task and cancel requests still queued."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.max_wait_seconds
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                texts = [text for text, _ in batch]
+                embeddings = await self.generator.agenerate_embeddings(texts)
+            except asyncio.CancelledError:
+                # Stopped mid-batch: release the callers already dequeued
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
+class EmbeddingCache:
+    """Fleet-wide embedding cache in Redis, shared by all service replicas.
+
+    Keys are ``emb:<model name>:f32:<BLAKE2b-128 of the text>``; values are
+    float32 vector bytes with a TTL, so a cached embedding is bit-identical
+    to a freshly computed one on every replica. Redis errors are logged and
+    treated as misses, so an unavailable cache never fails a request.
+    """
+
+    def __init__(self, redis_url: str, model_name: str, ttl_seconds: int = 86400):
+        """Initialize embedding cache.
+
+        Args:
+            redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
+            model_name: Embedding model name, part of every key
+            ttl_seconds: Entry lifetime
+
+        Raises:
+            ImportError: If redis library not installed
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError(
+                "Redis library not installed. "
+                "Install with: pip install redis"
+            )
+
+        self.model_name = model_name
+        self.ttl_seconds = ttl_seconds
+        self.redis = aioredis.from_url(redis_url)
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"emb:{self.model_name}:f32:{digest}"
+
+    async def get(self, text: str) -> Optional[np.ndarray]:
+        """Get the cached embedding for a text, if any."""
+        try:
+            raw = await self.redis.get(self._key(text))
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return None
+        return None if raw is None else np.frombuffer(raw, dtype=np.float32).copy()
+
+    async def set(self, text: str, embedding: np.ndarray) -> None:
+        """Store the embedding for a text."""
+        try:
+            await self.redis.setex(
+                self._key(text),
+                self.ttl_seconds,
+                np.asarray(embedding, dtype=np.float32).tobytes()
+            )
+        except Exception as e:
+            logger.warning(f"Embedding cache store failed: {e}")
+
+    async def close(self) -> None:
+        """Close Redis connections."""
+        await self.redis.aclose()
@@ -11,6 +11,7 @@ from typing import Optional
 from .provider import VectorDBProvider
 from .chroma_local import ChromaLocalProvider
 from .pinecone_provider import PineconeProvider, PINECONE_AVAILABLE
+from .faiss_provider import FaissProvider, FAISS_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +25,13 @@ def get_vector_provider() -> VectorDBProvider:
     Uses VECTOR_DB_PROVIDER environment variable to determine provider type:
     - "chroma" (default): Local/persistent ChromaDB
     - "pinecone": Managed Pinecone cloud service
+    - "faiss": In-process FAISS HNSW index (single replica)
 
     Returns:
-        VectorDBProvider instance (ChromaLocalProvider or PineconeProvider)
+        VectorDBProvider instance (ChromaLocalProvider, PineconeProvider or FaissProvider)
 
     Environment Variables:
-        VECTOR_DB_PROVIDER: "chroma" or "pinecone" (default: "chroma")
+        VECTOR_DB_PROVIDER: "chroma", "pinecone" or "faiss" (default: "chroma")
 
         For ChromaDB:
             CHROMA_PERSIST_DIR: Persistent storage directory (default: "./data/chroma")
@@ -41,6 +43,11 @@ def get_vector_provider() -> VectorDBProvider:
             PINECONE_INDEX_NAME: Index name (default: "faultmaven-kb")
             VECTOR_DIMENSION: Vector dimension (default: 384)
 
+        For FAISS:
+            FAISS_PERSIST_DIR: Index storage directory (default: "./data/faiss")
+            VECTOR_DIMENSION: Vector dimension (default: 384)
+            FAISS_QUANTIZE: Store vectors as int8 codes (default: false)
+
     Example:
         ```python
         # Self-hosted deployment (docker-compose)
@@ -116,10 +123,35 @@ def get_vector_provider() -> VectorDBProvider:
             f"collection={collection_name}"
         )
 
+    elif provider_type == "faiss":
+        # In-process FAISS for low-latency single-replica deployments
+        if not FAISS_AVAILABLE:
+            raise ImportError(
+                "FAISS library not installed. "
+                "Install with: pip install faiss-cpu"
+            )
+
+        persist_dir = os.getenv("FAISS_PERSIST_DIR", "./data/faiss")
+        dimension = int(os.getenv("VECTOR_DIMENSION", "384"))
+        quantize = os.getenv("FAISS_QUANTIZE", "false").lower() == "true"
+
+        _vector_provider_instance = FaissProvider(
+            persist_directory=persist_dir,
+            dimension=dimension,
+            quantize=quantize
+        )
+
+        logger.info(
+            f"FAISS provider initialized: "
+            f"persist_dir={persist_dir}, "
+            f"dimension={dimension}, "
+            f"quantize={quantize}"
+        )
+
     else:
         raise ValueError(
             f"Invalid VECTOR_DB_PROVIDER: {provider_type}. "
-            f"Must be 'chroma' or 'pinecone'"
+            f"Must be 'chroma', 'pinecone' or 'faiss'"
         )
 
     return _vector_provider_instance
@@ -0,0 +1,586 @@
+"""FAISS In-Process Provider
+
+In-process HNSW vector index for small/medium self-hosted deployments.
+Queries run in the service process (no network round trip) on SIMD-backed
+FAISS kernels; the index and its records are persisted to local disk.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from .provider import VectorDBProvider, SearchResult, Embedding
+
+logger = logging.getLogger(__name__)
+
+# Each collection's manifest names the index and records files of its
+# current version
+MANIFEST_SUFFIX = ".manifest.json"
+
+# FAISS import with graceful fallback
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+    logger.warning(
+        "FAISS library not installed. "
+        "Install with: pip install faiss-cpu"
+    )
+
+
+def _write_json(path: str, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class _FaissCollection:
+    """One HNSW index plus its records and metadata postings.
+
+    Vectors are L2-normalized and searched by inner product, so scores are
+    cosine similarities. FAISS labels are assigned sequentially; deleted or
+    replaced vectors are tombstoned (their records dropped) and excluded at
+    search time, and the index is rebuilt once tombstones outnumber live
+    vectors. Metadata filters are answered from an inverted index of
+    (key, value) -> labels.
+
+    With quantize=True vectors are stored as int8 codes (4x less memory)
+    instead of float32. Normalized vectors have every component in [-1, 1],
+    so the quantizer range is fixed and needs no training data.
+    """
+
+    # HNSW graph parameters
+    HNSW_M = 32
+    EF_CONSTRUCTION = 200
+    EF_SEARCH = 64
+
+    # Filtered candidate sets up to this size are scored exactly instead of
+    # walking the graph, so selective filters never come back short
+    EXACT_SEARCH_LIMIT = 2048
+
+    def __init__(self, dimension: int, quantize: bool = False):
+        self.dimension = dimension
+        self.quantize = quantize
+        self.index = self._new_index()
+        self.labels: Dict[str, int] = {}
+        self.records: Dict[int, Tuple[str, str, Dict[str, Any]]] = {}
+        self.postings: Dict[Tuple[str, Any], Set[int]] = {}
+        # Last saved version; 0 until the collection is first written
+        self.version = 0
+
+    def _new_index(self):
+        if self.quantize:
+            index = faiss.IndexHNSWSQ(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit_uniform,
+                self.HNSW_M, faiss.METRIC_INNER_PRODUCT
+            )
+            # Uniform range [vmin, vmin + vdiff] = [-1, 1] for unit vectors
+            storage = faiss.downcast_index(index.storage)
+            faiss.copy_array_to_vector(np.array([-1.0, 2.0], dtype=np.float32), storage.sq.trained)
+            storage.is_trained = True
+            index.is_trained = True
+        else:
+            index = faiss.IndexHNSWFlat(self.dimension, self.HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self.EF_CONSTRUCTION
+        return index
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def _index_record(
+        self, label: int, vector_id: str, content: str, metadata: Dict[str, Any]
+    ) -> None:
+        self.labels[vector_id] = label
+        self.records[label] = (vector_id, content, metadata)
+        for key, value in metadata.items():
+            self.postings.setdefault((key, value), set()).add(label)
+
+    def _unindex_record(self, label: int) -> None:
+        vector_id, _, metadata = self.records.pop(label)
+        del self.labels[vector_id]
+        for key, value in metadata.items():
+            posting = self.postings.get((key, value))
+            if posting is not None:
+                posting.discard(label)
+                if not posting:
+                    del self.postings[(key, value)]
+
+    def upsert(self, vectors: List[Dict[str, Any]]) -> None:
+        # An ID repeated within the batch keeps its last record; adding every
+        # copy would leave the earlier labels as untracked ghosts in the index
+        vectors = list({v["id"]: v for v in vectors}.values())
+        for v in vectors:
+            label = self.labels.get(v["id"])
+            if label is not None:
+                self._unindex_record(label)
+
+        start = self.index.ntotal
+        self.index.add(self._normalize(np.array([v["values"] for v in vectors])))
+        for offset, v in enumerate(vectors):
+            self._index_record(
+                start + offset, v["id"], v.get("content", ""), dict(v.get("metadata", {}))
+            )
+        self._maybe_compact()
+
+    def update_metadata(self, vector_id: str, metadata: Dict[str, Any]) -> None:
+        label = self.labels[vector_id]
+        _, content, current = self.records[label]
+        self._unindex_record(label)
+        self._index_record(label, vector_id, content, {**current, **metadata})
+
+    def delete(self, vector_ids: List[str]) -> None:
+        for vector_id in vector_ids:
+            label = self.labels.get(vector_id)
+            if label is not None:
+                self._unindex_record(label)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the index without tombstones once they outnumber live vectors"""
+        if self.index.ntotal - len(self.records) <= len(self.records):
+            return
+
+        live = sorted(self.records)
+        vectors = (
+            self.index.reconstruct_batch(np.array(live, dtype=np.int64))
+            if live else np.zeros((0, self.dimension), dtype=np.float32)
+        )
+        records = [self.records[label] for label in live]
+
+        self.index = self._new_index()
+        self.labels, self.records, self.postings = {}, {}, {}
+        if live:
+            self.index.add(vectors)
+        for label, (vector_id, content, metadata) in enumerate(records):
+            self._index_record(label, vector_id, content, metadata)
+
+    def _match(self, where: Dict[str, Any]) -> Set[int]:
+        """Labels whose metadata satisfies a Chroma/Pinecone-style where clause"""
+        matched: Optional[Set[int]] = None
+        for key, condition in where.items():
+            if key == "$and":
+                labels = set.intersection(*(self._match(clause) for clause in condition))
+            elif key == "$or":
+                labels = set().union(*(self._match(clause) for clause in condition))
+            elif isinstance(condition, dict):
+                labels = self._match_operators(key, condition)
+            else:
+                labels = set(self.postings.get((key, condition), ()))
+            matched = labels if matched is None else matched & labels
+        return matched if matched is not None else set(self.records)
+
+    def _match_operators(self, key: str, condition: Dict[str, Any]) -> Set[int]:
+        matched: Optional[Set[int]] = None
+        for operator, operand in condition.items():
+            if operator == "$eq":
+                labels = set(self.postings.get((key, operand), ()))
+            elif operator == "$in":
+                labels = set().union(*(self.postings.get((key, value), ()) for value in operand))
+            elif operator == "$ne":
+                labels = set(self.records) - self.postings.get((key, operand), set())
+            elif operator == "$nin":
+                labels = set(self.records).difference(
+                    *(self.postings.get((key, value), ()) for value in operand)
+                )
+            else:
+                raise ValueError(f"Unsupported filter operator for FAISS provider: {operator}")
+            matched = labels if matched is None else matched & labels
+        return matched if matched is not None else set(self.records)
+
+    def search(
+        self, query_vectors: np.ndarray, limit: int, where: Optional[Dict[str, Any]]
+    ) -> List[List[Tuple[int, float]]]:
+        """Top-``limit`` (label, score) hits for each row of ``query_vectors``.
+
+        Scores are cosine similarities clipped to the 0-1 range.
+        """
+        candidates = self._match(where) if where else None
+        if candidates is not None and not candidates:
+            return [[] for _ in query_vectors]
+
+        queries = self._normalize(query_vectors)
+
+        if candidates is not None and len(candidates) <= self.EXACT_SEARCH_LIMIT:
+            labels = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            # (queries x candidates) score matrix in one matrix product
+            scores = queries @ self.index.reconstruct_batch(labels).T
+            k = min(limit, len(labels))
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top, top_scores = (
+                np.take_along_axis(top, order, axis=1),
+                np.clip(np.take_along_axis(top_scores, order, axis=1), 0.0, 1.0),
+            )
+            return [
+                list(zip(labels[row].tolist(), row_scores))
+                for row, row_scores in zip(top, top_scores.tolist())
+            ]
+
+        if candidates is None and self.index.ntotal == len(self.records):
+            params = faiss.SearchParametersHNSW(efSearch=max(self.EF_SEARCH, limit))
+        else:
+            allowed = candidates if candidates is not None else self.records.keys()
+            selector = faiss.IDSelectorBatch(
+                np.fromiter(allowed, dtype=np.int64, count=len(allowed))
+            )
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=max(self.EF_SEARCH, limit))
+
+        k = min(limit, len(candidates) if candidates is not None else len(self.records))
+        if k == 0:
+            return [[] for _ in queries]
+        scores, labels = self.index.search(queries, k, params=params)
+        scores = np.clip(scores, 0.0, 1.0)
+        return [
+            [
+                (label, score)
+                for label, score in zip(row_labels, row_scores)
+                if label >= 0
+            ]
+            for row_labels, row_scores in zip(labels.tolist(), scores.tolist())
+        ]
+
+    def save(self, directory: str, name: str) -> None:
+        """Write a new version of the index and records, then publish it.
+
+        Both files are written under a fresh version number and the
+        ``<name>.manifest.json`` pointer is swapped to them with a single
+        atomic rename, so a crash at any point leaves the previous version
+        loadable as a matching pair. Files of the replaced version are
+        removed afterwards.
+        """
+        previous = self.version
+        version = previous + 1
+        index_file = f"{name}.{version}.faiss"
+        records_file = f"{name}.{version}.records.json"
+
+        faiss.write_index(self.index, os.path.join(directory, index_file))
+        _write_json(
+            os.path.join(directory, records_file),
+            [[label, *record] for label, record in self.records.items()],
+        )
+
+        manifest_path = os.path.join(directory, f"{name}{MANIFEST_SUFFIX}")
+        _write_json(
+            f"{manifest_path}.tmp",
+            {"version": version, "index": index_file, "records": records_file},
+        )
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+        self.version = version
+
+        if previous:
+            for stale in (f"{name}.{previous}.faiss", f"{name}.{previous}.records.json"):
+                try:
+                    os.remove(os.path.join(directory, stale))
+                except FileNotFoundError:
+                    pass
+
+    @classmethod
+    def load(cls, directory: str, name: str) -> "_FaissCollection":
+        """Load the version published in ``<name>.manifest.json``.
+
+        Raises:
+            ValueError: If the records reference labels the index does not hold
+        """
+        with open(os.path.join(directory, f"{name}{MANIFEST_SUFFIX}"), encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        index = faiss.read_index(os.path.join(directory, manifest["index"]))
+        collection = cls(index.d, quantize=isinstance(index, faiss.IndexHNSWSQ))
+        collection.index = index
+        collection.version = manifest["version"]
+        with open(os.path.join(directory, manifest["records"]), encoding="utf-8") as f:
+            for label, vector_id, content, metadata in json.load(f):
+                if not 0 <= label < index.ntotal or label in collection.records:
+                    raise ValueError(
+                        f"FAISS collection '{name}' records do not match its index "
+                        f"(label {label}, ntotal {index.ntotal})"
+                    )
+                collection._index_record(label, vector_id, content, metadata)
+        return collection
+
+
+class FaissProvider(VectorDBProvider):
+    """FAISS in-process vector database provider.
+
+    Deployment scenarios:
+    - Self-hosted single replica: lowest query latency, no extra service
+    - Development: No ChromaDB/Pinecone dependency
+
+    Note:
+        The index lives in process memory and is written to
+        persist_directory after every change, so it suits small/medium
+        corpora on a single replica. Use Pinecone or a Chroma server for
+        multi-replica deployments. Enable quantize to hold 4x more vectors
+        in the same memory at a small recall cost.
+    """
+
+    def __init__(self, persist_directory: str, dimension: int = 384, quantize: bool = False):
+        """Initialize FAISS provider.
+
+        Args:
+            persist_directory: Directory for index and record files
+            dimension: Vector dimension for new collections
+            quantize: Store new collections as int8 scalar-quantized vectors
+                (existing collections keep the format they were created with)
+
+        Raises:
+            ImportError: If faiss library not installed
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError(
+                "FAISS library not installed. "
+                "Install with: pip install faiss-cpu"
+            )
+
+        self.persist_directory = persist_directory
+        self.dimension = dimension
+        self.quantize = quantize
+        self.collections: Dict[str, _FaissCollection] = {}
+        self._initialized = False
+
+        # FAISS indexes are not safe for concurrent add and search
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"FAISS provider created "
+            f"(persist_dir={persist_directory}, dimension={dimension}, quantize={quantize})"
+        )
+
+    async def initialize(self) -> None:
+        """Load persisted collections from disk.
+
+        Raises:
+            ConnectionError: If the persist directory cannot be used
+        """
+        logger.info(f"Initializing FAISS at {self.persist_directory}")
+
+        try:
+            os.makedirs(self.persist_directory, exist_ok=True)
+            for file_name in os.listdir(self.persist_directory):
+                if file_name.endswith(MANIFEST_SUFFIX):
+                    name = file_name[: -len(MANIFEST_SUFFIX)]
+                    self.collections[name] = await asyncio.to_thread(
+                        _FaissCollection.load, self.persist_directory, name
+                    )
+
+            self._initialized = True
+            logger.info(
+                f"FAISS initialized successfully: "
+                f"collections={sorted(self.collections)}"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to initialize FAISS: {e}")
+            raise ConnectionError(f"FAISS initialization failed: {e}")
+
+    def _collection(self, name: str, dimension: Optional[int] = None) -> _FaissCollection:
+        if not self._initialized:
+            raise RuntimeError("FAISS not initialized. Call initialize() first.")
+
+        collection = self.collections.get(name)
+        if collection is None:
+            collection = _FaissCollection(dimension or self.dimension, self.quantize)
+            self.collections[name] = collection
+        return collection
+
+    def _write(self, name: str, change) -> None:
+        with self._lock:
+            change()
+            self.collections[name].save(self.persist_directory, name)
+
+    async def create_collection(
+        self,
+        name: str,
+        dimension: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Create or verify a collection exists.
+
+        Args:
+            name: Collection name
+            dimension: Vector dimension
+            metadata: Optional collection metadata (not used by FAISS)
+        """
+        collection = self._collection(name, dimension)
+        logger.info(f"Collection '{name}' ready (count={len(collection.records)})")
+
+    async def upsert_vectors(
+        self,
+        collection_name: str,
+        vectors: List[Dict[str, Any]]
+    ) -> None:
+        """Insert or update vectors in a FAISS collection.
+
+        Args:
+            collection_name: Target collection name
+            vectors: List of vector records with id, values, content, metadata
+        """
+        collection = self._collection(collection_name)
+        await asyncio.to_thread(
+            self._write, collection_name, lambda: collection.upsert(vectors)
+        )
+
+        logger.debug(
+            f"Upserted {len(vectors)} vectors to collection '{collection_name}'"
+        )
+
+    async def update_metadata(
+        self,
+        collection_name: str,
+        vector_id: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Patch metadata of an existing vector.
+
+        Args:
+            collection_name: Target collection name
+            vector_id: ID of the vector to update
+            metadata: Metadata fields to set
+        """
+        collection = self._collection(collection_name)
+        await asyncio.to_thread(
+            self._write,
+            collection_name,
+            lambda: collection.update_metadata(vector_id, metadata)
+        )
+
+        logger.debug(
+            f"Updated metadata for vector '{vector_id}' in collection '{collection_name}'"
+        )
+
+    async def search(
+        self,
+        collection_name: str,
+        query_vector: Embedding,
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[SearchResult]:
+        """Perform semantic search in process.
+
+        Args:
+            collection_name: Collection to search
+            query_vector: Query embedding
+            limit: Maximum number of results
+            filter: Optional metadata filters (Chroma/Pinecone where syntax:
+                equality, $eq, $ne, $in, $nin, $and, $or)
+
+        Returns:
+            List of search results ordered by relevance
+
+        Note:
+            Scores are cosine similarities clipped to the 0-1 range.
+        """
+        batch_results = await self.search_batch(
+            collection_name, [query_vector], limit, filter
+        )
+        return batch_results[0]
+
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: Union[np.ndarray, List[Embedding]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[SearchResult]]:
+        """Perform several semantic searches as one matrix search.
+
+        Args:
+            collection_name: Collection to search
+            query_vectors: Query embeddings
+            limit: Maximum number of results per query
+            filter: Optional metadata filters applied to every query
+
+        Returns:
+            One result list per query, in query order
+        """
+        if not self._initialized:
+            raise RuntimeError("FAISS not initialized. Call initialize() first.")
+
+        collection = self.collections.get(collection_name)
+        if collection is None:
+            logger.warning(f"Collection '{collection_name}' not found")
+            return [[] for _ in query_vectors]
+
+        def run_search():
+            with self._lock:
+                batch_hits = collection.search(np.array(query_vectors), limit, filter)
+                return [
+                    [(collection.records[label], score) for label, score in hits]
+                    for hits in batch_hits
+                ]
+
+        batch_hits = await asyncio.to_thread(run_search)
+
+        batch_results = [
+            [
+                SearchResult(
+                    id=vector_id,
+                    score=score,
+                    content=content,
+                    metadata=metadata
+                )
+                for (vector_id, content, metadata), score in hits
+            ]
+            for hits in batch_hits
+        ]
+
+        logger.debug(
+            f"Search in '{collection_name}' ran {len(batch_results)} queries, "
+            f"returned {sum(len(r) for r in batch_results)} results"
+        )
+
+        return batch_results
+
+    async def delete_vectors(
+        self,
+        collection_name: str,
+        vector_ids: List[str]
+    ) -> None:
+        """Delete vectors from a FAISS collection.
+
+        Args:
+            collection_name: Target collection name
+            vector_ids: List of vector IDs to delete
+        """
+        try:
+            collection = self._collection(collection_name)
+            await asyncio.to_thread(
+                self._write, collection_name, lambda: collection.delete(vector_ids)
+            )
+            logger.debug(
+                f"Deleted {len(vector_ids)} vectors from '{collection_name}'"
+            )
+        except Exception as e:
+            logger.error(f"Failed to delete vectors from '{collection_name}': {e}")
+            raise
+
+    async def get_collection_count(self, collection_name: str) -> int:
+        """Get the number of vectors in a collection.
+
+        Args:
+            collection_name: Collection to count
+
+        Returns:
+            Number of vectors in the collection
+        """
+        collection = self.collections.get(collection_name)
+        return len(collection.records) if collection is not None else 0
+
+    async def health_check(self) -> bool:
+        """Check if the FAISS provider is ready.
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        return self._initialized
@@ -6,9 +6,11 @@ Supports serverless indexes with automatic scaling.
 
 import logging
 from typing import List, Dict, Any, Optional
+
+import numpy as np
 from fm_core_lib.utils import service_startup_retry
 
-from .provider import VectorDBProvider, SearchResult
+from .provider import VectorDBProvider, SearchResult, Embedding
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +78,10 @@ class PineconeProvider(VectorDBProvider):
         self.client: Optional[Pinecone] = None
         self.index = None
 
+        # Index handles by name; each holds its own HTTP connection pool,
+        # so they are reused instead of recreated per call
+        self._indexes: Dict[str, Any] = {}
+
         logger.info(
             f"Pinecone provider created (env={environment}, index={index_name})"
         )
@@ -111,7 +117,7 @@ class PineconeProvider(VectorDBProvider):
                 )
 
             # Connect to index
-            self.index = self.client.Index(self.index_name)
+            self.index = self._get_index(self.index_name)
 
             # Verify connection
             stats = self.index.describe_index_stats()
@@ -125,6 +131,14 @@ class PineconeProvider(VectorDBProvider):
             logger.error(f"Failed to initialize Pinecone: {e}")
             raise ConnectionError(f"Pinecone initialization failed: {e}")
 
+    def _get_index(self, name: str):
+        """Get a cached index handle (keeps its keep-alive connections)."""
+        index = self._indexes.get(name)
+        if index is None:
+            index = self.client.Index(name)
+            self._indexes[name] = index
+        return index
+
     async def create_collection(
         self,
         name: str,
@@ -183,7 +197,7 @@ class PineconeProvider(VectorDBProvider):
             raise RuntimeError("Pinecone not initialized. Call initialize() first.")
 
         # Get index
-        index = self.client.Index(collection_name)
+        index = self._get_index(collection_name)
 
         # Format vectors for Pinecone
         pinecone_vectors = []
@@ -194,7 +208,8 @@ class PineconeProvider(VectorDBProvider):
 
             pinecone_vectors.append({
                 "id": v["id"],
-                "values": v["values"],
+                # Wire format is a float list
+                "values": np.asarray(v["values"], dtype=np.float32).tolist(),
                 "metadata": metadata
             })
 
@@ -205,10 +220,37 @@ class PineconeProvider(VectorDBProvider):
             f"Upserted {len(vectors)} vectors to index '{collection_name}'"
         )
 
+    async def update_metadata(
+        self,
+        collection_name: str,
+        vector_id: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Patch metadata of an existing vector in a Pinecone index.
+
+        Args:
+            collection_name: Target index name
+            vector_id: ID of the vector to update
+            metadata: Metadata fields to set
+
+        Note:
+            Pinecone's update with set_metadata merges the given keys
+            into the stored metadata without re-sending the vector values.
+        """
+        if not self.client:
+            raise RuntimeError("Pinecone not initialized. Call initialize() first.")
+
+        index = self._get_index(collection_name)
+        index.update(id=vector_id, set_metadata=metadata)
+
+        logger.debug(
+            f"Updated metadata for vector '{vector_id}' in index '{collection_name}'"
+        )
+
     async def search(
         self,
         collection_name: str,
-        query_vector: List[float],
+        query_vector: Embedding,
         limit: int = 10,
         filter: Optional[Dict[str, Any]] = None
     ) -> List[SearchResult]:
@@ -231,12 +273,12 @@ class PineconeProvider(VectorDBProvider):
             raise RuntimeError("Pinecone not initialized. Call initialize() first.")
 
         # Get index
-        index = self.client.Index(collection_name)
+        index = self._get_index(collection_name)
 
         # Query Pinecone
         try:
             results = index.query(
-                vector=query_vector,
+                vector=np.asarray(query_vector, dtype=np.float32).tolist(),
                 top_k=limit,
                 filter=filter,
                 include_metadata=True
@@ -280,7 +322,7 @@ class PineconeProvider(VectorDBProvider):
             raise RuntimeError("Pinecone not initialized. Call initialize() first.")
 
         try:
-            index = self.client.Index(collection_name)
+            index = self._get_index(collection_name)
             index.delete(ids=vector_ids)
             logger.debug(
                 f"Deleted {len(vector_ids)} vectors from '{collection_name}'"
@@ -302,7 +344,7 @@ class PineconeProvider(VectorDBProvider):
             raise RuntimeError("Pinecone not initialized. Call initialize() first.")
 
         try:
-            index = self.client.Index(collection_name)
+            index = self._get_index(collection_name)
             stats = index.describe_index_stats()
             return stats.total_vector_count
         except Exception:
@@ -9,9 +9,32 @@ Supports multiple backends:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+import numpy as np
 from pydantic import BaseModel
 
+# Embedding vectors are passed as float32 arrays; lists are still accepted
+Embedding = Union[np.ndarray, List[float]]
+
+
+# Length of the content preview returned with search results
+SNIPPET_LENGTH = 200
+
+
+def content_snippet(content: str) -> str:
+    """Search result preview of ``content``, stored in vector metadata as ``snippet``."""
+    return content[:SNIPPET_LENGTH] + "..." if len(content) > SNIPPET_LENGTH else content
+
+
+def tag_metadata_key(tag: str) -> str:
+    """Metadata key flagging a vector as carrying ``tag``.
+
+    Tags are stored as one boolean key per tag (``tag_<name>: True``) so
+    providers can filter on them natively with equality predicates.
+    """
+    return f"tag_{tag}"
+
 
 class SearchResult(BaseModel):
     """Vector search result with score and metadata."""
@@ -77,7 +100,7 @@ class VectorDBProvider(ABC):
             collection_name: Target collection name
             vectors: List of vector records, each containing:
                 - id (str): Unique identifier
-                - values (List[float]): Embedding vector
+                - values (Embedding): Embedding vector (float32 array or list)
                 - content (str): Original document content
                 - metadata (Dict[str, Any]): Document metadata
 
@@ -97,11 +120,31 @@ class VectorDBProvider(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_metadata(
+        self,
+        collection_name: str,
+        vector_id: str,
+        metadata: Dict[str, Any]
+    ) -> None:
+        """Patch metadata of an existing vector without touching its embedding.
+
+        Args:
+            collection_name: Target collection name
+            vector_id: ID of the vector to update
+            metadata: Metadata fields to set (merged into existing metadata)
+
+        Note:
+            Use this instead of upsert_vectors() when only metadata changed,
+            so no embedding needs to be regenerated.
+        """
+        pass
+
     @abstractmethod
     async def search(
         self,
         collection_name: str,
-        query_vector: List[float],
+        query_vector: Embedding,
         limit: int = 10,
         filter: Optional[Dict[str, Any]] = None
     ) -> List[SearchResult]:
@@ -124,6 +167,33 @@ class VectorDBProvider(ABC):
         """
         pass
 
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: Union[np.ndarray, List[Embedding]],
+        limit: int = 10,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[List[SearchResult]]:
+        """Perform several semantic searches with the same limit and filter.
+
+        Args:
+            collection_name: Collection to search
+            query_vectors: Query embeddings (2-D float32 array or list of vectors)
+            limit: Maximum number of results per query
+            filter: Optional metadata filters applied to every query
+
+        Returns:
+            One result list per query, in query order
+
+        Note:
+            The default runs search() once per query. Providers that can
+            score a query matrix in a single call override this.
+        """
+        return [
+            await self.search(collection_name, query_vector, limit, filter)
+            for query_vector in query_vectors
+        ]
+
     @abstractmethod
     async def delete_vectors(
         self,
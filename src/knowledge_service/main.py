@@ -8,7 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .config.settings import get_settings, Settings
 from .infrastructure.database.client import DatabaseClient
 from .infrastructure.vectordb import get_vector_provider, VectorDBProvider
-from .infrastructure.vectordb.embeddings import EmbeddingGenerator
+from .infrastructure.vectordb.embeddings import BatchingEmbedder, EmbeddingCache, EmbeddingGenerator
 from .core.document_manager import DocumentManager
 from .core.search_manager import SearchManager
 from .core.job_manager import JobManager
@@ -27,12 +27,14 @@ logger = logging.getLogger(__name__)
 db_client: DatabaseClient = None
 vector_client: VectorDBProvider = None
 embedding_gen: EmbeddingGenerator = None
+embedding_cache: EmbeddingCache = None
+batching_embedder: BatchingEmbedder = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
-    global db_client, vector_client, embedding_gen
+    global db_client, vector_client, embedding_gen, embedding_cache, batching_embedder
 
     settings = get_settings()
     logger.info(f"Starting {settings.service_name} v1.0.0")
@@ -53,8 +55,20 @@ async def lifespan(app: FastAPI):
         dimension=384  # all-MiniLM-L6-v2 dimension
     )
 
+    # Warm up the collection handle and its connections before the first search
+    await vector_client.get_collection_count(settings.chroma_collection_name)
+
     logger.info("Loading embedding model...")
     embedding_gen = EmbeddingGenerator(settings.embedding_model)
+    batching_embedder = BatchingEmbedder(embedding_gen)
+
+    if settings.embedding_cache_redis_url:
+        logger.info("Connecting shared embedding cache...")
+        embedding_cache = EmbeddingCache(
+            settings.embedding_cache_redis_url,
+            model_name=settings.embedding_model,
+            ttl_seconds=settings.embedding_cache_ttl_seconds
+        )
 
     logger.info(f"{settings.service_name} is ready")
 
@@ -63,9 +77,19 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("Shutting down...")
     await db_client.close()
+    if embedding_cache:
+        await embedding_cache.close()
+    await batching_embedder.close()
+    embedding_gen.close()
     logger.info("Shutdown complete")
 
 
+async def request_db_session():
+    """Share one database session across all DB calls of a request."""
+    async with db_client.request_session():
+        yield
+
+
 app = FastAPI(
     title="FM Knowledge Service",
     description="Microservice for knowledge base management with RAG",
@@ -84,9 +108,9 @@ app.add_middleware(
 
 
 # Include routers
-app.include_router(documents.router)
-app.include_router(search.router)
-app.include_router(knowledge_endpoints.router)
+app.include_router(documents.router, dependencies=[Depends(request_db_session)])
+app.include_router(search.router, dependencies=[Depends(request_db_session)])
+app.include_router(knowledge_endpoints.router, dependencies=[Depends(request_db_session)])
 
 
 # Set up managers after including routers
@@ -94,7 +118,9 @@ app.include_router(knowledge_endpoints.router)
 async def setup_managers():
     """Set up managers after startup."""
     doc_mgr = DocumentManager(db_client, vector_client, embedding_gen)
-    search_mgr = SearchManager(db_client, vector_client, embedding_gen)
+    search_mgr = SearchManager(
+        db_client, vector_client, embedding_gen, embedding_cache, batching_embedder
+    )
     job_mgr = JobManager()
     analytics_mgr = AnalyticsManager()
 
@@ -0,0 +1,128 @@
+"""Unit tests for DatabaseClient
+
+Runs against an in-memory SQLite database (aiosqlite).
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from knowledge_service.infrastructure.database.client import DatabaseClient
+from knowledge_service.infrastructure.database.models import DocumentModel
+
+
+def make_document(document_id: str, user_id: str = "user-1", **overrides) -> DocumentModel:
+    values = {
+        "document_id": document_id,
+        "user_id": user_id,
+        "title": f"Title {document_id}",
+        "content": f"Content {document_id}",
+        "document_type": "runbook",
+        "tags": ["a", "b"],
+        "doc_metadata": {},
+        "embedding_id": f"emb_{document_id}",
+    }
+    values.update(overrides)
+    return DocumentModel(**values)
+
+
+@pytest.fixture
+async def db():
+    client = DatabaseClient("sqlite+aiosqlite://")
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+@pytest.mark.unit
+class TestDatabaseClient:
+    """Test document CRUD, listing and request-scoped sessions"""
+
+    async def test_update_returns_updated_row(self, db):
+        """Update writes the given fields and returns the new values"""
+        await db.create_document(make_document("doc-1"))
+
+        updated = await db.update_document("doc-1", "user-1", title="New title", tags=["c"])
+
+        assert updated.title == "New title"
+        assert updated.tags == ["c"]
+        stored = await db.get_document("doc-1", "user-1", load_content=True)
+        assert stored.title == "New title"
+        assert stored.content == "Content doc-1"
+
+    async def test_update_checks_owner(self, db):
+        """Another user's document is neither returned nor modified"""
+        await db.create_document(make_document("doc-1"))
+
+        assert await db.update_document("doc-1", "user-2", title="Stolen") is None
+        stored = await db.get_document("doc-1", "user-1")
+        assert stored.title == "Title doc-1"
+
+    async def test_update_without_values_returns_current(self, db):
+        """An update with no applicable fields returns the stored document"""
+        await db.create_document(make_document("doc-1"))
+
+        current = await db.update_document("doc-1", "user-1", title=None, unknown="x")
+
+        assert current.title == "Title doc-1"
+
+    async def test_list_pages_newest_first_with_total(self, db):
+        """Listing is per user and type, newest first, with the total match count"""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(5):
+            created_at = start + timedelta(days=i)
+            await db.create_document(make_document(f"doc-{i}", created_at=created_at))
+        await db.create_document(make_document("other-type", document_type="guide"))
+        await db.create_document(make_document("other-user", user_id="user-2"))
+
+        documents, total = await db.list_documents(
+            "user-1", limit=2, offset=1, document_type="runbook"
+        )
+
+        assert [doc.document_id for doc in documents] == ["doc-3", "doc-2"]
+        assert total == 5
+
+    async def test_list_past_last_page_keeps_total(self, db):
+        """A page past the end is empty but still reports the total"""
+        for i in range(3):
+            await db.create_document(make_document(f"doc-{i}"))
+
+        documents, total = await db.list_documents("user-1", limit=10, offset=10)
+
+        assert documents == []
+        assert total == 3
+
+    async def test_request_session_is_shared(self, db):
+        """Calls inside request_session() reuse one session, nested scopes included"""
+        async with db.request_session() as session:
+            async with db._session() as inner:
+                assert inner is session
+            async with db.request_session() as nested:
+                assert nested is session
+
+        async with db._session() as outside:
+            assert outside is not session
+
+    async def test_request_session_rolls_back_failed_call(self, db):
+        """A failed call does not poison later calls in the same request"""
+        await db.create_document(make_document("doc-1"))
+
+        async with db.request_session():
+            with pytest.raises(Exception):
+                # Duplicate primary key
+                await db.create_document(make_document("doc-1", embedding_id="emb_other"))
+
+            document = await db.get_document("doc-1", "user-1")
+            assert document is not None
+
+    async def test_iter_document_tags_pages_all_documents(self, db):
+        """Every document's embedding ID and tags are yielded across pages"""
+        for i in range(5):
+            await db.create_document(make_document(f"doc-{i}", tags=[f"t{i}"]))
+
+        pages = [page async for page in db.iter_document_tags(batch_size=2)]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [row for page in pages for row in page] == [
+            (f"emb_doc-{i}", [f"t{i}"]) for i in range(5)
+        ]
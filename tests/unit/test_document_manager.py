@@ -0,0 +1,106 @@
+"""Unit tests for DocumentManager vector metadata handling
+
+Uses an in-memory SQLite database and an in-memory stand-in for the
+vector database provider.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from knowledge_service.core.document_manager import DocumentManager
+from knowledge_service.infrastructure.database.client import DatabaseClient
+from knowledge_service.models.document import DocumentCreate, DocumentUpdate
+
+
+class InMemoryVectorDB:
+    """Stores vector metadata; update_metadata merges keys like Chroma and Pinecone"""
+
+    def __init__(self):
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+        self.upserts = 0
+
+    async def upsert_vectors(self, collection_name: str, vectors: List[Dict[str, Any]]) -> None:
+        self.upserts += 1
+        for vector in vectors:
+            self.metadata[vector["id"]] = dict(vector["metadata"])
+
+    async def update_metadata(
+        self, collection_name: str, vector_id: str, metadata: Dict[str, Any]
+    ) -> None:
+        self.metadata[vector_id].update(metadata)
+
+
+class FixedEmbeddings:
+    async def agenerate_embedding(self, text: str) -> np.ndarray:
+        return np.ones(4, dtype=np.float32)
+
+
+@pytest.fixture
+async def db():
+    client = DatabaseClient("sqlite+aiosqlite://")
+    await client.initialize()
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def vector_db():
+    return InMemoryVectorDB()
+
+
+@pytest.fixture
+def manager(db, vector_db):
+    return DocumentManager(db, vector_db, FixedEmbeddings())
+
+
+def new_document(tags: List[str]) -> DocumentCreate:
+    return DocumentCreate(
+        title="Disk full", content="Clear /var/log", document_type="runbook", tags=tags
+    )
+
+
+@pytest.mark.unit
+class TestTagMetadata:
+    """Test the per-tag metadata keys used for tag filtering"""
+
+    async def test_create_sets_tag_keys(self, manager, vector_db):
+        """New vectors carry one boolean key per tag"""
+        document = await manager.create_document("user-1", new_document(["disk", "linux"]))
+
+        metadata = vector_db.metadata[document.embedding_id]
+        assert metadata["tag_disk"] is True
+        assert metadata["tag_linux"] is True
+        assert metadata["tags"] == "disk,linux"
+
+    @pytest.mark.parametrize("shared_session", [False, True])
+    async def test_tag_update_clears_removed_tags(self, db, manager, vector_db, shared_session):
+        """A metadata-only tag change clears dropped tags without re-embedding"""
+        document = await manager.create_document("user-1", new_document(["disk", "linux"]))
+
+        update = DocumentUpdate(tags=["disk", "storage"])
+        if shared_session:
+            async with db.request_session():
+                await manager.update_document(document.document_id, "user-1", update)
+        else:
+            await manager.update_document(document.document_id, "user-1", update)
+
+        metadata = vector_db.metadata[document.embedding_id]
+        assert metadata["tag_disk"] is True
+        assert metadata["tag_storage"] is True
+        assert metadata["tag_linux"] is False
+        assert metadata["tags"] == "disk,storage"
+        assert vector_db.upserts == 1
+
+    async def test_backfill_adds_missing_tag_keys(self, manager, vector_db):
+        """Vectors stored without tag keys get them from the database tags"""
+        document = await manager.create_document("user-1", new_document(["disk"]))
+        untagged = await manager.create_document("user-1", new_document([]))
+        vector_db.metadata[document.embedding_id].pop("tag_disk")
+
+        updated = await manager.backfill_tag_metadata(batch_size=1)
+
+        assert updated == 1
+        assert vector_db.metadata[document.embedding_id]["tag_disk"] is True
+        assert not any(key.startswith("tag_") for key in vector_db.metadata[untagged.embedding_id])
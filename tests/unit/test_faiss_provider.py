@@ -0,0 +1,172 @@
+"""Unit tests for the FAISS in-process provider"""
+
+import json
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from knowledge_service.infrastructure.vectordb.faiss_provider import FaissProvider  # noqa: E402
+
+DIMENSION = 8
+
+
+def unit_vectors(count: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((count, DIMENSION)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def records(vectors: np.ndarray, prefix: str = "v"):
+    return [
+        {
+            "id": f"{prefix}{i}",
+            "values": vector,
+            "content": f"content {i}",
+            "metadata": {"group": i % 3, "tag_even": i % 2 == 0},
+        }
+        for i, vector in enumerate(vectors)
+    ]
+
+
+@pytest.fixture
+async def provider(tmp_path):
+    faiss_provider = FaissProvider(str(tmp_path), dimension=DIMENSION)
+    await faiss_provider.initialize()
+    await faiss_provider.create_collection("kb", dimension=DIMENSION)
+    return faiss_provider
+
+
+@pytest.mark.unit
+class TestFaissProvider:
+    """Test filtering, upsert and compaction of FAISS collections"""
+
+    async def test_search_returns_exact_match_first(self, provider):
+        """A stored vector is its own nearest neighbour with score ~1"""
+        vectors = unit_vectors(50)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        results = await provider.search("kb", vectors[7], limit=3)
+
+        assert results[0].id == "v7"
+        assert results[0].score == pytest.approx(1.0, abs=1e-4)
+        assert all(0.0 <= result.score <= 1.0 for result in results)
+
+    @pytest.mark.parametrize("where, expected", [
+        ({"group": 1}, lambda i: i % 3 == 1),
+        ({"group": {"$in": [0, 2]}}, lambda i: i % 3 != 1),
+        ({"group": {"$ne": 0}}, lambda i: i % 3 != 0),
+        ({"$and": [{"group": 1}, {"tag_even": True}]}, lambda i: i % 3 == 1 and i % 2 == 0),
+        ({"$or": [{"group": 0}, {"tag_even": True}]}, lambda i: i % 3 == 0 or i % 2 == 0),
+    ])
+    async def test_filters(self, provider, where, expected):
+        """Filtered searches only return vectors matching the where clause"""
+        vectors = unit_vectors(60)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        results = await provider.search("kb", vectors[0], limit=60, filter=where)
+
+        assert {result.id for result in results} == {f"v{i}" for i in range(60) if expected(i)}
+
+    async def test_upsert_replaces_vector_and_metadata(self, provider):
+        """Upserting an existing ID replaces its vector, content and postings"""
+        vectors = unit_vectors(20)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        replacement = unit_vectors(1, seed=1)[0]
+        await provider.upsert_vectors("kb", [{
+            "id": "v3", "values": replacement, "content": "new", "metadata": {"group": 9}
+        }])
+
+        results = await provider.search("kb", replacement, limit=1)
+        assert (results[0].id, results[0].content) == ("v3", "new")
+        moved = await provider.search("kb", replacement, limit=5, filter={"group": 9})
+        assert [r.id for r in moved] == ["v3"]
+        previous = await provider.search("kb", replacement, limit=20, filter={"group": 0})
+        assert "v3" not in {r.id for r in previous}
+        assert await provider.get_collection_count("kb") == 20
+
+    async def test_upsert_duplicate_ids_keep_last(self, provider):
+        """An ID repeated within one batch is stored once, with its last record"""
+        vectors = unit_vectors(3)
+        await provider.upsert_vectors("kb", [
+            {"id": "dup", "values": vectors[0], "content": "first", "metadata": {"group": 0}},
+            {"id": "other", "values": vectors[1], "content": "other", "metadata": {"group": 0}},
+            {"id": "dup", "values": vectors[2], "content": "last", "metadata": {"group": 1}},
+        ])
+
+        collection = provider.collections["kb"]
+        assert collection.index.ntotal == len(collection.records) == 2
+        results = await provider.search("kb", vectors[2], limit=5)
+        assert [(r.id, r.content) for r in results] == [("dup", "last"), ("other", "other")]
+        first_group = await provider.search("kb", vectors[0], limit=5, filter={"group": 0})
+        assert [r.id for r in first_group] == ["other"]
+
+    async def test_update_metadata_moves_postings(self, provider):
+        """Metadata patches are merged and reflected in filters"""
+        vectors = unit_vectors(10)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        await provider.update_metadata("kb", "v1", {"tag_even": True, "tag_new": True})
+
+        matched = await provider.search("kb", vectors[1], limit=10, filter={"tag_new": True})
+        assert [result.id for result in matched] == ["v1"]
+        assert matched[0].metadata["group"] == 1
+
+    async def test_compaction_after_deletes(self, provider):
+        """Deleting most vectors rebuilds the index without tombstones"""
+        vectors = unit_vectors(40)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        await provider.delete_vectors("kb", [f"v{i}" for i in range(30)])
+
+        collection = provider.collections["kb"]
+        assert collection.index.ntotal == len(collection.records) == 10
+        results = await provider.search("kb", vectors[35], limit=10)
+        assert results[0].id == "v35"
+        assert {result.id for result in results} == {f"v{i}" for i in range(30, 40)}
+
+    async def test_persisted_collection_reloads(self, provider, tmp_path):
+        """Saved collections load back with their records"""
+        vectors = unit_vectors(15)
+        await provider.upsert_vectors("kb", records(vectors))
+
+        reloaded = FaissProvider(str(tmp_path), dimension=DIMENSION)
+        await reloaded.initialize()
+
+        assert await reloaded.get_collection_count("kb") == 15
+        assert (await reloaded.search("kb", vectors[4], limit=1))[0].id == "v4"
+        assert not list(tmp_path.glob("*.tmp"))
+
+    async def test_save_keeps_one_published_version(self, provider, tmp_path):
+        """Each save publishes a new version and removes the one it replaced"""
+        vectors = unit_vectors(10)
+        await provider.upsert_vectors("kb", records(vectors[:5]))
+        await provider.upsert_vectors("kb", records(vectors[5:], prefix="w"))
+
+        manifest = json.loads((tmp_path / "kb.manifest.json").read_text())
+        assert manifest["version"] == 2
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+            ["kb.manifest.json", manifest["index"], manifest["records"]]
+        )
+
+    async def test_unpublished_version_is_ignored(self, provider, tmp_path):
+        """Files written without a manifest swap (a crashed save) are not loaded"""
+        vectors = unit_vectors(10)
+        await provider.upsert_vectors("kb", records(vectors[:5]))
+        (tmp_path / "kb.2.records.json").write_text("[]")
+
+        reloaded = FaissProvider(str(tmp_path), dimension=DIMENSION)
+        await reloaded.initialize()
+
+        assert await reloaded.get_collection_count("kb") == 5
+
+    async def test_mismatched_records_fail_to_load(self, provider, tmp_path):
+        """Records referencing labels beyond the index are rejected on load"""
+        await provider.upsert_vectors("kb", records(unit_vectors(3)))
+        manifest = json.loads((tmp_path / "kb.manifest.json").read_text())
+        (tmp_path / manifest["records"]).write_text(json.dumps([[7, "v7", "", {}]]))
+
+        reloaded = FaissProvider(str(tmp_path), dimension=DIMENSION)
+        with pytest.raises(ConnectionError, match="do not match"):
+            await reloaded.initialize()
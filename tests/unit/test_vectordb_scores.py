@@ -0,0 +1,35 @@
+"""Unit tests for ChromaDB distance to similarity conversion"""
+
+import numpy as np
+import pytest
+
+from knowledge_service.infrastructure.vectordb.chroma_local import similarity_scores
+
+
+@pytest.mark.unit
+class TestSimilarityScores:
+    """Test similarity_scores() for each HNSW space"""
+
+    def test_l2_distance_is_halved(self):
+        """Squared L2 between unit vectors is 2(1 - cosine)"""
+        scores = similarity_scores([0.0, 0.5, 2.0], "l2")
+        np.testing.assert_allclose(scores, [1.0, 0.75, 0.0])
+
+    @pytest.mark.parametrize("space", ["ip", "cosine"])
+    def test_ip_and_cosine_distance(self, space):
+        """Inner product and cosine distances are 1 - similarity"""
+        scores = similarity_scores([0.0, 0.25, 1.0], space)
+        np.testing.assert_allclose(scores, [1.0, 0.75, 0.0])
+
+    @pytest.mark.parametrize("space", ["l2", "ip"])
+    def test_scores_are_clipped(self, space):
+        """Opposite or rounding-error distances stay within 0-1"""
+        scores = similarity_scores([-1e-6, 4.0], space)
+        assert scores.min() >= 0.0
+        assert scores.max() <= 1.0
+
+    def test_empty_distances(self):
+        """No distances give an empty float array"""
+        scores = similarity_scores([], "ip")
+        assert scores.shape == (0,)
+        assert scores.dtype == np.float64